@@ -0,0 +1,111 @@
+"""Held-out accuracy and latency: keyword router vs. BM25 classifier.
+
+The utterances below are NOT taken from ROUTING_RULES keywords or skill
+trigger lists — they are paraphrases a user might actually type, so they
+measure generalization rather than recall of the training phrases.
+
+Usage:
+    python -m benchmarks.classifier_benchmark
+"""
+
+import statistics
+import time
+
+from src.classifiers import BM25Classifier
+from src.router import FoundryRouter, IntentCategory
+
+I = IntentCategory
+
+HELD_OUT: list[tuple[str, IntentCategory]] = [
+    # Inventory
+    ("how many boxes are left in the Osaka warehouse", I.INVENTORY_QUERY),
+    ("are we running out of pineapple cakes in LA", I.INVENTORY_QUERY),
+    ("東京倉庫還剩多少盒", I.INVENTORY_QUERY),
+    ("compare stock levels across regions", I.INVENTORY_QUERY),
+    ("台中門市倉的庫存量", I.INVENTORY_QUERY),
+    ("what's on hand at the New York warehouse", I.INVENTORY_QUERY),
+    # Knowledge
+    ("is there a document on supplier sync failures", I.KNOWLEDGE_SEARCH),
+    ("what does the troubleshooting guide say about sync", I.KNOWLEDGE_SEARCH),
+    ("找一下常見問題的解決方法", I.KNOWLEDGE_SEARCH),
+    ("look up the SOP for data sync issues", I.KNOWLEDGE_SEARCH),
+    ("historical issues similar to this one", I.KNOWLEDGE_SEARCH),
+    # Bug fix
+    ("the sync job keeps throwing exceptions, patch it", I.BUG_FIX),
+    ("open a pull request to fix the timeout", I.BUG_FIX),
+    ("修一下這個程式的錯誤", I.BUG_FIX),
+    ("analyze the code defect in the supplier API", I.BUG_FIX),
+    ("why does the deploy fail with an error", I.BUG_FIX),
+    # External search
+    ("is a snowstorm hitting New York this week", I.EXTERNAL_SEARCH),
+    ("any flight cancellations at LAX today", I.EXTERNAL_SEARCH),
+    ("東京今天的天氣如何", I.EXTERNAL_SEARCH),
+    ("latest news about the typhoon", I.EXTERNAL_SEARCH),
+    ("search the web for port strikes", I.EXTERNAL_SEARCH),
+    # Logistics
+    ("when will the air freight shipment arrive", I.LOGISTICS_TRACK),
+    ("where is the restock shipment right now", I.LOGISTICS_TRACK),
+    ("貨什麼時候到", I.LOGISTICS_TRACK),
+    ("track the sea freight container", I.LOGISTICS_TRACK),
+    ("estimated delivery date for the LA order", I.LOGISTICS_TRACK),
+    # System health
+    ("is the sync service healthy", I.SYSTEM_HEALTH),
+    ("show me CPU and memory usage for the app", I.SYSTEM_HEALTH),
+    ("服務有沒有告警", I.SYSTEM_HEALTH),
+    ("check Azure monitor for errors in the logs", I.SYSTEM_HEALTH),
+    ("any outages on our resources", I.SYSTEM_HEALTH),
+    # Incident report
+    ("write up what happened for management", I.INCIDENT_REPORT),
+    ("draft an incident summary", I.INCIDENT_REPORT),
+    ("幫我整理一份事件報告", I.INCIDENT_REPORT),
+    ("compile the findings into a report", I.INCIDENT_REPORT),
+    ("summarize the incident timeline", I.INCIDENT_REPORT),
+    # Meeting
+    ("set up a call with the US team tomorrow", I.MEETING_BOOKING),
+    ("find a free slot on everyone's calendar", I.MEETING_BOOKING),
+    ("幫我約明天開會", I.MEETING_BOOKING),
+    ("book a Teams meeting with the supplier", I.MEETING_BOOKING),
+    ("when is everyone available for a sync meeting", I.MEETING_BOOKING),
+]
+
+
+def _evaluate(name: str, classify, repeats: int = 200) -> dict:
+    correct = sum(1 for text, expected in HELD_OUT if classify(text)[0] == expected)
+
+    latencies: list[float] = []
+    for _ in range(repeats):
+        for text, _ in HELD_OUT:
+            start = time.perf_counter()
+            classify(text)
+            latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    return {
+        "classifier": name,
+        "accuracy": correct / len(HELD_OUT),
+        "mean_us": statistics.fmean(latencies) * 1e6,
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99)] * 1e6,
+    }
+
+
+def main():
+    keyword = FoundryRouter()
+    bm25 = BM25Classifier.from_rules()
+
+    results = [
+        _evaluate("keyword", keyword.classify_intent),
+        _evaluate("bm25", bm25.classify),
+    ]
+
+    print(f"\nHeld-out set: {len(HELD_OUT)} utterances")
+    print(f"  {'Classifier':<10} {'Accuracy':>9} {'mean µs':>9} {'p50 µs':>9} {'p99 µs':>9}")
+    for r in results:
+        print(
+            f"  {r['classifier']:<10} {r['accuracy']:>9.1%} {r['mean_us']:>9.1f} "
+            f"{r['p50_us']:>9.1f} {r['p99_us']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Reorder forecast time for a full catalog, as recomputed at each sync.
+
+Writes synthetic regional CSVs (see inventory_stream_benchmark), loads
+them into an InventoryStore, records --days daily snapshots into an
+in-memory InventoryHistory with every warehouse draining a few boxes a
+day, then times `forecast_inventory` over the whole store:
+
+- no history   → notes only; rates unknown
+- history      → consumption rates fitted over the last 7 days
+
+Usage:
+    python -m benchmarks.inventory_forecast_benchmark
+    python -m benchmarks.inventory_forecast_benchmark --rows 10000 100000 --repeats 5
+"""
+
+import argparse
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from benchmarks.inventory_stream_benchmark import write_synthetic_inventory
+from src.inventory_data import InventoryStore, load_inventory_regions
+from src.inventory_forecast import forecast_inventory
+from src.inventory_history import InventoryHistory
+
+DEFAULT_ROWS = (10_000, 100_000)
+
+
+def build_history(store: InventoryStore, days: int) -> InventoryHistory:
+    """In-memory history of `days` daily snapshots ending at the store's state."""
+    history = InventoryHistory()
+    records = store.records()
+    for day in range(days):
+        back = days - 1 - day
+        history.append([
+            replace(r, quantity=r.quantity + back * (1 + i % 7),
+                    last_updated=f"2026-01-{31 - back:02d}T08:00:00Z")
+            for i, r in enumerate(records)
+        ])
+    return history
+
+
+def time_forecast(store: InventoryStore, history: InventoryHistory | None, repeats: int) -> float:
+    """Best of `repeats` seconds for one `forecast_inventory` over `store`."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        forecast_inventory(store, history)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS))
+    parser.add_argument("--days", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"\n  {'Rows':>12} {'No history ms':>14} {'History ms':>11} {'Reorders':>9}")
+    for total_rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_dir = write_synthetic_inventory(Path(tmp), total_rows)
+            store = load_inventory_regions(csv_dir, use_snapshot=False).store
+        history = build_history(store, args.days)
+        bare = time_forecast(store, None, args.repeats)
+        fitted = time_forecast(store, history, args.repeats)
+        reorders = len(forecast_inventory(store, history).reorder_rows())
+        print(f"  {len(store):>12,} {bare * 1000:>14.1f} {fitted * 1000:>11.1f} {reorders:>9,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Inventory load time: binary mmap snapshot vs. parsing the CSV files.
+
+Writes synthetic regional CSVs (see inventory_stream_benchmark), converts
+them with `write_inventory_snapshot`, then times loading each into an
+InventoryStore and computing the region totals:
+
+- cold → a fresh interpreter, after asking the kernel to drop the files
+         from the page cache (posix_fadvise DONTNEED; best effort)
+- warm → best of --repeats loads in this process, files already cached
+
+Usage:
+    python -m benchmarks.inventory_snapshot_benchmark
+    python -m benchmarks.inventory_snapshot_benchmark --rows 100000 1000000 --repeats 3
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.inventory_stream_benchmark import write_synthetic_inventory
+from src.inventory_data import load_inventory_regions
+from src.inventory_snapshot import load_inventory_snapshot, write_inventory_snapshot
+
+DEFAULT_ROWS = (100_000, 1_000_000)
+
+
+def _drop_page_cache(paths) -> None:
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def load_once(mode: str, path: Path) -> float:
+    """Seconds to load `path` (CSV directory or snapshot) and total it by region."""
+    start = time.perf_counter()
+    if mode == "csv":
+        store = load_inventory_regions(path, use_snapshot=False).store
+    else:
+        store = load_inventory_snapshot(path)
+    store.region_totals()
+    return time.perf_counter() - start
+
+
+def measure_cold(mode: str, path: Path, files: list[Path]) -> float:
+    """`load_once` in a fresh interpreter with the files evicted from the page cache."""
+    _drop_page_cache(files)
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.inventory_snapshot_benchmark", "--child", mode, str(path)],
+        check=True, capture_output=True, text=True, cwd=Path(__file__).parent.parent,
+    )
+    return json.loads(out.stdout)["seconds"]
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps({"seconds": load_once(args.child[0], Path(args.child[1]))}))
+        return
+
+    print(f"\n  {'Rows':>12} {'Format':<9} {'MB':>7} {'Cold s':>8} {'Warm s':>8} {'Warm speedup':>13}")
+    for total_rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_dir = write_synthetic_inventory(Path(tmp) / "csv", total_rows)
+            snapshot = write_inventory_snapshot(csv_dir, Path(tmp) / "inventory.snapshot")
+            csv_files = sorted(csv_dir.iterdir())
+            results = {}
+            for mode, path, files in (("csv", csv_dir, csv_files), ("snapshot", snapshot, [snapshot])):
+                cold = measure_cold(mode, path, files)
+                warm = min(load_once(mode, path) for _ in range(args.repeats))
+                size_mb = sum(f.stat().st_size for f in files) / 2**20
+                results[mode] = (size_mb, cold, warm)
+            for mode, (size_mb, cold, warm) in results.items():
+                speedup = results["csv"][2] / warm if warm else 0
+                print(f"  {total_rows:>12,} {mode:<9} {size_mb:>7.1f} {cold:>8.3f} {warm:>8.3f} {speedup:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Peak memory of inventory ingestion: streaming fold vs. loading every row.
+
+Writes synthetic {tw,jp,us}_supplier_inventory.csv files of increasing
+size, then measures each ingestion path in a fresh subprocess so its peak
+RSS (ru_maxrss) is not polluted by earlier runs:
+
+- stream  → stream_inventory_summary (chunked fold into per-region aggregates)
+- eager   → load_inventory + detect_anomalies (every row becomes a record)
+
+The streaming path should stay flat as the files grow; the eager path
+grows with the row count and is skipped above --eager-max-rows.
+
+Usage:
+    python -m benchmarks.inventory_stream_benchmark
+    python -m benchmarks.inventory_stream_benchmark --rows 100000 1000000 10000000
+"""
+
+import argparse
+import csv
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.inventory_data import _CSV_FILES, detect_anomalies, load_inventory, stream_inventory_summary
+
+DEFAULT_ROWS = (100_000, 1_000_000, 10_000_000)
+ANOMALY_EVERY = 100_000  # one critical / low row per this many rows
+
+_HEADER = [
+    "product_id", "product_name", "region", "warehouse", "quantity",
+    "unit", "status", "last_updated", "reorder_point", "supplier",
+]
+_WAREHOUSES = ("Central", "North", "South", "East", "West")
+
+
+def write_synthetic_inventory(directory: Path, total_rows: int) -> Path:
+    """Write the three regional CSV files with `total_rows` rows between them."""
+    directory.mkdir(parents=True, exist_ok=True)
+    per_region = total_rows // len(_CSV_FILES)
+    for region, filename in _CSV_FILES.items():
+        with open(directory / filename, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            header = _HEADER + (["note"] if region == "US" else [])
+            writer.writerow(header)
+            writer.writerows(_rows(region, per_region, with_note=region == "US"))
+    return directory
+
+
+def _rows(region: str, count: int, with_note: bool):
+    for i in range(count):
+        if i % ANOMALY_EVERY == 1:
+            status, qty = ("critical", 5) if i % (2 * ANOMALY_EVERY) == 1 else ("low", 150)
+        else:
+            status, qty = "normal", 1000 + i % 500
+        row = [
+            f"P{i:08d}-{region}", "101 Pineapple Cake", region,
+            f"{region} {_WAREHOUSES[i % len(_WAREHOUSES)]} Warehouse", qty, "盒", status,
+            "2026-01-31T08:00:00Z", 100, f"{region} Supplier",
+        ]
+        if with_note:
+            row.append("restock ETA 2/1" if status != "normal" else "")
+        yield row
+
+
+def _child(mode: str, directory: Path) -> dict:
+    start = time.perf_counter()
+    if mode == "stream":
+        summary = stream_inventory_summary(directory)
+        rows, anomalies = summary.row_count, len(summary.anomalies)
+    else:
+        records = load_inventory(directory)
+        rows, anomalies = len(records), len(detect_anomalies(records))
+    return {
+        "mode": mode,
+        "rows": rows,
+        "anomalies": anomalies,
+        "seconds": round(time.perf_counter() - start, 3),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def measure(mode: str, directory: Path) -> dict:
+    """Run one ingestion path in a fresh interpreter and return its stats."""
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.inventory_stream_benchmark", "--child", mode, str(directory)],
+        check=True, capture_output=True, text=True, cwd=Path(__file__).parent.parent,
+    )
+    return json.loads(out.stdout)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS))
+    parser.add_argument("--eager-max-rows", type=int, default=1_000_000)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_child(args.child[0], Path(args.child[1]))))
+        return
+
+    print(f"\n  {'Rows':>12} {'CSV MB':>8} {'Mode':<7} {'Seconds':>8} {'Peak RSS MB':>12}")
+    for total_rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = write_synthetic_inventory(Path(tmp), total_rows)
+            csv_mb = sum(p.stat().st_size for p in directory.iterdir()) / 2**20
+            modes = ["stream"] + (["eager"] if total_rows <= args.eager_max_rows else [])
+            for mode in modes:
+                result = measure(mode, directory)
+                print(
+                    f"  {result['rows']:>12,} {csv_mb:>8.0f} {mode:<7} "
+                    f"{result['seconds']:>8.2f} {result['peak_rss_mb']:>12.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
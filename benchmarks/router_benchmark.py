@@ -0,0 +1,194 @@
+"""Routing latency / throughput benchmark with machine-readable output.
+
+Generates synthetic mixed Chinese / English utterances of several lengths
+and synthetic rule sets of several sizes (the 8 real ROUTING_RULES padded
+with generated rules), then measures per-call latency percentiles and
+calls per second for the public routing entry points:
+
+- route_intent     → FoundryRouter.route
+- explain_routing  → FoundryRouter.route_with_explanation
+- classify_intent  → FoundryRouter.classify_intent
+
+Results are emitted as JSON so runs can be diffed between releases.
+
+Usage:
+    python -m benchmarks.router_benchmark
+    python -m benchmarks.router_benchmark --scales 8 1000 --output bench.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+from src.router import ROUTING_RULES, FoundryRouter, RoutingRule
+
+DEFAULT_SCALES = (8, 100, 1_000, 10_000)
+DEFAULT_SIZES = (5, 20, 100)  # words per utterance
+
+_LATIN_FILLER = [
+    "please", "can", "you", "the", "for", "our", "today", "team", "about",
+    "help", "me", "with", "this", "urgent", "customer", "region", "status",
+]
+_CJK_FILLER = [
+    "請", "幫我", "一下", "今天", "我們", "客戶", "目前", "情況", "緊急",
+    "這個", "那邊", "多少", "什麼", "時候",
+]
+_CJK_CHARS = "的一是在不了有和人這中大為上個國我以要他時來用們生到作地於出就分對成會可主發年動同工也能下過子說產種面而方後多定行學法所民得經"
+
+
+def _synthetic_keyword(rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+    return "".join(rng.choice(_CJK_CHARS) for _ in range(rng.randint(2, 3)))
+
+
+def build_rules(n_rules: int, rng: random.Random) -> list[RoutingRule]:
+    """The real ROUTING_RULES padded with synthetic rules up to `n_rules`."""
+    rules = list(ROUTING_RULES[:n_rules])
+    while len(rules) < n_rules:
+        template = ROUTING_RULES[len(rules) % len(ROUTING_RULES)]
+        rules.append(RoutingRule(
+            intent=template.intent,
+            agent_name=template.agent_name,
+            keywords=[_synthetic_keyword(rng) for _ in range(rng.randint(8, 15))],
+            description=f"synthetic rule {len(rules)}",
+        ))
+    return rules
+
+
+def build_utterances(
+    rules: list[RoutingRule], n_words: int, count: int, rng: random.Random,
+) -> list[str]:
+    """Mixed CJK / Latin utterances; roughly one word in five is a keyword."""
+    keywords = [kw for rule in rules for kw in rule.keywords]
+    utterances = []
+    for _ in range(count):
+        words = []
+        for _ in range(n_words):
+            roll = rng.random()
+            if roll < 0.2:
+                words.append(rng.choice(keywords))
+            elif roll < 0.6:
+                words.append(rng.choice(_LATIN_FILLER))
+            else:
+                words.append(rng.choice(_CJK_FILLER))
+        utterances.append(" ".join(words))
+    return utterances
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def measure(func, utterances: list[str], iterations: int) -> dict:
+    """Time `func` once per utterance, `iterations` times over the set."""
+    perf = time.perf_counter_ns
+    latencies: list[int] = []
+    wall_start = perf()
+    for _ in range(iterations):
+        for text in utterances:
+            start = perf()
+            func(text)
+            latencies.append(perf() - start)
+    wall = (perf() - wall_start) / 1e9
+    latencies.sort()
+    return {
+        "calls": len(latencies),
+        "p50_us": _percentile(latencies, 50) / 1e3,
+        "p95_us": _percentile(latencies, 95) / 1e3,
+        "p99_us": _percentile(latencies, 99) / 1e3,
+        "calls_per_sec": len(latencies) / wall if wall else 0.0,
+    }
+
+
+def run_benchmark(
+    scales=DEFAULT_SCALES,
+    sizes=DEFAULT_SIZES,
+    utterances_per_size: int = 200,
+    iterations: int = 5,
+    seed: int = 0,
+) -> dict:
+    """Run every (rule scale × utterance size × entry point) combination.
+
+    Returns:
+        JSON-serializable dict with `meta` and a flat `results` list.
+    """
+    rng = random.Random(seed)
+    results = []
+    for n_rules in scales:
+        rules = build_rules(n_rules, rng)
+        started = time.perf_counter()
+        router = FoundryRouter(rules=rules)
+        build_ms = (time.perf_counter() - started) * 1e3
+
+        entry_points = {
+            "route_intent": router.route,
+            "explain_routing": router.route_with_explanation,
+            "classify_intent": router.classify_intent,
+        }
+        for n_words in sizes:
+            utterances = build_utterances(rules, n_words, utterances_per_size, rng)
+            for name, func in entry_points.items():
+                stats = measure(func, utterances, iterations)
+                results.append({
+                    "function": name,
+                    "rules": n_rules,
+                    "utterance_words": n_words,
+                    "index_build_ms": build_ms,
+                    **stats,
+                })
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": seed,
+            "iterations": iterations,
+            "utterances_per_size": utterances_per_size,
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--utterances", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        scales=args.scales,
+        sizes=args.sizes,
+        utterances_per_size=args.utterances,
+        iterations=args.iterations,
+        seed=args.seed,
+    )
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        for r in report["results"]:
+            print(
+                f"  {r['function']:<16} rules={r['rules']:<6} words={r['utterance_words']:<4} "
+                f"p50={r['p50_us']:8.1f}µs p99={r['p99_us']:8.1f}µs "
+                f"{r['calls_per_sec']:>10,.0f} calls/s"
+            )
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""SKILL.md parsing throughput: single-pass parser vs. the regex pipeline.
+
+The regex pipeline below is the parser `src/skills.py` used before the
+line-oriented state machine; it is kept here as the baseline. Documents
+are the real skills in .github/skills/ plus synthetic SKILL.md files
+whose response body is padded to 1MB and beyond, where the lazy DOTALL
+scans of the old pipeline dominate.
+
+Usage:
+    python -m benchmarks.skill_parser_benchmark
+    python -m benchmarks.skill_parser_benchmark --sizes-kb 64 1024 4096
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+import yaml
+
+from src.skills import parse_skill_markdown
+
+SKILLS_DIR = Path(__file__).parent.parent / ".github" / "skills"
+DEFAULT_SIZES_KB = (16, 1024, 4096)
+
+
+# ---------------------------------------------------------------------------
+# Baseline: the previous regex pipeline
+# ---------------------------------------------------------------------------
+
+def _legacy_frontmatter(content: str) -> dict:
+    match = re.search(r"---\n(.+?)\n---", content, re.DOTALL)
+    if match:
+        try:
+            return yaml.safe_load(match.group(1)) or {}
+        except yaml.YAMLError:
+            pass
+    return {}
+
+
+def _legacy_triggers(content: str) -> list[str]:
+    match = re.search(r"## (?:觸發條件|Triggers)\s*\n(.*?)(?=\n## |\Z)", content, re.DOTALL)
+    if not match:
+        return []
+    triggers = []
+    for line in match.group(1).split("\n"):
+        line = line.strip()
+        if line.startswith("- ") and line[2:].strip():
+            triggers.append(line[2:].strip())
+    return triggers
+
+
+def _legacy_response(content: str) -> str:
+    end = r"(?=\n## (?:使用的工具|Tools Used)|\n## (?:資料來源|Data Sources)|\Z)"
+    match = re.search(r"## (?:預設回應|Default Response)\s*\n.*?\n---\n(.*?)" + end, content, re.DOTALL)
+    if match:
+        return match.group(1).strip()
+    match = re.search(r"## (?:預設回應|Default Response)\s*\n(.*?)" + end, content, re.DOTALL)
+    return match.group(1).strip() if match else ""
+
+
+def legacy_parse(content: str) -> tuple[dict, list[str], str]:
+    """(frontmatter, triggers, response) as the regex pipeline produced them."""
+    clean = re.sub(r"^```+\w*\s*\n", "", content)
+    clean = re.sub(r"\n```+\s*$", "", clean)
+    return _legacy_frontmatter(content), _legacy_triggers(clean), _legacy_response(clean)
+
+
+def single_pass_parse(content: str) -> tuple[dict, list[str], str]:
+    parsed = parse_skill_markdown(content)
+    return parsed.frontmatter, parsed.triggers, parsed.response
+
+
+# ---------------------------------------------------------------------------
+# Documents
+# ---------------------------------------------------------------------------
+
+def build_document(target_bytes: int) -> str:
+    """A bilingual SKILL.md whose response body pads it to `target_bytes`."""
+    head = (
+        "```skill\n---\nname: synthetic-skill\n"
+        "description: Synthetic skill for parser benchmarking\n---\n\n"
+        "# Synthetic Skill\n\n## 觸發條件\n\n- 庫存\n- inventory\n- stock level\n\n"
+        "## 預設回應\n\n**情境:** benchmark\n\n---\n\n"
+    )
+    tail = "\n## Tools Used\n\n- `query_inventory`\n\n## Data Sources\n\n- data/inventory\n```\n"
+    row = "| 東京 | PC-001 | 鳳梨酥 | 1,200 | 🟢 正常 | inventory row |\n"
+    rows = max(1, (target_bytes - len(head.encode()) - len(tail.encode())) // len(row.encode()))
+    return head + row * rows + tail
+
+
+def load_documents(sizes_kb) -> dict[str, str]:
+    documents = {
+        f"{path.parent.name}": path.read_text(encoding="utf-8")
+        for path in sorted(SKILLS_DIR.glob("*/SKILL.md"))
+    }
+    for kb in sizes_kb:
+        documents[f"synthetic-{kb}KB"] = build_document(kb * 1024)
+    return documents
+
+
+def _time(func, content: str, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=list(DEFAULT_SIZES_KB))
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"\n  {'Document':<32} {'Size':>10} {'regex ms':>10} {'1-pass ms':>10} {'Speedup':>8}  Same")
+    for name, content in load_documents(args.sizes_kb).items():
+        same = legacy_parse(content) == single_pass_parse(content)
+        old = _time(legacy_parse, content, args.repeats)
+        new = _time(single_pass_parse, content, args.repeats)
+        size = len(content.encode("utf-8"))
+        print(
+            f"  {name:<32} {size:>10,} {old * 1e3:>10.2f} {new * 1e3:>10.2f} "
+            f"{old / new if new else 0:>7.1f}x  {'✅' if same else '❌'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -22,10 +22,11 @@ COLOR_RESET = "\033[0m"         # Reset
 from copilot import CopilotClient
 from copilot.generated.session_events import SessionEventType
 
-from src.skills import load_skills
-from src.tools import build_tools
+from src.skill_index import SkillIndex
+from src.skill_watcher import SkillDirectoryWatcher
+from src.tools import prewarm_skill
 from src.prompts import SYSTEM_MESSAGE
-from src.agents import AGENT_REGISTRY
+from src.agents import AGENT_REGISTRY, get_agent_by_demo_id
 
 
 # ============================================================================
@@ -33,6 +34,20 @@ from src.agents import AGENT_REGISTRY
 # ============================================================================
 CONFIG_DIR = Path(__file__).parent / "config"
 
+# Compiled skill cache — only changed SKILL.md files are re-parsed at startup
+SKILL_CACHE_DIR = Path(__file__).parent / ".cache" / "skills"
+
+# Skill folders are read concurrently (helps on network-mounted checkouts);
+# response bodies are only read when a tool is first invoked
+SKILL_LOAD_WORKERS = 8
+
+# Seconds between checks of .github/skills/ for added / edited / removed skills
+SKILL_WATCH_INTERVAL = 2.0
+
+# Answer prompts that are exactly a skill trigger (e.g. menu picks) straight
+# from the skill handler, without a model round-trip
+SKILL_SHORT_CIRCUIT = True
+
 
 def _load_json(filename: str):
     """Load a JSON config file from the config/ directory."""
@@ -136,14 +151,12 @@ def get_skill_prompt_by_number(skills, num: int) -> str | None:
     # === Logging: selected skill / agent / MCP ===
     print(f"\n{'═' * 50}")
     print(f"📋 [SKILL SELECTED] {skill.name}")
-    if skill.demo_id is not None:
-        for agent in AGENT_REGISTRY:
-            if skill.demo_id in agent.demo_ids:
-                print(f"🤖 [AGENT] {agent.display_name} ({agent.category.value})")
-                print(f"🔐 [PERMISSION] {agent.permission_icon} {agent.permission.value}")
-                mcp = agent.mcp_connector or "(direct access)"
-                print(f"🔌 [MCP]   {mcp}")
-                break
+    agent = get_agent_by_demo_id(skill.demo_id)
+    if agent is not None:
+        print(f"🤖 [AGENT] {agent.display_name} ({agent.category.value})")
+        print(f"🔐 [PERMISSION] {agent.permission_icon} {agent.permission.value}")
+        mcp = agent.mcp_connector or "(direct access)"
+        print(f"🔌 [MCP]   {mcp}")
     print(f"{'═' * 50}")
 
     # Use first trigger as sample prompt, or a generic query
@@ -152,12 +165,44 @@ def get_skill_prompt_by_number(skills, num: int) -> str | None:
     return f"Please execute {skill.name}"
 
 
+async def create_session(client, tools):
+    """Create a streaming Copilot session exposing `tools`."""
+    return await client.create_session({
+        "model": "gpt-4.1",
+        "streaming": True,
+        "tools": tools,
+        "system_message": {
+            "content": SYSTEM_MESSAGE,
+        },
+        "mcp_servers": {
+            "workiq": {
+                "type": "http",
+                "url": "https://workiq.microsoft.com/mcp/",
+                "tools": ["*"],
+            },
+            "github": {
+                "type": "http",
+                "url": "https://api.githubcopilot.com/mcp/",
+                "tools": ["*"],
+            },
+        },
+    })
+
+
 async def run_console():
     """Main console loop."""
     # Load skills
     print("\nLoading skills...")
-    skills = load_skills()
-    tools = build_tools(skills)
+    watcher = SkillDirectoryWatcher(
+        interval=SKILL_WATCH_INTERVAL,
+        lazy=True,
+        cache_dir=SKILL_CACHE_DIR,
+        workers=SKILL_LOAD_WORKERS,
+    ).start()
+    skills_version, skills, tools = watcher.snapshot()
+    skill_index = SkillIndex(skills)
+    for skill in skills:
+        print(f"  Loaded skill: {skill.name} ({len(skill.triggers)} triggers)")
     print(f"✓ Loaded {len(tools)} skills\n")
 
     # Log agent registry
@@ -197,26 +242,7 @@ async def run_console():
     client = CopilotClient()
     await client.start()
 
-    session = await client.create_session({
-        "model": "gpt-4.1",
-        "streaming": True,
-        "tools": tools,
-        "system_message": {
-            "content": SYSTEM_MESSAGE,
-        },
-        "mcp_servers": {
-            "workiq": {
-                "type": "http",
-                "url": "https://workiq.microsoft.com/mcp/",
-                "tools": ["*"],
-            },
-            "github": {
-                "type": "http",
-                "url": "https://api.githubcopilot.com/mcp/",
-                "tools": ["*"],
-            },
-        },
-    })
+    session = await create_session(client, tools)
     print("✓ Copilot connected successfully\n")
 
     # Show initial menu
@@ -289,6 +315,32 @@ async def run_console():
                 print(f"   ⚠️ Invalid skill number: {num}")
                 continue
 
+        # Skills edited on disk: hand the rebuilt tools to a new session
+        if watcher.version != skills_version:
+            skills_version, skills, tools = watcher.snapshot()
+            skill_index = SkillIndex(skills)
+            print(f"   🔄 [SKILLS] Skill files changed — new session with {len(tools)} tools")
+            try:
+                await session.destroy()
+            except Exception:
+                pass
+            session = await create_session(client, tools)
+
+        # Local pre-match on skill triggers
+        exact = skill_index.exact_match(prompt) if SKILL_SHORT_CIRCUIT else None
+        tool = next((t for t in tools if exact and t.name == exact.name), None)
+        if tool is not None:
+            print(f"\n{COLOR_DIM}{'─' * 50}{COLOR_RESET}")
+            print(f"   🎯 [PRE-MATCH] '{prompt}' → {tool.name} (answered locally)")
+            result = await tool.handler({"query": prompt})
+            print(f"{COLOR_ASSISTANT}🍍 Zava >{COLOR_RESET} {result['textResultForLlm']}")
+            print(f"\n{COLOR_DIM}{'─' * 50}{COLOR_RESET}\n")
+            continue
+        matched = skill_index.unique_match(prompt)
+        if matched is not None:
+            print(f"   🎯 [PRE-MATCH] {matched.name} — pre-warming handler")
+            asyncio.get_running_loop().run_in_executor(None, prewarm_skill, matched)
+
         # Send to Copilot and stream response
         print(f"\n{COLOR_DIM}{'─' * 50}{COLOR_RESET}")
         print(f"{COLOR_ASSISTANT}🍍 Zava >{COLOR_RESET} ", end="", flush=True)
@@ -333,6 +385,7 @@ async def run_console():
 
     # Cleanup
     print("Closing connection...")
+    watcher.stop()
     try:
         await session.destroy()
     except Exception:
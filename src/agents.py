@@ -4,6 +4,7 @@ Defines the 6 specialized agents with their permission levels,
 accessible resources, and corresponding MCP connectors.
 """
 
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -24,43 +25,117 @@ class AgentCategory(Enum):
     GITHUB = "github"        # 🛠️ GitHub Agent
 
 
-@dataclass
+_PERMISSION_ICONS = {
+    PermissionLevel.LOW: "🟢",
+    PermissionLevel.MEDIUM: "🟡",
+    PermissionLevel.HIGH: "🔴",
+}
+
+_CATEGORY_ICONS = {
+    AgentCategory.DATA: "📊",
+    AgentCategory.KNOWLEDGE: "📚",
+    AgentCategory.EXTERNAL: "🌐",
+    AgentCategory.OPS: "⚙️",
+    AgentCategory.GITHUB: "🛠️",
+}
+
+# Permission hierarchy: HIGH > MEDIUM > LOW
+PERMISSION_RANK = {
+    PermissionLevel.LOW: 0,
+    PermissionLevel.MEDIUM: 1,
+    PermissionLevel.HIGH: 2,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class AgentDefinition:
-    """Definition of a specialized agent within the Zava ecosystem."""
+    """Definition of a specialized agent within the Zava ecosystem.
+
+    Immutable; list arguments are stored as tuples. Icons and the
+    integer permission rank are computed once at construction.
+    """
     name: str
     display_name: str
     category: AgentCategory
     permission: PermissionLevel
     description: str
-    accessible_resources: list[str] = field(default_factory=list)
+    accessible_resources: tuple[str, ...] = ()
     mcp_connector: str | None = None
-    demo_ids: list[int] = field(default_factory=list)
-
-    @property
-    def permission_icon(self) -> str:
-        icons = {
-            PermissionLevel.LOW: "🟢",
-            PermissionLevel.MEDIUM: "🟡",
-            PermissionLevel.HIGH: "🔴",
-        }
-        return icons[self.permission]
-
-    @property
-    def category_icon(self) -> str:
-        icons = {
-            AgentCategory.DATA: "📊",
-            AgentCategory.KNOWLEDGE: "📚",
-            AgentCategory.EXTERNAL: "🌐",
-            AgentCategory.OPS: "⚙️",
-            AgentCategory.GITHUB: "🛠️",
-        }
-        return icons[self.category]
+    demo_ids: tuple[int, ...] = ()
+    permission_icon: str = field(init=False, repr=False, compare=False)
+    category_icon: str = field(init=False, repr=False, compare=False)
+    permission_rank: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "accessible_resources", tuple(self.accessible_resources))
+        object.__setattr__(self, "demo_ids", tuple(self.demo_ids))
+        object.__setattr__(self, "permission_icon", _PERMISSION_ICONS[self.permission])
+        object.__setattr__(self, "category_icon", _CATEGORY_ICONS[self.category])
+        object.__setattr__(self, "permission_rank", PERMISSION_RANK[self.permission])
+
+
+class AgentRegistry(Sequence[AgentDefinition]):
+    """Ordered collection of agents with O(1) lookup indexes.
+
+    Behaves like the plain list it replaces (iteration order, `len`,
+    indexing) and additionally keeps indexes by name, category,
+    permission level and demo id that are updated on `register`.
+    """
+
+    def __init__(self, agents: Iterable[AgentDefinition] = ()):
+        self._agents: list[AgentDefinition] = []
+        self._by_name: dict[str, AgentDefinition] = {}
+        self._by_category: dict[AgentCategory, list[AgentDefinition]] = {}
+        self._by_permission: dict[PermissionLevel, list[AgentDefinition]] = {}
+        self._by_demo_id: dict[int, AgentDefinition] = {}
+        for agent in agents:
+            self.register(agent)
+
+    def register(self, agent: AgentDefinition) -> None:
+        """Add an agent and index it.
+
+        Raises:
+            ValueError: If an agent with the same name is already registered.
+        """
+        if agent.name in self._by_name:
+            raise ValueError(f"Agent '{agent.name}' is already registered")
+        self._agents.append(agent)
+        self._by_name[agent.name] = agent
+        self._by_category.setdefault(agent.category, []).append(agent)
+        self._by_permission.setdefault(agent.permission, []).append(agent)
+        for demo_id in agent.demo_ids:
+            # First registered agent wins, as with the previous linear scan
+            self._by_demo_id.setdefault(demo_id, agent)
+
+    def get(self, name: str) -> AgentDefinition | None:
+        return self._by_name.get(name)
+
+    def by_category(self, category: AgentCategory) -> list[AgentDefinition]:
+        return list(self._by_category.get(category, ()))
+
+    def by_permission(self, permission: PermissionLevel) -> list[AgentDefinition]:
+        return list(self._by_permission.get(permission, ()))
+
+    def by_demo_id(self, demo_id: int | None) -> AgentDefinition | None:
+        return self._by_demo_id.get(demo_id)
+
+    def __getitem__(self, index):
+        return self._agents[index]
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def __iter__(self) -> Iterator[AgentDefinition]:
+        return iter(self._agents)
+
+    def __contains__(self, agent) -> bool:
+        return isinstance(agent, AgentDefinition) and self._by_name.get(agent.name) == agent
 
 
 # ---------------------------------------------------------------------------
 # Agent Registry — all 7 agents in the system
 # ---------------------------------------------------------------------------
-AGENT_REGISTRY: list[AgentDefinition] = [
+AGENT_REGISTRY: AgentRegistry = AgentRegistry([
     AgentDefinition(
         name="inventory-agent",
         display_name="Inventory Agent",
@@ -131,25 +206,27 @@ AGENT_REGISTRY: list[AgentDefinition] = [
         mcp_connector="workiq-mcp",
         demo_ids=[7, 8],
     ),
-]
+])
 
 
 def get_agent(name: str) -> AgentDefinition | None:
     """Look up an agent by name."""
-    for agent in AGENT_REGISTRY:
-        if agent.name == name:
-            return agent
-    return None
+    return AGENT_REGISTRY.get(name)
 
 
 def get_agents_by_category(category: AgentCategory) -> list[AgentDefinition]:
     """Get all agents in a category."""
-    return [a for a in AGENT_REGISTRY if a.category == category]
+    return AGENT_REGISTRY.by_category(category)
 
 
 def get_agents_by_permission(permission: PermissionLevel) -> list[AgentDefinition]:
     """Get all agents with a specific permission level."""
-    return [a for a in AGENT_REGISTRY if a.permission == permission]
+    return AGENT_REGISTRY.by_permission(permission)
+
+
+def get_agent_by_demo_id(demo_id: int | None) -> AgentDefinition | None:
+    """Get the agent that serves a demo / skill folder number."""
+    return AGENT_REGISTRY.by_demo_id(demo_id)
 
 
 def check_permission(agent_name: str, required_level: PermissionLevel) -> bool:
@@ -158,16 +235,10 @@ def check_permission(agent_name: str, required_level: PermissionLevel) -> bool:
     Returns True if the agent's permission level is >= required level.
     Permission hierarchy: HIGH > MEDIUM > LOW
     """
-    agent = get_agent(agent_name)
+    agent = AGENT_REGISTRY.get(agent_name)
     if not agent:
         return False
-
-    hierarchy = {
-        PermissionLevel.LOW: 0,
-        PermissionLevel.MEDIUM: 1,
-        PermissionLevel.HIGH: 2,
-    }
-    return hierarchy[agent.permission] >= hierarchy[required_level]
+    return agent.permission_rank >= PERMISSION_RANK[required_level]
 
 
 def print_agent_registry():
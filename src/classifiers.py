@@ -0,0 +1,121 @@
+"""Statistical intent classifiers usable as FoundryRouter backends.
+
+`BM25Classifier` treats each intent as one "document" made of its
+routing keywords plus the trigger phrases of the matching skills in
+.github/skills/, and ranks intents for a query with Okapi BM25. All
+term weights are precomputed at training time, so classifying a message
+is a tokenize + a handful of dict lookups.
+"""
+
+import math
+from collections import Counter
+from collections.abc import Iterable
+
+from src.router import ROUTING_RULES, IntentCategory, RoutingRule
+from src.skills import Skill, load_skills
+from src.text_utils import tokenize
+
+
+# Skill demo_id → intent it serves (demo folders are numbered 1-8)
+DEMO_INTENTS: dict[int, IntentCategory] = {
+    1: IntentCategory.INVENTORY_QUERY,
+    2: IntentCategory.KNOWLEDGE_SEARCH,
+    3: IntentCategory.BUG_FIX,
+    4: IntentCategory.EXTERNAL_SEARCH,
+    5: IntentCategory.LOGISTICS_TRACK,
+    6: IntentCategory.SYSTEM_HEALTH,
+    7: IntentCategory.INCIDENT_REPORT,
+    8: IntentCategory.MEETING_BOOKING,
+}
+
+
+class BM25Classifier:
+    """Okapi BM25 ranking of intents over a sparse term index.
+
+    Args:
+        documents: Training text per intent (keywords, trigger phrases).
+        k1: Term-frequency saturation.
+        b: Document-length normalization.
+        min_score: Best scores below this classify as UNKNOWN.
+    """
+
+    def __init__(
+        self,
+        documents: dict[IntentCategory, list[str]],
+        k1: float = 1.2,
+        b: float = 0.75,
+        min_score: float = 0.5,
+    ):
+        self.intents: tuple[IntentCategory, ...] = tuple(documents)
+        self.min_score = min_score
+
+        term_freqs = [
+            Counter(tok for text in texts for tok in tokenize(text))
+            for texts in documents.values()
+        ]
+        lengths = [sum(tf.values()) for tf in term_freqs]
+        avg_len = (sum(lengths) / len(lengths)) if lengths else 0.0
+        doc_freq = Counter(tok for tf in term_freqs for tok in tf)
+        n_docs = len(term_freqs)
+
+        # Posting lists: token → ((intent index, precomputed BM25 weight), ...)
+        postings: dict[str, list[tuple[int, float]]] = {}
+        for idx, (tf, length) in enumerate(zip(term_freqs, lengths)):
+            norm = k1 * (1 - b + b * length / avg_len) if avg_len else k1
+            for tok, freq in tf.items():
+                idf = math.log((n_docs - doc_freq[tok] + 0.5) / (doc_freq[tok] + 0.5) + 1)
+                postings.setdefault(tok, []).append(
+                    (idx, idf * freq * (k1 + 1) / (freq + norm))
+                )
+        self._postings = {tok: tuple(p) for tok, p in postings.items()}
+
+    @classmethod
+    def from_rules(
+        cls,
+        rules: Iterable[RoutingRule] | None = None,
+        skills: Iterable[Skill] | None = None,
+        **kwargs,
+    ) -> "BM25Classifier":
+        """Train from routing keywords plus skill trigger phrases.
+
+        Args:
+            rules: Routing rules (defaults to ROUTING_RULES).
+            skills: Loaded skills (defaults to `load_skills()`); each
+                    skill's triggers go to the intent in DEMO_INTENTS.
+        """
+        if rules is None:
+            rules = ROUTING_RULES
+        if skills is None:
+            skills = load_skills()
+
+        documents: dict[IntentCategory, list[str]] = {}
+        for rule in rules:
+            documents.setdefault(rule.intent, []).extend(rule.keywords)
+        for skill in skills:
+            intent = DEMO_INTENTS.get(skill.demo_id)
+            if intent is not None:
+                documents.setdefault(intent, []).extend(skill.triggers)
+        return cls(documents, **kwargs)
+
+    def scores(self, user_input: str) -> dict[IntentCategory, float]:
+        """BM25 score per intent (only intents with a positive score)."""
+        totals: dict[int, float] = {}
+        postings = self._postings
+        for tok in set(tokenize(user_input)):
+            for idx, weight in postings.get(tok, ()):
+                totals[idx] = totals.get(idx, 0.0) + weight
+        return {self.intents[idx]: score for idx, score in sorted(totals.items())}
+
+    def classify(self, user_input: str) -> tuple[IntentCategory, float]:
+        """Return (best intent, confidence 0-1).
+
+        Confidence is the best intent's share of the total score mass, so
+        a query that clearly favours one intent scores close to 1.
+        """
+        scores = self.scores(user_input)
+        if not scores:
+            return IntentCategory.UNKNOWN, 0.0
+        best = max(scores, key=lambda k: scores[k])
+        if scores[best] < self.min_score:
+            return IntentCategory.UNKNOWN, 0.0
+        return best, scores[best] / sum(scores.values())
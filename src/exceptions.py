@@ -16,6 +16,20 @@ class SkillLoadError(ZavaError):
         self.reason = reason
         super().__init__(f"Failed to load skill '{skill_path}': {reason}")
 
+    def __reduce__(self):
+        # Rebuild from the original arguments when crossing process pools
+        return type(self), (self.skill_path, self.reason)
+
+
+class InventoryLoadError(ZavaError):
+    """Raised when a regional inventory CSV file cannot be parsed."""
+
+    def __init__(self, region: str, csv_path: str, reason: str):
+        self.region = region
+        self.csv_path = csv_path
+        self.reason = reason
+        super().__init__(f"Failed to load {region} inventory '{csv_path}': {reason}")
+
 
 class RoutingError(ZavaError):
     """Raised when intent routing encounters an unexpected state."""
@@ -28,6 +42,15 @@ class RoutingError(ZavaError):
         )
 
 
+class RoutingRulesError(ZavaError):
+    """Raised when an external routing rules file cannot be loaded."""
+
+    def __init__(self, rules_path: str, reason: str):
+        self.rules_path = rules_path
+        self.reason = reason
+        super().__init__(f"Invalid routing rules file '{rules_path}': {reason}")
+
+
 class PermissionError(ZavaError):
     """Raised when an agent lacks required permissions."""
 
@@ -7,9 +7,25 @@ Ported from ref/02_inventory_agent.py's embedded INVENTORY_DATA and
 anomaly detection logic.
 """
 
+import bisect
 import csv
+import re
+import threading
+import time
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.exceptions import InventoryLoadError
+
+if TYPE_CHECKING:
+    # Both import this module
+    from src.inventory_forecast import InventoryForecast
+    from src.inventory_history import InventoryHistory
 
 
 # ---------------------------------------------------------------------------
@@ -23,6 +39,10 @@ STATUS_ICONS = {
     "out_of_stock": "❌ Out of Stock",
 }
 
+# Status severity, worst first; status codes in InventoryStore follow this order
+STATUS_PRIORITY = ("out_of_stock", "critical", "low", "normal")
+ANOMALY_STATUSES = STATUS_PRIORITY[:3]
+
 REGION_FLAGS = {
     "TW": "🇹🇼 Taiwan",
     "JP": "🇯🇵 Japan",
@@ -62,16 +82,306 @@ class RegionSummary:
     region: str
     total_qty: int = 0
     records: list[InventoryRecord] = field(default_factory=list)
+    # Filled by streaming ingestion, which keeps counts instead of records
+    row_count: int = 0
+    status_counts: dict[str, int] = field(default_factory=dict)
 
     @property
     def worst_status(self) -> str:
-        priority = ["out_of_stock", "critical", "low", "normal"]
-        for s in priority:
-            if any(r.status == s for r in self.records):
+        statuses = self.status_counts or {r.status for r in self.records}
+        for s in STATUS_PRIORITY:
+            if s in statuses:
                 return s
         return "normal"
 
 
+# ---------------------------------------------------------------------------
+# Columnar store
+# ---------------------------------------------------------------------------
+
+class StringTable:
+    """Interned strings: each distinct value is stored once, rows hold codes."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+        for value in values:
+            self.intern(value)
+
+    @classmethod
+    def from_values(cls, values: list[str]) -> "StringTable":
+        """Table over already-distinct `values`, coded by position."""
+        table = cls()
+        table.values = values
+        table._codes = dict(zip(values, range(len(values))))
+        return table
+
+    def intern(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def code(self, value: str) -> int | None:
+        """Code of `value`, or None if it was never interned."""
+        return self._codes.get(value)
+
+    def __getitem__(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+_CSV_COLUMNS = (
+    "product_id", "product_name", "region", "warehouse", "quantity",
+    "unit", "status", "last_updated", "reorder_point", "supplier",
+)
+
+
+def _csv_columns(header: list[str]) -> tuple:
+    """Positions of the CSV columns in `header`; the trailing `note` one may be None."""
+    col = {name: idx for idx, name in enumerate(header)}
+    return (*(col[c] for c in _CSV_COLUMNS), col.get("note"))
+
+
+# Text columns, each stored as codes into its own StringTable
+TEXT_COLUMNS = (
+    "product_id", "product_name", "region", "warehouse", "unit",
+    "status", "last_updated", "supplier", "note",
+)
+_STATUS_NORMAL = STATUS_PRIORITY.index("normal")
+
+
+class InventoryStore:
+    """Column-oriented inventory: typed arrays instead of one object per row.
+
+    Quantities and reorder points live in `array('q')` columns. Every
+    text column is a code column into a StringTable, so a warehouse or
+    supplier name repeated on a million rows is stored once. Status codes
+    follow STATUS_PRIORITY (worst first) and fit in one byte, which turns
+    "worst status" into `min()` over a slice and anomaly scans into
+    `bytes.find`. InventoryRecord objects are only built on demand via
+    `row()` / `records()`.
+
+    Row indexes are positions in insertion order, or in the order set by
+    `sort()`; region-level operations work on either.
+    """
+
+    def __init__(self):
+        self.tables: dict[str, StringTable] = {name: StringTable() for name in TEXT_COLUMNS}
+        self.tables["status"] = StringTable(STATUS_PRIORITY)
+        self.tables["note"] = StringTable([""])
+        self.codes: dict[str, array] = {name: array("I") for name in TEXT_COLUMNS}
+        self.codes["status"] = array("B")
+        self.quantity = array("q")
+        self.reorder_point = array("q")
+        self._groups: dict[str, Sequence[int]] | None = None
+        self._index: "InventoryIndex | None" = None
+
+    # -- building -----------------------------------------------------------
+
+    def append(
+        self,
+        product_id: str,
+        product_name: str,
+        region: str,
+        warehouse: str,
+        quantity: int,
+        unit: str,
+        status: str,
+        last_updated: str,
+        reorder_point: int,
+        supplier: str,
+        note: str = "",
+    ) -> None:
+        """Append one row."""
+        status_code = self.tables["status"].intern(status)
+        if status_code > 255:
+            raise ValueError(f"Too many distinct status values (adding {status!r})")
+        tables, codes = self.tables, self.codes
+        codes["product_id"].append(tables["product_id"].intern(product_id))
+        codes["product_name"].append(tables["product_name"].intern(product_name))
+        codes["region"].append(tables["region"].intern(region))
+        codes["warehouse"].append(tables["warehouse"].intern(warehouse))
+        codes["unit"].append(tables["unit"].intern(unit))
+        codes["status"].append(status_code)
+        codes["last_updated"].append(tables["last_updated"].intern(last_updated))
+        codes["supplier"].append(tables["supplier"].intern(supplier))
+        codes["note"].append(tables["note"].intern(note or ""))
+        self.quantity.append(quantity)
+        self.reorder_point.append(reorder_point)
+        self._groups = self._index = None
+
+    def extend_csv(self, rows: Iterable[list[str]], header: list[str]) -> int:
+        """Append rows from `csv.reader` output; returns the row count."""
+        (pid, name, region, warehouse, qty, unit, status, updated, reorder, supplier,
+         note_idx) = _csv_columns(header)
+        append = self.append
+        count = 0
+        for row in rows:
+            if not row:
+                continue
+            append(
+                row[pid], row[name], row[region], row[warehouse], int(row[qty]), row[unit],
+                row[status], row[updated], int(row[reorder]), row[supplier],
+                row[note_idx] if note_idx is not None and note_idx < len(row) else "",
+            )
+            count += 1
+        return count
+
+    @classmethod
+    def from_records(cls, records: Iterable[InventoryRecord]) -> "InventoryStore":
+        store = cls()
+        for r in records:
+            store.append(r.product_id, r.product_name, r.region, r.warehouse, r.quantity,
+                         r.unit, r.status, r.last_updated, r.reorder_point, r.supplier, r.note)
+        return store
+
+    @classmethod
+    def from_columns(
+        cls,
+        tables: dict[str, StringTable],
+        codes: dict[str, Sequence[int]],
+        quantity: Sequence[int],
+        reorder_point: Sequence[int],
+        region_rows: dict[str, Sequence[int]] | None = None,
+    ) -> "InventoryStore":
+        """Wrap existing columns without copying them.
+
+        Columns may be read-only memoryviews (see src/inventory_snapshot.py);
+        such a store can be queried and rendered but not appended to or
+        sorted, so pass `region_rows` for it.
+        """
+        store = cls()
+        store.tables, store.codes = tables, codes
+        store.quantity, store.reorder_point = quantity, reorder_point
+        store._groups = region_rows
+        return store
+
+    def extend_store(self, other: "InventoryStore") -> None:
+        """Append all rows of `other`, re-coding its strings into this store's tables."""
+        for name, column in other.codes.items():
+            recode = [self.tables[name].intern(value) for value in other.tables[name].values]
+            self.codes[name].extend(map(recode.__getitem__, column))
+        if len(self.tables["status"]) > 256:
+            raise ValueError("Too many distinct status values")
+        self.quantity.extend(other.quantity)
+        self.reorder_point.extend(other.reorder_point)
+        self._groups = self._index = None
+
+    def sort(self) -> None:
+        """Reorder rows by (region, product_id)."""
+        regions, rcodes = self.tables["region"].values, self.codes["region"]
+        pids, pcodes = self.tables["product_id"].values, self.codes["product_id"]
+        order = sorted(range(len(self)), key=lambda i: (regions[rcodes[i]], pids[pcodes[i]]))
+        for name, column in self.codes.items():
+            self.codes[name] = array(column.typecode, map(column.__getitem__, order))
+        self.quantity = array("q", map(self.quantity.__getitem__, order))
+        self.reorder_point = array("q", map(self.reorder_point.__getitem__, order))
+        self._groups = self._index = None
+
+    # -- row access ---------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.quantity)
+
+    def value(self, column: str, i: int) -> str:
+        """Text value of `column` at row `i`."""
+        return self.tables[column].values[self.codes[column][i]]
+
+    def row(self, i: int) -> InventoryRecord:
+        """Materialize row `i` as an InventoryRecord."""
+        return InventoryRecord(
+            product_id=self.value("product_id", i),
+            product_name=self.value("product_name", i),
+            region=self.value("region", i),
+            warehouse=self.value("warehouse", i),
+            quantity=self.quantity[i],
+            unit=self.value("unit", i),
+            status=self.value("status", i),
+            last_updated=self.value("last_updated", i),
+            reorder_point=self.reorder_point[i],
+            supplier=self.value("supplier", i),
+            note=self.value("note", i),
+        )
+
+    def __iter__(self) -> Iterator[InventoryRecord]:
+        return (self.row(i) for i in range(len(self)))
+
+    def records(self) -> list[InventoryRecord]:
+        return list(self)
+
+    # -- column operations --------------------------------------------------
+
+    def region_rows(self) -> dict[str, Sequence[int]]:
+        """Row indexes per region, in first-seen region order.
+
+        Contiguous regions (always the case after `sort()`) come back as
+        ranges located with C-level `index` / `count` on the code column.
+        """
+        if self._groups is None:
+            codes, names = self.codes["region"], self.tables["region"]
+            groups: dict[str, Sequence[int]] = {}
+            for code in sorted(set(codes), key=codes.index):
+                first, count = codes.index(code), codes.count(code)
+                if codes[first:first + count].count(code) == count:
+                    groups[names[code]] = range(first, first + count)
+                else:
+                    groups[names[code]] = [i for i, c in enumerate(codes) if c == code]
+            self._groups = groups
+        return self._groups
+
+    def index(self) -> "InventoryIndex":
+        """Lookup indexes for `query()`, built on first use."""
+        if self._index is None:
+            self._index = InventoryIndex(self)
+        return self._index
+
+    def query(self, query: "InventoryQuery") -> list[int]:
+        """Row indexes matching every filter of `query`, in row order."""
+        return self.index().rows(query)
+
+    @staticmethod
+    def _take(column: array, rows: Sequence[int]) -> Sequence[int]:
+        if isinstance(rows, range):
+            return column[rows.start:rows.stop]
+        return [column[i] for i in rows]
+
+    def region_totals(self) -> dict[str, int]:
+        """Total quantity per region."""
+        return {region: sum(self._take(self.quantity, rows))
+                for region, rows in self.region_rows().items()}
+
+    def worst_status(self, region: str | None = None) -> str:
+        """Most severe status overall, or within one region."""
+        codes = self.codes["status"]
+        if region is not None:
+            codes = self._take(codes, self.region_rows().get(region, range(0)))
+        worst = min(codes) if len(codes) else _STATUS_NORMAL
+        # Statuses outside STATUS_PRIORITY rank like "normal"
+        return STATUS_PRIORITY[min(worst, _STATUS_NORMAL)]
+
+    def rows_with_status(self, *statuses: str) -> list[int]:
+        """Row indexes whose status is one of `statuses`, in row order."""
+        data = self.codes["status"].tobytes()
+        found: list[int] = []
+        for status in statuses:
+            code = self.tables["status"].code(status)
+            if code is None:
+                continue
+            needle = bytes((code,))
+            i = data.find(needle)
+            while i != -1:
+                found.append(i)
+                i = data.find(needle, i + 1)
+        found.sort()
+        return found
+
+
 # ---------------------------------------------------------------------------
 # CSV loading
 # ---------------------------------------------------------------------------
@@ -87,54 +397,146 @@ def _data_dir() -> Path:
     return Path(__file__).parent.parent / "data" / "inventory"
 
 
-def load_inventory(data_dir: Path | None = None) -> list[InventoryRecord]:
-    """Load all inventory records from CSV files.
+def inventory_csv_paths(data_dir: Path | None = None) -> dict[str, Path]:
+    """Region code → path of its CSV file (which may not exist)."""
+    base = data_dir or _data_dir()
+    return {region: base / filename for region, filename in _CSV_FILES.items()}
+
+
+@dataclass
+class InventoryLoadReport:
+    """Outcome of loading the regional CSV files.
+
+    Attributes:
+        store: Rows of every region that loaded, sorted by region then
+               product_id.
+        timings: Seconds spent reading + parsing, per region code.
+        errors: One InventoryLoadError per region file that could not be
+                loaded; its rows are left out of `store`.
+        elapsed: Wall-clock seconds for the whole load.
+    """
+    store: InventoryStore = field(default_factory=InventoryStore)
+    timings: dict[str, float] = field(default_factory=dict)
+    errors: list[InventoryLoadError] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+def _load_region(region: str, csv_path: Path) -> tuple[InventoryStore, float]:
+    """Parse one regional CSV into its own store; any bad row fails the region."""
+    start = time.perf_counter()
+    store = InventoryStore()
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header:
+            try:
+                store.extend_csv(reader, header)
+            except KeyError as e:
+                raise InventoryLoadError(region, str(csv_path), f"missing column {e}") from e
+            except (ValueError, IndexError) as e:
+                raise InventoryLoadError(
+                    region, str(csv_path), f"line {reader.line_num}: {e}"
+                ) from e
+    return store, time.perf_counter() - start
+
+
+def load_inventory_regions(
+    data_dir: Path | None = None,
+    workers: int | None = None,
+    use_snapshot: bool = True,
+) -> InventoryLoadReport:
+    """Load the regional CSV files concurrently, isolating failures per region.
+
+    Each file is parsed and validated into its own store on a thread
+    pool; a malformed file is reported in `errors` and the other regions
+    are still returned. Missing files are skipped silently, as before.
+
+    If the directory holds an `inventory.snapshot` built from the
+    current CSV files (see src/inventory_snapshot.py), it is memory-mapped
+    instead and no CSV is parsed.
 
     Args:
         data_dir: Override data directory (for testing).
+        workers: Thread pool size; defaults to one thread per region file.
+        use_snapshot: Set False to always parse the CSV files.
 
     Returns:
-        List of InventoryRecord sorted by region then product_id.
+        InventoryLoadReport with the merged store, timings and errors.
     """
+    start = time.perf_counter()
     base = data_dir or _data_dir()
-    records: list[InventoryRecord] = []
+    if use_snapshot:
+        from src.inventory_snapshot import open_fresh_snapshot  # imports this module
 
-    for region, filename in _CSV_FILES.items():
-        csv_path = base / filename
-        if not csv_path.exists():
+        snapshot = open_fresh_snapshot(base)
+        if snapshot is not None:
+            elapsed = time.perf_counter() - start
+            return InventoryLoadReport(store=snapshot, timings={"snapshot": elapsed}, elapsed=elapsed)
+
+    files = [
+        (region, base / filename)
+        for region, filename in _CSV_FILES.items()
+        if (base / filename).exists()
+    ]
+    report = InventoryLoadReport()
+    if not files:
+        return report
+
+    def load(item: tuple[str, Path]) -> tuple[InventoryStore, float] | InventoryLoadError:
+        region, csv_path = item
+        try:
+            return _load_region(region, csv_path)
+        except InventoryLoadError as e:
+            return e
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            return InventoryLoadError(region, str(csv_path), str(e))
+
+    with ThreadPoolExecutor(max_workers=workers or len(files), thread_name_prefix="inventory-load") as pool:
+        results = list(pool.map(load, files))
+
+    # Merge in _CSV_FILES order so the final sort breaks ties as before
+    for (region, _), result in zip(files, results):
+        if isinstance(result, InventoryLoadError):
+            report.errors.append(result)
             continue
+        store, seconds = result
+        report.store.extend_store(store)
+        report.timings[region] = seconds
+
+    report.store.sort()
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def load_inventory_store(data_dir: Path | None = None) -> InventoryStore:
+    """Load all regional CSV files into one InventoryStore.
+
+    Args:
+        data_dir: Override data directory (for testing).
+
+    Returns:
+        InventoryStore sorted by region then product_id.
+
+    Raises:
+        InventoryLoadError: If any region file is malformed. Use
+            `load_inventory_regions` to keep the regions that loaded.
+    """
+    report = load_inventory_regions(data_dir)
+    if report.errors:
+        raise report.errors[0]
+    return report.store
+
+
+def load_inventory(data_dir: Path | None = None) -> list[InventoryRecord]:
+    """Load all inventory records from CSV files.
 
-        with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                records.append(InventoryRecord(
-                    product_id=row["product_id"],
-                    product_name=row["product_name"],
-                    region=row["region"],
-                    warehouse=row["warehouse"],
-                    quantity=int(row["quantity"]),
-                    unit=row["unit"],
-                    status=row["status"],
-                    last_updated=row["last_updated"],
-                    reorder_point=int(row["reorder_point"]),
-                    supplier=row["supplier"],
-                    note=row.get("note", ""),
-                ))
-
-    records.sort(key=lambda r: (r.region, r.product_id))
-    return records
-
-
-def _summarize_regions(records: list[InventoryRecord]) -> dict[str, RegionSummary]:
-    """Group records by region and compute totals."""
-    summaries: dict[str, RegionSummary] = {}
-    for rec in records:
-        if rec.region not in summaries:
-            summaries[rec.region] = RegionSummary(region=rec.region)
-        s = summaries[rec.region]
-        s.total_qty += rec.quantity
-        s.records.append(rec)
-    return summaries
+    Args:
+        data_dir: Override data directory (for testing).
+
+    Returns:
+        List of InventoryRecord sorted by region then product_id.
+    """
+    return load_inventory_store(data_dir).records()
 
 
 # ---------------------------------------------------------------------------
@@ -149,74 +551,742 @@ class Anomaly:
     message: str
 
 
-def detect_anomalies(records: list[InventoryRecord]) -> list[Anomaly]:
-    """Detect inventory anomalies (critical + low stock warnings)."""
-    anomalies: list[Anomaly] = []
-    for rec in records:
-        if rec.status == "out_of_stock":
-            msg = f"{rec.warehouse}: **0** boxes — out of stock"
-            if rec.note:
-                msg += f" ({rec.note})"
-            anomalies.append(Anomaly("critical", rec.region, rec.warehouse, msg))
-        elif rec.status == "critical":
-            msg = (
-                f"{rec.warehouse}: only **{rec.quantity}** boxes "
-                f"(reorder point: {rec.reorder_point})"
-            )
-            if rec.note:
-                msg += f" — {rec.note}"
-            anomalies.append(Anomaly("critical", rec.region, rec.warehouse, msg))
-        elif rec.status == "low":
-            msg = (
-                f"{rec.warehouse}: {rec.quantity} boxes "
-                f"(reorder point: {rec.reorder_point}) — still above threshold"
-            )
-            anomalies.append(Anomaly("warning", rec.region, rec.warehouse, msg))
+def _make_anomaly(
+    status: str, region: str, warehouse: str, quantity: int, reorder_point: int, note: str,
+) -> Anomaly | None:
+    if status == "out_of_stock":
+        msg = f"{warehouse}: **0** boxes — out of stock"
+        if note:
+            msg += f" ({note})"
+        return Anomaly("critical", region, warehouse, msg)
+    if status == "critical":
+        msg = (
+            f"{warehouse}: only **{quantity}** boxes "
+            f"(reorder point: {reorder_point})"
+        )
+        if note:
+            msg += f" — {note}"
+        return Anomaly("critical", region, warehouse, msg)
+    if status == "low":
+        msg = (
+            f"{warehouse}: {quantity} boxes "
+            f"(reorder point: {reorder_point}) — still above threshold"
+        )
+        return Anomaly("warning", region, warehouse, msg)
+    return None
+
+
+# Trend alerts (see detect_anomalies(history=...))
+TREND_WINDOW_DAYS = 7.0
+TREND_HORIZON_DAYS = 3.0
+
+
+def detect_anomalies(
+    records: "InventoryStore | Iterable[InventoryRecord]",
+    history: "InventoryHistory | None" = None,
+    window_days: float = TREND_WINDOW_DAYS,
+    horizon_days: float = TREND_HORIZON_DAYS,
+) -> list[Anomaly]:
+    """Detect inventory anomalies (critical + low stock warnings).
+
+    Only rows with a non-normal status are visited; they are located by
+    scanning the status code column.
+
+    With a `history` (src/inventory_history.py), rows not already
+    critical also get a trend warning when their depletion rate over the
+    last `window_days` would empty them within `horizon_days`, even if
+    their status still reads normal.
+    """
+    store = records if isinstance(records, InventoryStore) else InventoryStore.from_records(records)
+    anomalies = [
+        _make_anomaly(
+            store.value("status", i), store.value("region", i), store.value("warehouse", i),
+            store.quantity[i], store.reorder_point[i], store.value("note", i),
+        )
+        for i in store.rows_with_status(*ANOMALY_STATUSES)
+    ]
+    if history is None:
+        return anomalies
+
+    already_critical = set(store.rows_with_status("out_of_stock", "critical"))
+    for i in range(len(store)):
+        if i in already_critical:
+            continue
+        warehouse = store.value("warehouse", i)
+        stats = history.window(store.value("product_id", i), warehouse, window_days)
+        if stats is None or stats.depletion_per_day <= 0:
+            continue
+        days_left = store.quantity[i] / stats.depletion_per_day
+        if days_left <= horizon_days:
+            anomalies.append(Anomaly(
+                "warning", store.value("region", i), warehouse,
+                f"{warehouse}: draining ~{stats.depletion_per_day:,.0f} boxes/day "
+                f"over {window_days:g} days — out of stock in ~{days_left:.1f} days",
+            ))
     return anomalies
 
 
+# ---------------------------------------------------------------------------
+# Streaming ingestion
+# ---------------------------------------------------------------------------
+
+DEFAULT_CHUNK_ROWS = 10_000
+
+
+@dataclass
+class InventorySummary:
+    """Per-region aggregates and anomalies, without the rows behind them."""
+    regions: dict[str, RegionSummary] = field(default_factory=dict)
+    anomalies: list[Anomaly] = field(default_factory=list)
+    last_updated: str | None = None  # of the first row in (region, product_id) order
+    row_count: int = 0
+
+
+def _read_chunks(reader: Iterator[list[str]], chunk_rows: int) -> Iterator[list[list[str]]]:
+    while chunk := list(islice(reader, chunk_rows)):
+        yield chunk
+
+
+def stream_inventory_summary(
+    data_dir: Path | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> InventorySummary:
+    """Fold the regional CSV files into per-region aggregates, chunk by chunk.
+
+    Rows are read `chunk_rows` at a time and folded into running totals
+    and status counts, then dropped; only anomalous rows leave anything
+    behind. Peak memory therefore depends on the chunk size and the
+    number of anomalies, not on the size of the files.
+
+    The result matches `load_inventory` + `detect_anomalies`: regions in
+    sorted order, anomalies in (region, product_id) order. The returned
+    RegionSummary objects carry `row_count` / `status_counts` instead
+    of `records`.
+
+    Args:
+        data_dir: Override data directory (for testing).
+        chunk_rows: Rows read per chunk.
+
+    Returns:
+        InventorySummary for all regions found.
+    """
+    base = data_dir or _data_dir()
+    regions: dict[str, RegionSummary] = {}
+    flagged: list[tuple[str, str, int, Anomaly]] = []
+    first_key: tuple[str, str] | None = None
+    last_updated: str | None = None
+    row_count = 0
+
+    for filename in _CSV_FILES.values():
+        csv_path = base / filename
+        if not csv_path.exists():
+            continue
+
+        with open(csv_path, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                continue
+            (pid, _, region_idx, warehouse, qty, _, status_idx, updated, reorder, _,
+             note_idx) = _csv_columns(header)
+
+            for chunk in _read_chunks(reader, chunk_rows):
+                for row in chunk:
+                    if not row:
+                        continue
+                    region, status, quantity = row[region_idx], row[status_idx], int(row[qty])
+                    summary = regions.get(region)
+                    if summary is None:
+                        summary = regions[region] = RegionSummary(region)
+                    summary.total_qty += quantity
+                    summary.row_count += 1
+                    counts = summary.status_counts
+                    counts[status] = counts.get(status, 0) + 1
+
+                    key = (region, row[pid])
+                    if first_key is None or key < first_key:
+                        first_key, last_updated = key, row[updated]
+                    if status in ANOMALY_STATUSES:
+                        note = row[note_idx] if note_idx is not None and note_idx < len(row) else ""
+                        anomaly = _make_anomaly(
+                            status, region, row[warehouse], quantity, int(row[reorder]), note,
+                        )
+                        flagged.append((region, row[pid], row_count, anomaly))
+                    row_count += 1
+
+    flagged.sort(key=lambda item: item[:3])
+    return InventorySummary(
+        regions=dict(sorted(regions.items())),
+        anomalies=[item[3] for item in flagged],
+        last_updated=last_updated,
+        row_count=row_count,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Incremental snapshots
+# ---------------------------------------------------------------------------
+
+RowKey = tuple[str, str]  # (product_id, warehouse)
+
+
+@dataclass
+class InventoryDelta:
+    """What one `InventoryTracker.refresh()` changed.
+
+    Attributes:
+        added / modified / removed: Changed rows; `modified` holds
+            (old, new) pairs.
+        region_totals: Total quantity per region after the change.
+        anomalies_raised / anomalies_cleared: Alerts that appeared or
+            went away with this change (a changed alert is both).
+        errors: Region files that could not be read; their previous rows
+            are kept.
+    """
+    added: list[InventoryRecord] = field(default_factory=list)
+    modified: list[tuple[InventoryRecord, InventoryRecord]] = field(default_factory=list)
+    removed: list[InventoryRecord] = field(default_factory=list)
+    region_totals: dict[str, int] = field(default_factory=dict)
+    anomalies_raised: list[Anomaly] = field(default_factory=list)
+    anomalies_cleared: list[Anomaly] = field(default_factory=list)
+    errors: list[InventoryLoadError] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+def _record_from_row(row: list[str], columns: tuple) -> InventoryRecord:
+    (pid, name, region, warehouse, qty, unit, status, updated, reorder, supplier,
+     note_idx) = columns
+    return InventoryRecord(
+        product_id=row[pid],
+        product_name=row[name],
+        region=row[region],
+        warehouse=row[warehouse],
+        quantity=int(row[qty]),
+        unit=row[unit],
+        status=row[status],
+        last_updated=row[updated],
+        reorder_point=int(row[reorder]),
+        supplier=row[supplier],
+        note=row[note_idx] if note_idx is not None and note_idx < len(row) else "",
+    )
+
+
+class InventoryTracker:
+    """Keeps the last loaded inventory and reports what each reload changed.
+
+    Rows are keyed by (product_id, warehouse) and remembered by the hash
+    of their raw CSV fields. On `refresh()`, files whose fingerprint is
+    unchanged are skipped; in the others only rows whose hash differs
+    are parsed. Region totals and the anomaly set are patched with
+    those changes alone, so they cost O(changes) rather than O(rows).
+
+    A file with a malformed row is reported in `InventoryDelta.errors`
+    once, and the rows previously loaded from it stay in place until a
+    good version arrives. Each file's rows are tracked separately; a key
+    supplied by several files (or repeated within one) takes the last
+    row in file order, and is only removed once no file supplies it, so
+    a row moved between files is neither lost nor reported as changed.
+
+    Args:
+        data_dir: Override data directory (for testing).
+    """
+
+    def __init__(self, data_dir: Path | None = None):
+        self.data_dir = data_dir or _data_dir()
+        self._fingerprints: dict[str, tuple | None] = {}
+        # region file → row key → (hash of raw fields, parsed row)
+        self._rows: dict[str, dict[RowKey, tuple[int, InventoryRecord]]] = {}
+        self._records: dict[RowKey, InventoryRecord] = {}
+        self._anomalies: dict[RowKey, Anomaly] = {}
+        self._totals: dict[str, int] = {}
+        self._row_counts: dict[str, int] = {}
+
+    @property
+    def region_totals(self) -> dict[str, int]:
+        return dict(sorted(self._totals.items()))
+
+    def records(self) -> list[InventoryRecord]:
+        """Current rows, sorted by region then product_id."""
+        return sorted(self._records.values(), key=lambda r: (r.region, r.product_id))
+
+    def anomalies(self) -> list[Anomaly]:
+        """Current alerts, in the order `detect_anomalies` lists them."""
+        keyed = ((self._records[key], anomaly) for key, anomaly in self._anomalies.items())
+        return [a for _, a in sorted(keyed, key=lambda item: (item[0].region, item[0].product_id))]
+
+    def refresh(self) -> InventoryDelta:
+        """Reload changed files and return the row-level difference.
+
+        The first call reports every row as added.
+        """
+        delta = InventoryDelta()
+        for file_region, filename in _CSV_FILES.items():
+            path = self.data_dir / filename
+            fingerprint = _file_fingerprint(path)
+            if file_region in self._fingerprints and self._fingerprints[file_region] == fingerprint:
+                continue
+            # Record the new fingerprint first: a broken file is reported once
+            self._fingerprints[file_region] = fingerprint
+            previous = self._rows.get(file_region, {})
+            try:
+                rows = self._read_rows(file_region, path if fingerprint else None, previous)
+            except InventoryLoadError as e:
+                delta.errors.append(e)
+                continue
+            self._rows[file_region] = rows
+            touched = [key for key, entry in rows.items() if previous.get(key) is not entry]
+            touched += sorted(previous.keys() - rows.keys())
+            for key in touched:
+                old, new = self._records.get(key), self._resolve(key)
+                if old != new:
+                    self._apply(key, old, new, delta)
+        delta.region_totals = self.region_totals
+        return delta
+
+    def _resolve(self, key: RowKey) -> InventoryRecord | None:
+        """The row `key` currently has: the one from the last file supplying it."""
+        for file_region in reversed(_CSV_FILES):
+            entry = self._rows.get(file_region, {}).get(key)
+            if entry is not None:
+                return entry[1]
+        return None
+
+    def _read_rows(
+        self, file_region: str, path: Path | None, previous: dict[RowKey, tuple[int, InventoryRecord]],
+    ) -> dict[RowKey, tuple[int, InventoryRecord]]:
+        """Rows of one file; only those whose hash changed are parsed again."""
+        rows: dict[RowKey, tuple[int, InventoryRecord]] = {}
+        if path is not None:
+            try:
+                with open(path, encoding="utf-8", newline="") as f:
+                    reader = csv.reader(f)
+                    header = next(reader, None) or []
+                    try:
+                        columns = _csv_columns(header)
+                    except KeyError as e:
+                        raise InventoryLoadError(file_region, str(path), f"missing column {e}") from e
+                    pid, warehouse = columns[0], columns[3]
+                    for row in reader:
+                        if not row:
+                            continue
+                        try:
+                            key = (row[pid], row[warehouse])
+                            row_hash = hash(tuple(row))
+                            entry = previous.get(key)
+                            if entry is None or entry[0] != row_hash:
+                                entry = (row_hash, _record_from_row(row, columns))
+                            rows[key] = entry  # a repeated key keeps its last row
+                        except (ValueError, IndexError) as e:
+                            raise InventoryLoadError(
+                                file_region, str(path), f"line {reader.line_num}: {e}"
+                            ) from e
+            except (OSError, UnicodeDecodeError, csv.Error) as e:
+                raise InventoryLoadError(file_region, str(path), str(e)) from e
+        return rows
+
+    def _apply(
+        self, key: RowKey, old: InventoryRecord | None, new: InventoryRecord | None,
+        delta: InventoryDelta,
+    ) -> None:
+        if old is not None:
+            self._totals[old.region] -= old.quantity
+            self._row_counts[old.region] -= 1
+            if not self._row_counts[old.region]:
+                del self._totals[old.region], self._row_counts[old.region]
+        if new is not None:
+            self._totals[new.region] = self._totals.get(new.region, 0) + new.quantity
+            self._row_counts[new.region] = self._row_counts.get(new.region, 0) + 1
+            self._records[key] = new
+        else:
+            del self._records[key]
+
+        if old is None:
+            delta.added.append(new)
+        elif new is None:
+            delta.removed.append(old)
+        else:
+            delta.modified.append((old, new))
+
+        previous = self._anomalies.pop(key, None)
+        anomaly = None if new is None else _make_anomaly(
+            new.status, new.region, new.warehouse, new.quantity, new.reorder_point, new.note,
+        )
+        if anomaly is not None:
+            self._anomalies[key] = anomaly
+        if previous != anomaly:
+            if previous is not None:
+                delta.anomalies_cleared.append(previous)
+            if anomaly is not None:
+                delta.anomalies_raised.append(anomaly)
+
+
+# ---------------------------------------------------------------------------
+# Scoped queries
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class InventoryQuery:
+    """Filters for a slice of the inventory; unset filters match everything.
+
+    Regions and warehouses together name the locations asked about and
+    match their union ("Japan and the US", "Tokyo vs Osaka"); a region
+    that is also named through one of its warehouses ("Osaka in Japan")
+    narrows to that warehouse. The other filters intersect with it.
+
+    Attributes:
+        regions: Region codes ("TW", "JP", "US").
+        product_prefix: Leading part of product_id, e.g. "P101-JP".
+        warehouses: Case-insensitive substrings of warehouse names.
+        statuses: Statuses to keep, e.g. ("critical", "out_of_stock").
+        below_reorder: Only rows whose quantity is under their reorder point.
+    """
+    regions: tuple[str, ...] = ()
+    product_prefix: str | None = None
+    warehouses: tuple[str, ...] = ()
+    statuses: tuple[str, ...] = ()
+    below_reorder: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.regions or self.product_prefix or self.warehouses
+                    or self.statuses or self.below_reorder)
+
+    def describe(self) -> str:
+        parts = []
+        if self.regions:
+            parts.append(" / ".join(REGION_FLAGS.get(r, r) for r in self.regions))
+        if self.warehouses:
+            parts.append("warehouse " + " / ".join(f"“{w}”" for w in self.warehouses))
+        if self.product_prefix:
+            parts.append(f"product {self.product_prefix}*")
+        if self.statuses:
+            parts.append(" / ".join(STATUS_ICONS.get(s, s) for s in self.statuses))
+        if self.below_reorder:
+            parts.append("below reorder point")
+        return " · ".join(parts) or "all inventory"
+
+
+class InventoryIndex:
+    """Posting lists over an InventoryStore for region / warehouse / status lookups.
+
+    Built once per store (see `InventoryStore.index`). Product ids are
+    kept sorted so a prefix becomes one bisect range; warehouse filters
+    are substring matches over the distinct warehouse names only.
+    """
+
+    def __init__(self, store: InventoryStore):
+        self.store = store
+        self.by_region = {region: frozenset(rows) for region, rows in store.region_rows().items()}
+        self.by_warehouse = self._postings(store, "warehouse")
+        self.by_status = self._postings(store, "status")
+        pids = store.tables["product_id"].values
+        self._products = sorted((pids[code], i) for i, code in enumerate(store.codes["product_id"]))
+        self._product_keys = [pid.casefold() for pid, _ in self._products]
+        self.below_reorder = frozenset(
+            i for i, (qty, reorder) in enumerate(zip(store.quantity, store.reorder_point))
+            if qty < reorder
+        )
+
+    @staticmethod
+    def _postings(store: InventoryStore, column: str) -> dict[str, frozenset[int]]:
+        postings: dict[int, list[int]] = {}
+        for i, code in enumerate(store.codes[column]):
+            postings.setdefault(code, []).append(i)
+        names = store.tables[column]
+        return {names[code]: frozenset(rows) for code, rows in postings.items()}
+
+    def product_rows(self, prefix: str) -> frozenset[int]:
+        key = prefix.casefold()
+        lo = bisect.bisect_left(self._product_keys, key)
+        hi = bisect.bisect_left(self._product_keys, key + "\U0010ffff")
+        return frozenset(i for _, i in self._products[lo:hi])
+
+    def warehouse_rows(self, term: str) -> frozenset[int]:
+        term = term.casefold()
+        rows: set[int] = set()
+        for name, postings in self.by_warehouse.items():
+            if term in name.casefold():
+                rows |= postings
+        return frozenset(rows)
+
+    def location_rows(self, regions: Sequence[str], warehouses: Sequence[str]) -> frozenset[int]:
+        """Union of the named warehouses and regions.
+
+        A region that already contains one of the named warehouses adds
+        nothing, so "Osaka in Japan" stays Osaka.
+        """
+        rows: set[int] = set()
+        for term in warehouses:
+            rows |= self.warehouse_rows(term)
+        named = frozenset(rows)
+        for region in regions:
+            region_rows = self.by_region.get(region.upper(), frozenset())
+            if not region_rows & named:
+                rows |= region_rows
+        return frozenset(rows)
+
+    def rows(self, query: InventoryQuery) -> list[int]:
+        candidates: list[frozenset[int]] = []
+        if query.regions or query.warehouses:
+            candidates.append(self.location_rows(query.regions, query.warehouses))
+        if query.product_prefix:
+            candidates.append(self.product_rows(query.product_prefix))
+        if query.statuses:
+            candidates.append(frozenset().union(*(self.by_status.get(s, ()) for s in query.statuses)))
+        if query.below_reorder:
+            candidates.append(self.below_reorder)
+        if not candidates:
+            return list(range(len(self.store)))
+
+        candidates.sort(key=len)
+        rows = set(candidates[0])
+        for other in candidates[1:]:
+            rows &= other
+        return sorted(rows)
+
+
+# Query phrases → filters. Checked against the casefolded query text;
+# ASCII phrases must match whole words. Region codes themselves are
+# matched case-sensitively ("US", not "tell us").
+REGION_ALIASES = {
+    "TW": ("taiwan", "台灣", "臺灣"),
+    "JP": ("japan", "日本"),
+    "US": ("usa", "united states", "america", "美國"),
+}
+WAREHOUSE_ALIASES = {
+    "tokyo": "東京", "東京": "東京",
+    "osaka": "大阪", "大阪": "大阪",
+    "taipei": "台北", "台北": "台北", "臺北": "台北",
+    "kaohsiung": "高雄", "高雄": "高雄",
+    "taichung": "台中", "台中": "台中", "臺中": "台中",
+    "los angeles": "Arcadia", "arcadia": "Arcadia", "洛杉磯": "Arcadia",
+    "new york": "New York", "紐約": "New York",
+}
+STATUS_ALIASES = {
+    "out_of_stock": ("out of stock", "out-of-stock", "sold out", "斷貨", "缺貨", "售罄"),
+    "critical": ("critical", "危急"),
+    "low": ("low stock", "低庫存", "庫存偏低"),
+}
+ANOMALY_ALIASES = ("anomaly", "anomalies", "shortage", "異常", "短缺")
+# Only explicit below-threshold phrasing: "what's the reorder point in Tokyo?"
+# asks about the column, not for rows under it
+BELOW_REORDER_ALIASES = (
+    "below reorder", "below the reorder", "below their reorder", "under reorder",
+    "under the reorder", "need to restock", "needs to restock", "need restocking",
+    "needs restocking", "need to reorder", "needs to reorder", "need reordering",
+    "needs reordering", "低於補貨點", "低於再訂購點", "需要補貨", "需補貨",
+)
+
+_PRODUCT_ID_RE = re.compile(r"\b(P\d+(?:-[A-Z]+)*)", re.IGNORECASE)
+
+
+def _mentions(text: str, phrase: str) -> bool:
+    if phrase.isascii():
+        return re.search(rf"\b{re.escape(phrase)}\b", text) is not None
+    return phrase in text
+
+
+def parse_inventory_query(text: str) -> InventoryQuery:
+    """Turn a natural-language question into an InventoryQuery.
+
+    Only filters the text clearly names are set; a question that names
+    none ("check inventory") gives an empty query, i.e. the full report.
+
+    Every region and warehouse named is kept, so comparisons
+    ("Tokyo vs Osaka") get all the locations they mention.
+
+    Example:
+        "how many boxes in Osaka?" → InventoryQuery(warehouses=("大阪",))
+    """
+    product = _PRODUCT_ID_RE.search(text)
+    # "P101-JP" names a product, not the JP region; regions named in
+    # words ("P101 in Japan") still count
+    text = _PRODUCT_ID_RE.sub(" ", text)
+    folded = text.casefold()
+    regions = tuple(
+        code for code, aliases in REGION_ALIASES.items()
+        if _mentions(text, code) or any(_mentions(folded, alias) for alias in aliases)
+    )
+    warehouses = tuple(dict.fromkeys(
+        name for alias, name in WAREHOUSE_ALIASES.items() if _mentions(folded, alias)
+    ))
+    statuses = tuple(
+        status for status, aliases in STATUS_ALIASES.items()
+        if any(_mentions(folded, alias) for alias in aliases)
+    )
+    if not statuses and any(_mentions(folded, alias) for alias in ANOMALY_ALIASES):
+        statuses = ANOMALY_STATUSES
+    return InventoryQuery(
+        regions=regions,
+        product_prefix=product.group(1).upper() if product else None,
+        warehouses=warehouses,
+        statuses=statuses,
+        below_reorder=any(_mentions(folded, alias) for alias in BELOW_REORDER_ALIASES),
+    )
+
+
+def query_inventory(query: InventoryQuery, data_dir: Path | None = None) -> list[InventoryRecord]:
+    """Records matching `query`, sorted by region then product_id."""
+    store = _report_cache.load(data_dir or _data_dir()).store
+    return [store.row(i) for i in store.query(query)]
+
+
+def generate_inventory_answer(text: str, data_dir: Path | None = None) -> str:
+    """Markdown for just the slice of inventory a question asks about.
+
+    Falls back to the full `generate_inventory_report()` when the
+    question names no region, warehouse, product, or status.
+
+    Args:
+        text: The user's question.
+        data_dir: Override data directory (for testing).
+
+    Returns:
+        Markdown string suitable for LLM consumption or direct display.
+    """
+    query = parse_inventory_query(text)
+    base = data_dir or _data_dir()
+    if not query:
+        return generate_inventory_report(data_dir=base)
+    loaded = _report_cache.load(base)
+    return _render_slice(loaded.store, query, loaded.errors)
+
+
+def prewarm_inventory(data_dir: Path | None = None) -> None:
+    """Load the inventory and build its query index ahead of a question.
+
+    Warms exactly what `generate_inventory_answer` reads first, without
+    rendering the full report.
+    """
+    _report_cache.load(data_dir or _data_dir()).store.index()
+
+
+def _render_slice(
+    store: InventoryStore, query: InventoryQuery, errors: Sequence[InventoryLoadError] = (),
+) -> str:
+    rows = store.query(query)
+    lines = [f"### 📊 Inventory: {query.describe()}\n"]
+    if len(store):
+        lines.append(f"> Last sync: {store.value('last_updated', 0)}")
+    for error in errors:
+        flag = REGION_FLAGS.get(error.region, error.region)
+        lines.append(f"> ⚠️ {flag} could not be loaded: {error.reason}")
+    lines.append("")
+    if not rows:
+        lines.append("No inventory rows match this query.")
+        return "\n".join(lines)
+
+    lines.append("| Region | Product ID | Warehouse | Qty | Status | Reorder Pt | Note |")
+    lines.append("|--------|------------|-----------|-----|--------|------------|------|")
+    for i in rows:
+        rec = store.row(i)
+        qty_str = f"**{rec.quantity}**" if rec.is_anomaly else f"{rec.quantity:,}"
+        lines.append(
+            f"| {rec.region} | {rec.product_id} | {rec.warehouse} | {qty_str} {rec.unit} "
+            f"| {rec.status_display} | {rec.reorder_point} | {rec.note} |"
+        )
+    total = sum(store.quantity[i] for i in rows)
+    lines.append(f"\n**{len(rows)} row(s), {total:,} boxes**")
+
+    # Comparisons across regions need each side's total, not just the sum
+    by_region: dict[str, int] = {}
+    for i in rows:
+        region = store.value("region", i)
+        by_region[region] = by_region.get(region, 0) + store.quantity[i]
+    if len(by_region) > 1:
+        lines.append(" · ".join(
+            f"{REGION_FLAGS.get(region, region)}: {qty:,} boxes" for region, qty in by_region.items()
+        ))
+    return "\n".join(lines)
+
+
 # ---------------------------------------------------------------------------
 # Markdown report generation
 # ---------------------------------------------------------------------------
 
-def generate_inventory_report(records: list[InventoryRecord] | None = None) -> str:
+def generate_inventory_report(
+    records: list[InventoryRecord] | None = None,
+    data_dir: Path | None = None,
+    history: "InventoryHistory | None" = None,
+) -> str:
     """Generate a full Markdown inventory report with anomaly alerts.
 
     This replaces 02_inventory_agent.py's static INVENTORY_DATA and the
     static SKILL.md response with real data from CSV files.
 
+    When the records come from the CSV files, the rendered report is
+    memoized per data directory and reused until one of the files
+    changes (see `inventory_report_cache_stats` and
+    `invalidate_inventory_report_cache`). Region files are loaded
+    concurrently; a malformed one is left out and named in a partial-data
+    warning at the top of the report.
+
+    The "Suggested Next Steps" come from `forecast_inventory`
+    (src/inventory_forecast.py): reorder quantities for warehouses at or
+    heading below their reorder point, and pending shipments named in
+    the notes.
+
     Args:
         records: Pre-loaded records, or None to load from CSV.
+        data_dir: Override data directory (for testing).
+        history: Past snapshots for trend alerts and consumption-based
+                 forecasts; a report rendered with a history is not cached.
 
     Returns:
         Markdown string suitable for LLM consumption or direct display.
+
+    Raises:
+        InventoryLoadError: If region files exist but none could be loaded.
     """
-    if records is None:
-        records = load_inventory()
+    if records is not None:
+        return _render_report(InventoryStore.from_records(records), history=history)
+    if history is not None:
+        loaded = _report_cache.load(data_dir or _data_dir())
+        return _render_report(loaded.store, loaded.errors, history)
+    return _report_cache.get(data_dir or _data_dir())
+
 
-    if not records:
+def _render_report(
+    store: InventoryStore,
+    errors: Sequence[InventoryLoadError] = (),
+    history: "InventoryHistory | None" = None,
+) -> str:
+    from src.inventory_forecast import forecast_inventory  # imports this module
+
+    if not len(store):
         return "⚠️ No inventory data found. CSV files may be missing from data/inventory/."
 
-    summaries = _summarize_regions(records)
-    anomalies = detect_anomalies(records)
-    last_updated = records[0].last_updated if records else "unknown"
+    groups = store.region_rows()
+    totals = store.region_totals()
+    anomalies = detect_anomalies(store, history)
+    last_updated = store.value("last_updated", 0)
 
     lines: list[str] = []
     lines.append("### 📊 101 Pineapple Cake Inventory Query Results\n")
     lines.append(f"> Source: Foundry Agent → Fabric MCP → Lakehouse (`inventory.supplier_stock`)")
     lines.append(f"> Last sync: {last_updated}\n")
 
+    # Regions whose file could not be loaded are left out, not guessed
+    if errors:
+        lines.append("> ⚠️ **Partial data** — the following regions could not be loaded:")
+        for error in errors:
+            flag = REGION_FLAGS.get(error.region, error.region)
+            lines.append(f"> - {flag}: {error.reason}")
+        lines.append("")
+
     # Per-region detail tables
     for region_code in ["TW", "JP", "US"]:
-        summary = summaries.get(region_code)
-        if not summary:
+        rows = groups.get(region_code)
+        if not rows:
             continue
 
         flag = REGION_FLAGS.get(region_code, region_code)
         lines.append(f"#### {flag}\n")
         lines.append("| Product ID | Product Name | Warehouse | Qty | Unit | Status | Reorder Pt | Supplier |")
         lines.append("|------------|-------------|-----------|-----|------|--------|------------|----------|")
-        for rec in summary.records:
+        for i in rows:
+            rec = store.row(i)
             qty_str = f"**{rec.quantity}**" if rec.is_anomaly else f"{rec.quantity:,}"
             note_suffix = f" 📝 {rec.note}" if rec.note else ""
             lines.append(
@@ -224,20 +1294,20 @@ def generate_inventory_report(records: list[InventoryRecord] | None = None) -> s
                 f"| {qty_str} | {rec.unit} | {rec.status_display} "
                 f"| {rec.reorder_point} | {rec.supplier}{note_suffix} |"
             )
-        lines.append(f"\n**{flag} Total: {summary.total_qty:,} boxes**\n")
+        lines.append(f"\n**{flag} Total: {totals[region_code]:,} boxes**\n")
 
     # Global summary table
-    global_total = sum(s.total_qty for s in summaries.values())
+    global_total = sum(totals.values())
     lines.append("#### 📈 Global Summary\n")
     lines.append("| Region | Total Stock | Status |")
     lines.append("|--------|------------|--------|")
     for region_code in ["TW", "JP", "US"]:
-        summary = summaries.get(region_code)
-        if not summary:
+        if region_code not in groups:
             continue
         flag = REGION_FLAGS.get(region_code, region_code)
-        status = STATUS_ICONS.get(summary.worst_status, summary.worst_status)
-        lines.append(f"| {flag} | {summary.total_qty:,} boxes | {status} |")
+        worst = store.worst_status(region_code)
+        status = STATUS_ICONS.get(worst, worst)
+        lines.append(f"| {flag} | {totals[region_code]:,} boxes | {status} |")
     lines.append(f"| **Global Total** | **{global_total:,} boxes** | |")
     lines.append("")
 
@@ -257,15 +1327,154 @@ def generate_inventory_report(records: list[InventoryRecord] | None = None) -> s
                 lines.append(f"- 🟡 {flag}: {a.message}")
         lines.append("")
 
-    # Suggested next steps
+    # Suggested next steps, from the reorder forecast
     lines.append("#### 🔍 Suggested Next Steps\n")
-    if any(a.severity == "critical" for a in anomalies):
-        lines.append("1. **Investigate cause** of critical stock shortage")
-        lines.append("2. Check for related **customer complaints**")
-        lines.append("3. Confirm **restocking progress** and ETA")
-    else:
-        lines.append("1. Continue monitoring stock levels")
-        lines.append("2. Review reorder schedules for low-stock warehouses")
+    steps = _next_steps(forecast_inventory(store, history))
+    if not steps:
+        steps = ["Continue monitoring stock levels — no warehouse needs a reorder"]
+    lines.extend(f"{n}. {step}" for n, step in enumerate(steps, 1))
     lines.append("")
 
     return "\n".join(lines)
+
+
+def _next_steps(forecast: "InventoryForecast") -> list[str]:
+    store = forecast.store
+    steps = []
+    for i in forecast.reorder_rows():
+        f = forecast.row(i)
+        flag = REGION_FLAGS.get(f.region, f.region)
+        if f.quantity <= 0:
+            why = "out of stock"
+        elif f.days_until_stockout is not None:
+            why = f"out of stock in ~{f.days_until_stockout:.1f} days"
+        else:
+            why = f"{f.quantity:,} on hand, reorder point {f.reorder_point:,}"
+        steps.append(f"**Reorder {f.suggested_order:,} boxes** for {f.warehouse} ({flag}) — {why}")
+    for i in range(len(store)):
+        shipment = forecast.pending(i)
+        if shipment is None:
+            continue
+        f = forecast.row(i)
+        flag = REGION_FLAGS.get(f.region, f.region)
+        due = f" due {shipment.arrival.month}/{shipment.arrival.day}" if shipment.arrival else ""
+        step = f"Confirm the **{shipment.quantity:,}-box shipment** to {f.warehouse} ({flag}){due}"
+        if f.days_until_stockout is not None:
+            step += f" — stock lasts ~{f.days_until_stockout:.1f} days"
+        steps.append(step)
+    return steps
+
+
+# ---------------------------------------------------------------------------
+# Report cache
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ReportCacheStats:
+    """Counters reported by the inventory report cache."""
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _csv_fingerprint(base: Path) -> tuple:
+    """(mtime_ns, size, inode) of every regional CSV; None if missing.
+
+    The inode catches files replaced by a rename (atomic export) even
+    when mtime and size happen to match.
+    """
+    return tuple(_file_fingerprint(base / filename) for filename in _CSV_FILES.values())
+
+
+def _file_fingerprint(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+@dataclass
+class _CacheEntry:
+    fingerprint: tuple
+    loaded: InventoryLoadReport
+    report: str | None = None
+
+
+class _ReportCache:
+    """Loaded inventory and its rendered report per data directory.
+
+    Entries are keyed by CSV fingerprints. The full report is rendered
+    on first request; scoped queries reuse the loaded store.
+    """
+
+    def __init__(self):
+        self._entries: dict[Path, _CacheEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _entry(self, base: Path) -> _CacheEntry:
+        # Stat before reading: a file rewritten mid-load gets a newer
+        # fingerprint, so the next call reloads it
+        fingerprint = _csv_fingerprint(base)
+        with self._lock:
+            entry = self._entries.get(base)
+            if entry is not None and entry.fingerprint == fingerprint:
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        loaded = load_inventory_regions(base)
+        if loaded.errors and not len(loaded.store):
+            raise loaded.errors[0]
+        entry = _CacheEntry(fingerprint, loaded)
+        with self._lock:
+            self._entries[base] = entry
+        return entry
+
+    def load(self, base: Path) -> InventoryLoadReport:
+        return self._entry(base).loaded
+
+    def get(self, base: Path) -> str:
+        entry = self._entry(base)
+        if entry.report is None:
+            entry.report = _render_report(entry.loaded.store, entry.loaded.errors)
+        return entry.report
+
+    def invalidate(self, base: Path | None = None) -> None:
+        with self._lock:
+            if base is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(base, None)
+            self.invalidations += 1
+
+    def stats(self) -> ReportCacheStats:
+        with self._lock:
+            return ReportCacheStats(self.hits, self.misses, self.invalidations, len(self._entries))
+
+
+_report_cache = _ReportCache()
+
+
+def inventory_report_cache_stats() -> ReportCacheStats:
+    """Counters of the memoized `generate_inventory_report()`."""
+    return _report_cache.stats()
+
+
+def invalidate_inventory_report_cache(data_dir: Path | None = None) -> None:
+    """Drop cached reports (all of them, or one data directory's).
+
+    Call this when inventory changes in a way the CSV fingerprints
+    cannot see, e.g. an upstream sync that rewrites files in place
+    within the filesystem's mtime resolution.
+    """
+    _report_cache.invalidate(Path(data_dir) if data_dir is not None else None)
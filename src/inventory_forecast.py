@@ -0,0 +1,247 @@
+"""Days-until-stockout and reorder suggestions for every warehouse row.
+
+Each row's consumption rate comes from an InventoryHistory window (see
+src/inventory_history.py); pending shipments are read from the free-text
+`note` column, e.g. "下午空運補貨 300 盒預計 2/1 到達" or
+"300 boxes air freight arriving 2/1".
+
+Results are computed column-wise over the InventoryStore arrays: notes
+and rates are resolved once per distinct string-table value, then one
+pass over the quantity / reorder-point columns fills typed result
+columns. ReorderForecast objects are only built on demand via `row()`.
+
+Reorder policy (order-up-to, s/S):
+
+- inventory position = on hand + pending shipment
+- reorder when the position, less demand over `lead_time_days`, is at
+  or below the row's reorder point
+- order up to reorder point + demand over `lead_time_days + cover_days`
+
+Without history the consumption rate is unknown and taken as zero, so
+only rows already at or below their reorder point get a suggestion.
+"""
+
+import math
+import re
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+
+from src.inventory_data import InventoryRecord, InventoryStore
+from src.inventory_history import InventoryHistory, parse_timestamp
+
+LEAD_TIME_DAYS = 7.0
+COVER_DAYS = 14.0
+RATE_WINDOW_DAYS = 7.0
+
+# A note describes an inbound shipment only if it says so; "已斷貨 5 天"
+# (out of stock for 5 days) or "sold 300 boxes" are not shipments
+_SHIPMENT_WORDS = re.compile(
+    r"補貨|到貨|到達|抵達|空運|海運|出貨|restock|arriv|ship|freight|inbound|\beta\b",
+    re.IGNORECASE,
+)
+_SHIPMENT_QTY = re.compile(r"(\d[\d,]*)\s*(?:盒|箱|(?:boxes|box|cases|units|pcs)\b)", re.IGNORECASE)
+_SHIPMENT_DATE = re.compile(r"(?<![\d/])(\d{1,2})/(\d{1,2})(?![\d/])")
+
+
+@dataclass(frozen=True)
+class PendingShipment:
+    """An inbound shipment mentioned in a row's note."""
+    quantity: int
+    arrival: date | None  # None when the note gives no date
+
+
+def parse_pending_shipment(note: str, as_of: date) -> PendingShipment | None:
+    """Read an inbound shipment out of a free-text note.
+
+    Args:
+        note: The row's `note` value.
+        as_of: Date the note was written; a "M/D" arrival takes its year,
+               or the next one if it would otherwise lie over half a year back.
+
+    Returns:
+        PendingShipment, or None if the note does not announce a shipment
+        with a quantity.
+    """
+    if not note or not _SHIPMENT_WORDS.search(note):
+        return None
+    qty = _SHIPMENT_QTY.search(note)
+    if qty is None:
+        return None
+    quantity = int(qty.group(1).replace(",", ""))
+
+    arrival = None
+    when = _SHIPMENT_DATE.search(note)
+    if when is not None:
+        try:
+            arrival = date(as_of.year, int(when.group(1)), int(when.group(2)))
+        except ValueError:
+            arrival = None
+        else:
+            if (as_of - arrival).days > 183:
+                arrival = arrival.replace(year=as_of.year + 1)
+    return PendingShipment(quantity, arrival)
+
+
+@dataclass(frozen=True)
+class ReorderForecast:
+    """Forecast for one warehouse row."""
+    product_id: str
+    region: str
+    warehouse: str
+    quantity: int
+    reorder_point: int
+    consumption_per_day: float | None   # None without history for the row
+    pending: PendingShipment | None
+    days_until_stockout: float | None   # None while not draining
+    suggested_order: int
+
+
+class InventoryForecast:
+    """Forecast columns aligned with the rows of an InventoryStore.
+
+    Attributes:
+        store: The forecast inventory.
+        as_of: Date the forecast is made for.
+        consumption_per_day: array('d'); NaN where the rate is unknown.
+        days_until_stockout: array('d'); inf while not draining. A dated
+            shipment that lands before stock runs out extends it.
+        suggested_order: array('q') of boxes to order now (0 = none).
+    """
+
+    def __init__(
+        self,
+        store: InventoryStore,
+        as_of: date,
+        shipments: list[PendingShipment | None],
+        consumption_per_day: array,
+        days_until_stockout: array,
+        suggested_order: array,
+    ):
+        self.store = store
+        self.as_of = as_of
+        self._shipments = shipments  # per note code
+        self.consumption_per_day = consumption_per_day
+        self.days_until_stockout = days_until_stockout
+        self.suggested_order = suggested_order
+
+    def __len__(self) -> int:
+        return len(self.suggested_order)
+
+    def pending(self, i: int) -> PendingShipment | None:
+        """Pending shipment named in row `i`'s note."""
+        return self._shipments[self.store.codes["note"][i]]
+
+    def row(self, i: int) -> ReorderForecast:
+        """Materialize row `i` as a ReorderForecast."""
+        store = self.store
+        rate, days = self.consumption_per_day[i], self.days_until_stockout[i]
+        return ReorderForecast(
+            product_id=store.value("product_id", i),
+            region=store.value("region", i),
+            warehouse=store.value("warehouse", i),
+            quantity=store.quantity[i],
+            reorder_point=store.reorder_point[i],
+            consumption_per_day=None if math.isnan(rate) else rate,
+            pending=self.pending(i),
+            days_until_stockout=None if math.isinf(days) else days,
+            suggested_order=self.suggested_order[i],
+        )
+
+    def forecasts(self) -> list[ReorderForecast]:
+        return [self.row(i) for i in range(len(self))]
+
+    def reorder_rows(self) -> list[int]:
+        """Rows with a suggested order, soonest stockout first."""
+        rows = [i for i, qty in enumerate(self.suggested_order) if qty > 0]
+        rows.sort(key=self.days_until_stockout.__getitem__)
+        return rows
+
+
+def _as_of(store: InventoryStore) -> date:
+    latest = None
+    for value in store.tables["last_updated"].values:
+        try:
+            stamp = parse_timestamp(value)
+        except ValueError:  # free text in a hand-edited CSV; not a reason to fail the report
+            continue
+        latest = stamp if latest is None else max(latest, stamp)
+    moment = datetime.now(timezone.utc) if latest is None else datetime.fromtimestamp(latest, timezone.utc)
+    return moment.date()
+
+
+def _rates(store: InventoryStore, history: InventoryHistory | None, window_days: float) -> array:
+    unknown = math.nan
+    if history is None:
+        return array("d", [unknown]) * len(store)
+    depletion = history.depletion_rates(window_days)
+    pids, warehouses = store.tables["product_id"].values, store.tables["warehouse"].values
+    rates = array("d", (
+        depletion.get((pids[p], warehouses[w]), unknown)
+        for p, w in zip(store.codes["product_id"], store.codes["warehouse"])
+    ))
+    # Stock that grew over the window (a restock landed) is not negative demand
+    for i, rate in enumerate(rates):
+        if rate < 0:
+            rates[i] = 0.0
+    return rates
+
+
+def forecast_inventory(
+    records: "InventoryStore | Iterable[InventoryRecord]",
+    history: InventoryHistory | None = None,
+    as_of: date | None = None,
+    lead_time_days: float = LEAD_TIME_DAYS,
+    cover_days: float = COVER_DAYS,
+    window_days: float = RATE_WINDOW_DAYS,
+) -> InventoryForecast:
+    """Forecast stockouts and reorder quantities for every row.
+
+    Args:
+        records: Current inventory.
+        history: Past snapshots for consumption rates; None treats every
+                 rate as unknown (zero).
+        as_of: Forecast date; defaults to the latest `last_updated`.
+        lead_time_days: Days between placing an order and receiving it.
+        cover_days: Days of demand an order should cover after it lands.
+        window_days: History window the consumption rate is fitted over.
+
+    Returns:
+        InventoryForecast aligned with the store's rows.
+    """
+    store = records if isinstance(records, InventoryStore) else InventoryStore.from_records(records)
+    as_of = as_of or _as_of(store)
+
+    # Per distinct note: pending quantity and days until it lands (inf if undated)
+    shipments = [parse_pending_shipment(note, as_of) for note in store.tables["note"].values]
+    pending_qty = [s.quantity if s else 0 for s in shipments]
+    pending_days = [
+        (s.arrival - as_of).days if s and s.arrival else math.inf
+        for s in shipments
+    ]
+
+    rates = _rates(store, history, window_days)
+    days_until_stockout = array("d")
+    suggested_order = array("q")
+    for qty, reorder, note, rate in zip(store.quantity, store.reorder_point, store.codes["note"], rates):
+        rate = 0.0 if rate != rate else rate  # NaN: unknown, plan as if flat
+        incoming = pending_qty[note]
+        if qty <= 0:
+            days = 0.0
+        elif rate <= 0:
+            days = math.inf
+        else:
+            days = qty / rate
+            if pending_days[note] < days:
+                days = (qty + incoming) / rate
+        days_until_stockout.append(days)
+
+        position = qty + incoming
+        if position - rate * lead_time_days <= reorder:
+            target = reorder + rate * (lead_time_days + cover_days)
+            suggested_order.append(max(0, math.ceil(target - position)))
+        else:
+            suggested_order.append(0)
+
+    return InventoryForecast(store, as_of, shipments, rates, days_until_stockout, suggested_order)
@@ -0,0 +1,309 @@
+"""Append-only history of inventory snapshots with windowed trend queries.
+
+Each sync appends one point per (product_id, warehouse) series, stamped
+with the row's `last_updated`. On disk a history directory holds:
+
+- history.log     fixed-width little-endian records
+                  (epoch seconds i64, series id u32, quantity i64),
+                  appended and never rewritten
+- series.jsonl    one line per series: id, product_id, warehouse, region
+
+In memory every series keeps its points sorted by time together with
+prefix sums (for least-squares depletion rates) and sparse tables (for
+range min / max), both extended in O(log n) per appended point. A window
+query is then two bisects plus O(1) arithmetic, however many points the
+window spans.
+"""
+
+import json
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.inventory_data import InventoryRecord, InventoryStore
+
+LOG_FILENAME = "history.log"
+SERIES_FILENAME = "series.jsonl"
+_RECORD = struct.Struct("<qIq")  # timestamp, series id, quantity
+_DAY = 86_400
+
+SeriesKey = tuple[str, str]  # (product_id, warehouse)
+
+
+def parse_timestamp(value: str) -> int:
+    """Epoch seconds of an ISO 8601 `last_updated` value (UTC if no offset)."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+@dataclass(frozen=True)
+class WindowStats:
+    """Summary of one series over a time window."""
+    product_id: str
+    warehouse: str
+    region: str
+    points: int
+    start: int                    # epoch seconds of the first point in the window
+    end: int                      # ... and of the last
+    first_qty: int
+    last_qty: int
+    min_qty: int
+    max_qty: int
+    depletion_per_day: float      # least-squares slope, positive while draining
+
+    @property
+    def days_until_stockout(self) -> float | None:
+        """Days until zero at the current rate; None if not draining."""
+        if self.last_qty <= 0:
+            return 0.0
+        if self.depletion_per_day <= 0:
+            return None
+        return self.last_qty / self.depletion_per_day
+
+
+class _Series:
+    __slots__ = ("region", "times", "qty", "_t0", "_sum_t", "_sum_q", "_sum_tt", "_sum_tq",
+                 "_mins", "_maxs")
+
+    def __init__(self, region: str):
+        self.region = region
+        self.times = array("q")
+        self.qty = array("q")
+        self._reset()
+
+    def _reset(self) -> None:
+        self._t0 = self.times[0] if self.times else None
+        self._sum_t, self._sum_q = array("d", [0.0]), array("d", [0.0])
+        self._sum_tt, self._sum_tq = array("d", [0.0]), array("d", [0.0])
+        self._mins: list[array] = [array("q")]
+        self._maxs: list[array] = [array("q")]
+
+    def append(self, timestamp: int, quantity: int) -> None:
+        if self.times and timestamp < self.times[-1]:
+            # Late point: insert in order and rebuild the derived arrays
+            points = list(zip(self.times, self.qty))
+            insort(points, (timestamp, quantity))
+            self.times, self.qty = array("q", (t for t, _ in points)), array("q", (q for _, q in points))
+            self._reset()
+            for t, q in points:
+                self._extend(t, q)
+            return
+        self.times.append(timestamp)
+        self.qty.append(quantity)
+        if self._t0 is None:
+            self._t0 = timestamp
+        self._extend(timestamp, quantity)
+
+    def _extend(self, timestamp: int, quantity: int) -> None:
+        t = (timestamp - self._t0) / _DAY  # days since the first point: keeps sums well-conditioned
+        self._sum_t.append(self._sum_t[-1] + t)
+        self._sum_q.append(self._sum_q[-1] + quantity)
+        self._sum_tt.append(self._sum_tt[-1] + t * t)
+        self._sum_tq.append(self._sum_tq[-1] + t * quantity)
+
+        # Sparse tables: level j holds min / max over [i, i + 2**j)
+        self._mins[0].append(quantity)
+        self._maxs[0].append(quantity)
+        n = len(self._mins[0])
+        level = 1
+        while (1 << level) <= n:
+            if level == len(self._mins):
+                self._mins.append(array("q"))
+                self._maxs.append(array("q"))
+            i, half = n - (1 << level), 1 << (level - 1)
+            self._mins[level].append(min(self._mins[level - 1][i], self._mins[level - 1][i + half]))
+            self._maxs[level].append(max(self._maxs[level - 1][i], self._maxs[level - 1][i + half]))
+            level += 1
+
+    def range_min_max(self, lo: int, hi: int) -> tuple[int, int]:
+        level = (hi - lo).bit_length() - 1
+        other = hi - (1 << level)
+        mins, maxs = self._mins[level], self._maxs[level]
+        return min(mins[lo], mins[other]), max(maxs[lo], maxs[other])
+
+    def slope_per_day(self, lo: int, hi: int) -> float:
+        n = hi - lo
+        if n < 2:
+            return 0.0
+        st = self._sum_t[hi] - self._sum_t[lo]
+        sq = self._sum_q[hi] - self._sum_q[lo]
+        stt = self._sum_tt[hi] - self._sum_tt[lo]
+        stq = self._sum_tq[hi] - self._sum_tq[lo]
+        denominator = n * stt - st * st
+        return (n * stq - st * sq) / denominator if denominator > 1e-12 else 0.0
+
+
+class InventoryHistory:
+    """Append-only store of inventory snapshots, queryable by time window.
+
+    Args:
+        directory: Where history.log / series.jsonl live; created on first
+                   write. None keeps the history in memory only.
+
+    A truncated trailing record (e.g. from a crash mid-write) is cut off
+    the file on load, so later appends stay aligned.
+    """
+
+    def __init__(self, directory: str | Path | None = None):
+        self.directory = Path(directory) if directory is not None else None
+        self._series: dict[SeriesKey, _Series] = {}
+        self._ids: dict[SeriesKey, int] = {}
+        self._keys: dict[int, SeriesKey] = {}  # by the id stored in series.jsonl
+        self._next_id = 0
+        if self.directory is not None:
+            self._read()
+
+    def __len__(self) -> int:
+        return sum(len(series.times) for series in self._series.values())
+
+    def series_keys(self) -> list[SeriesKey]:
+        return list(self._series)
+
+    # -- persistence --------------------------------------------------------
+
+    def _read(self) -> None:
+        series_path = self.directory / SERIES_FILENAME
+        log_path = self.directory / LOG_FILENAME
+        # Either file may be missing on its own (e.g. the log was rotated
+        # away); known series must still be registered, or the next append
+        # would write them all to series.jsonl again
+        lines = series_path.read_bytes() if series_path.exists() else b""
+        data = log_path.read_bytes() if log_path.exists() else b""
+
+        # Cut a torn tail off both files, or the next append would be
+        # written after it and misalign everything that follows
+        complete = lines.rfind(b"\n") + 1
+        if complete < len(lines):
+            os.truncate(series_path, complete)
+        usable = len(data) - len(data) % _RECORD.size
+        if usable < len(data):
+            os.truncate(log_path, usable)
+
+        for line in lines[:complete].decode("utf-8").splitlines():
+            if line.strip():
+                entry = json.loads(line)
+                self._register((entry["product_id"], entry["warehouse"]), entry["region"], entry["id"])
+        for timestamp, series_id, quantity in _RECORD.iter_unpack(data[:usable]):
+            key = self._keys.get(series_id)
+            if key is not None:
+                self._series[key].append(timestamp, quantity)
+
+    def _register(self, key: SeriesKey, region: str, series_id: int | None = None) -> int:
+        if series_id is None:
+            series_id = self._next_id
+        self._next_id = max(self._next_id, series_id + 1)
+        self._keys[series_id] = key
+        # A key listed twice keeps its first id; records under either id
+        # still land in the same series
+        if key not in self._ids:
+            self._ids[key] = series_id
+            self._series[key] = _Series(region)
+        return self._ids[key]
+
+    # -- writing ------------------------------------------------------------
+
+    def append(self, records: "InventoryStore | Iterable[InventoryRecord]") -> int:
+        """Record one snapshot; returns the number of points added.
+
+        Each row is stamped with its own `last_updated`. A row whose
+        series already has a point at that time is skipped, so recording
+        the same sync twice is harmless.
+        """
+        new_series: list[dict] = []
+        packed = bytearray()
+        for rec in records:
+            key = (rec.product_id, rec.warehouse)
+            timestamp = parse_timestamp(rec.last_updated)
+            series_id = self._ids.get(key)
+            if series_id is None:
+                series_id = self._register(key, rec.region)
+                new_series.append({"id": series_id, "product_id": rec.product_id,
+                                   "warehouse": rec.warehouse, "region": rec.region})
+            series = self._series[key]
+            i = bisect_left(series.times, timestamp)
+            if i < len(series.times) and series.times[i] == timestamp:
+                continue
+            series.append(timestamp, rec.quantity)
+            packed += _RECORD.pack(timestamp, series_id, rec.quantity)
+
+        if self.directory is not None and (packed or new_series):
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Series first: a log record never points at an unknown id
+            with open(self.directory / SERIES_FILENAME, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in new_series)
+            with open(self.directory / LOG_FILENAME, "ab") as f:
+                f.write(packed)
+        return len(packed) // _RECORD.size
+
+    # -- queries ------------------------------------------------------------
+
+    def window(
+        self,
+        product_id: str,
+        warehouse: str,
+        days: float,
+        end: int | None = None,
+    ) -> WindowStats | None:
+        """Stats of one series over the `days` before `end`.
+
+        Args:
+            product_id / warehouse: The series.
+            days: Window length.
+            end: Epoch seconds closing the window (inclusive); defaults
+                 to the series' latest point.
+
+        Returns:
+            WindowStats, or None if the window holds no points.
+        """
+        series = self._series.get((product_id, warehouse))
+        if series is None or not series.times:
+            return None
+        times = series.times
+        end = times[-1] if end is None else end
+        lo = bisect_left(times, end - days * _DAY)
+        hi = bisect_right(times, end)
+        if hi <= lo:
+            return None
+        low, high = series.range_min_max(lo, hi)
+        return WindowStats(
+            product_id=product_id,
+            warehouse=warehouse,
+            region=series.region,
+            points=hi - lo,
+            start=times[lo],
+            end=times[hi - 1],
+            first_qty=series.qty[lo],
+            last_qty=series.qty[hi - 1],
+            min_qty=low,
+            max_qty=high,
+            depletion_per_day=-series.slope_per_day(lo, hi),
+        )
+
+    def windows(self, days: float, end: int | None = None) -> list[WindowStats]:
+        """`window()` for every series that has points in range."""
+        stats = (self.window(pid, warehouse, days, end) for pid, warehouse in self._series)
+        return [s for s in stats if s is not None]
+
+    def depletion_rates(self, days: float, end: int | None = None) -> dict[SeriesKey, float]:
+        """Depletion per day of every series with points in range.
+
+        The slope `windows()` reports, without the rest of WindowStats;
+        this is what forecasting reads at each sync.
+        """
+        rates = {}
+        for key, series in self._series.items():
+            times = series.times
+            if not times:
+                continue
+            last = times[-1] if end is None else end
+            lo, hi = bisect_left(times, last - days * _DAY), bisect_right(times, last)
+            if hi > lo:
+                rates[key] = -series.slope_per_day(lo, hi)
+        return rates
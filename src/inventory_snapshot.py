@@ -0,0 +1,241 @@
+"""Binary columnar snapshot of the regional inventory CSVs.
+
+Parsing CSV text and calling `int()` on every field dominates loading
+large extracts. A snapshot stores the already-parsed InventoryStore
+columns so a load is an `mmap` plus a few memoryview casts:
+
+    magic "ZINVSNAP" | version u32 | header length u32 | JSON header | pad
+    column data, each blob 8-byte aligned
+
+The JSON header holds the schema (typecode, offset and length of every
+column), the row count, each region's row range and the fingerprints of
+the CSV files the snapshot was built from. Numeric and code columns are
+fixed-width arrays in native byte order; each text column's string
+table is one UTF-8 blob of its distinct values joined by NUL, so the
+whole table decodes with one `split`; values containing NUL are
+rejected when writing.
+
+Column data is never copied: the returned store's columns are
+read-only memoryviews over the mapping, so worker processes that open
+the same snapshot share its pages through the OS page cache. Only the
+string tables (distinct values) are decoded into Python strings.
+
+Bump SNAPSHOT_VERSION whenever the layout changes.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from src.inventory_data import (
+    InventoryStore,
+    StringTable,
+    inventory_csv_paths,
+    load_inventory_regions,
+)
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILENAME = "inventory.snapshot"
+_MAGIC = b"ZINVSNAP"
+_PREFIX = struct.Struct("<8sII")  # magic, version, header length
+_ALIGN = 8
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a file is not a snapshot this version can read."""
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _sources(data_dir: Path | None) -> dict[str, list[int] | None]:
+    """(mtime_ns, size, inode) of each CSV file, None if missing."""
+    sources = {}
+    for path in inventory_csv_paths(data_dir).values():
+        try:
+            st = path.stat()
+        except OSError:
+            sources[path.name] = None
+            continue
+        sources[path.name] = [st.st_mtime_ns, st.st_size, st.st_ino]
+    return sources
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+def write_inventory_snapshot(
+    data_dir: Path | None = None,
+    path: Path | None = None,
+) -> Path:
+    """Convert the regional CSV files into a binary snapshot.
+
+    Args:
+        data_dir: Directory holding the CSV files (defaults to data/inventory/).
+        path: Output file (defaults to `<data_dir>/inventory.snapshot`).
+
+    Returns:
+        Path of the written snapshot.
+
+    Raises:
+        InventoryLoadError: If any region file is malformed.
+    """
+    csv_dir = next(iter(inventory_csv_paths(data_dir).values())).parent
+    path = path or csv_dir / SNAPSHOT_FILENAME
+    sources = _sources(csv_dir)  # stat before reading, like the report cache
+    loaded = load_inventory_regions(csv_dir, use_snapshot=False)
+    if loaded.errors:
+        raise loaded.errors[0]
+    store = loaded.store
+
+    blobs: list[bytes] = []
+    offset = 0
+
+    def add(data: bytes) -> dict:
+        nonlocal offset
+        start = _aligned(offset)
+        blobs.append(b"\0" * (start - offset) + data)
+        offset = start + len(data)
+        return {"offset": start, "length": len(data)}
+
+    columns = {
+        name: {"typecode": column.typecode, **add(column.tobytes())}
+        for name, column in store.codes.items()
+    }
+    columns["quantity"] = {"typecode": "q", **add(store.quantity.tobytes())}
+    columns["reorder_point"] = {"typecode": "q", **add(store.reorder_point.tobytes())}
+
+    strings = {}
+    for name, table in store.tables.items():
+        if any("\0" in value for value in table.values):
+            raise ValueError(f"NUL character in {name} values")
+        strings[name] = {
+            "count": len(table),
+            **add("\0".join(table.values).encode("utf-8")),
+        }
+
+    header = json.dumps({
+        "byteorder": sys.byteorder,
+        "rows": len(store),
+        "regions": {
+            region: [rows.start, rows.stop]
+            for region, rows in store.region_rows().items()
+        },
+        "sources": sources,
+        "columns": columns,
+        "strings": strings,
+    }, ensure_ascii=False).encode("utf-8")
+
+    data_start = _aligned(_PREFIX.size + len(header))
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_PREFIX.pack(_MAGIC, SNAPSHOT_VERSION, len(header)))
+        f.write(header)
+        f.write(b"\0" * (data_start - _PREFIX.size - len(header)))
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)  # readers never see a half-written snapshot
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+def _read_header(mm: mmap.mmap) -> tuple[dict, int]:
+    if len(mm) < _PREFIX.size:
+        raise SnapshotFormatError("file too short")
+    magic, version, header_len = _PREFIX.unpack_from(mm, 0)
+    if magic != _MAGIC:
+        raise SnapshotFormatError("not an inventory snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotFormatError(f"snapshot version {version}, expected {SNAPSHOT_VERSION}")
+    header = json.loads(mm[_PREFIX.size:_PREFIX.size + header_len].decode("utf-8"))
+    return header, _aligned(_PREFIX.size + header_len)
+
+
+def _column(mm: mmap.mmap, data_start: int, spec: dict, native: bool):
+    start = data_start + spec["offset"]
+    view = memoryview(mm)[start:start + spec["length"]]
+    if native:
+        return view.cast(spec["typecode"])
+    column = array(spec["typecode"], view)  # foreign byte order: copy and swap
+    column.byteswap()
+    return column
+
+
+def _string_table(mm: mmap.mmap, data_start: int, spec: dict) -> StringTable:
+    start = data_start + spec["offset"]
+    values = mm[start:start + spec["length"]].decode("utf-8").split("\0") if spec["count"] else []
+    if len(values) != spec["count"]:
+        raise SnapshotFormatError("string table size mismatch")
+    return StringTable.from_values(values)
+
+
+def _open(path: Path) -> tuple[mmap.mmap, dict, int]:
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        header, data_start = _read_header(mm)
+    except Exception:
+        mm.close()
+        raise
+    return mm, header, data_start
+
+
+def _store(mm: mmap.mmap, header: dict, data_start: int) -> InventoryStore:
+    native = header["byteorder"] == sys.byteorder
+    columns = {
+        name: _column(mm, data_start, spec, native)
+        for name, spec in header["columns"].items()
+    }
+    tables = {
+        name: _string_table(mm, data_start, spec)
+        for name, spec in header["strings"].items()
+    }
+    quantity = columns.pop("quantity")
+    reorder_point = columns.pop("reorder_point")
+    region_rows = {region: range(start, stop) for region, (start, stop) in header["regions"].items()}
+    # The memoryviews keep the mapping alive for as long as the store is used
+    return InventoryStore.from_columns(tables, columns, quantity, reorder_point, region_rows)
+
+
+def load_inventory_snapshot(path: Path) -> InventoryStore:
+    """Open a snapshot as a read-only, memory-mapped InventoryStore.
+
+    Args:
+        path: Snapshot written by `write_inventory_snapshot`.
+
+    Returns:
+        InventoryStore sorted by region then product_id, whose columns
+        are memoryviews over the mapped file.
+
+    Raises:
+        SnapshotFormatError: If the file is not a readable snapshot.
+        OSError: If the file cannot be opened.
+    """
+    return _store(*_open(path))
+
+
+def open_fresh_snapshot(data_dir: Path | None = None) -> InventoryStore | None:
+    """The snapshot next to the CSV files, if it was built from their current state.
+
+    Returns None when there is no snapshot, it cannot be read, or any
+    CSV file was changed, added or removed since it was written.
+    """
+    sources = _sources(data_dir)
+    path = next(iter(inventory_csv_paths(data_dir).values())).parent / SNAPSHOT_FILENAME
+    try:
+        mm, header, data_start = _open(path)
+    except (OSError, ValueError):  # missing, SnapshotFormatError, bad JSON
+        return None
+    if header.get("sources") != sources:
+        mm.close()
+        return None
+    return _store(mm, header, data_start)
@@ -0,0 +1,86 @@
+"""Aho-Corasick multi-pattern matcher for routing keywords.
+
+Compiles a set of keywords once into a trie with failure links so that
+every keyword occurring in an input string (including overlapping and
+nested hits, e.g. "log" inside "logistics") is found in a single pass.
+Works on arbitrary Unicode, so mixed CJK / Latin keywords share one
+automaton.
+"""
+
+from collections.abc import Iterable
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over a fixed list of patterns.
+
+    Pattern ids are the positions of the patterns in the list passed to
+    the constructor. Matching is case-sensitive; callers normalize both
+    the patterns and the input (the router lowercases both).
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: tuple[str, ...] = tuple(patterns)
+
+        # Node 0 is the root. `_goto[n]` maps a character to the child node.
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Pattern ids ending exactly at each node (before following fail links)
+        self._out: list[tuple[int, ...]] = [()]
+
+        terminal: dict[int, list[int]] = {}
+        for pattern_id, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            terminal.setdefault(node, []).append(pattern_id)
+
+        for node, ids in terminal.items():
+            self._out[node] = tuple(ids)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        """Breadth-first pass computing failure links and merged outputs."""
+        queue: list[int] = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                # Inherit outputs of the failure target so a single lookup
+                # per character yields every pattern ending at that position.
+                if self._out[self._fail[child]]:
+                    self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def find_all(self, text: str) -> set[int]:
+        """Return the ids of all patterns that occur anywhere in `text`."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        found: set[int] = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
@@ -4,10 +4,24 @@ Routes user intents to the appropriate specialized agent based on
 keyword matching and intent classification.
 """
 
-from dataclasses import dataclass
+import asyncio
+import json
+import threading
+import time
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
+from types import MappingProxyType
+from typing import Protocol
+
+import yaml
 
 from src.agents import AgentDefinition, AGENT_REGISTRY, get_agent
+from src.exceptions import RoutingRulesError
+from src.keyword_automaton import KeywordAutomaton
 
 
 class IntentCategory(Enum):
@@ -117,41 +131,520 @@ ROUTING_RULES: list[RoutingRule] = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# External rules file — JSON or YAML, hot-reloadable
+# ---------------------------------------------------------------------------
+
+def load_rules_file(path: str | Path) -> list[RoutingRule]:
+    """Load routing rules from a JSON or YAML file.
+
+    The file holds either a list of rules or a mapping with a `rules`
+    list. Each rule has `intent` (an IntentCategory value), `agent_name`,
+    `keywords` and an optional `description`:
+
+        rules:
+          - intent: inventory_query
+            agent_name: inventory-agent
+            keywords: [庫存, stock, inventory]
+            description: Query inventory status across regions
+
+    Raises:
+        RoutingRulesError: If the file is unreadable or a rule is invalid.
+    """
+    path = Path(path)
+    try:
+        text = path.read_text(encoding="utf-8")
+        data = json.loads(text) if path.suffix == ".json" else yaml.safe_load(text)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        raise RoutingRulesError(str(path), str(e)) from e
+
+    if isinstance(data, dict):
+        data = data.get("rules")
+    if not isinstance(data, list) or not data:
+        raise RoutingRulesError(str(path), "expected a non-empty list of rules")
+
+    agent_names = {a.name for a in AGENT_REGISTRY}
+    rules: list[RoutingRule] = []
+    for i, entry in enumerate(data):
+        if not isinstance(entry, dict):
+            raise RoutingRulesError(str(path), f"rule #{i} is not a mapping")
+        try:
+            intent = IntentCategory(entry["intent"])
+            agent_name = entry["agent_name"]
+            keywords = entry["keywords"]
+        except KeyError as e:
+            raise RoutingRulesError(str(path), f"rule #{i} is missing {e}") from e
+        except ValueError as e:
+            raise RoutingRulesError(str(path), f"rule #{i}: {e}") from e
+        if agent_name not in agent_names:
+            raise RoutingRulesError(str(path), f"rule #{i} references unknown agent '{agent_name}'")
+        if not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords):
+            raise RoutingRulesError(str(path), f"rule #{i} keywords must be a list of strings")
+        rules.append(RoutingRule(
+            intent=intent,
+            agent_name=agent_name,
+            keywords=keywords,
+            description=entry.get("description", ""),
+        ))
+    return rules
+
+
+def dump_rules_file(rules: Iterable[RoutingRule], path: str | Path) -> None:
+    """Write rules in the format read by `load_rules_file` (JSON or YAML by suffix)."""
+    path = Path(path)
+    data = {"rules": [
+        {
+            "intent": r.intent.value,
+            "agent_name": r.agent_name,
+            "keywords": list(r.keywords),
+            "description": r.description,
+        }
+        for r in rules
+    ]}
+    if path.suffix == ".json":
+        text = json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+    else:
+        text = yaml.safe_dump(data, allow_unicode=True, sort_keys=False)
+    path.write_text(text, encoding="utf-8")
+
+
+class RulesFileWatcher:
+    """Polls a rules file and hot-swaps a router's rules when it changes.
+
+    Changes are detected by (mtime, size). On change the file is parsed
+    and a new routing index compiled on the watcher thread; the router
+    keeps serving the old index until the new one is published with
+    `FoundryRouter.rebuild`, so routing is never blocked. An invalid file
+    is reported and ignored — the last good rule set stays active.
+    """
+
+    def __init__(self, router: "FoundryRouter", path: str | Path, interval: float = 2.0):
+        self.router = router
+        self.path = Path(path)
+        self.interval = interval
+        self.reloads = 0
+        self.last_error: RoutingRulesError | None = None
+        self._signature: tuple[int, int] | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _stat_signature(self) -> tuple[int, int] | None:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def check(self) -> bool:
+        """Reload the rules if the file changed since the last check.
+
+        Returns:
+            True if a new rule set was swapped in.
+        """
+        signature = self._stat_signature()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            rules = load_rules_file(self.path)
+        except RoutingRulesError as e:
+            self.last_error = e
+            print(f"  ⚠️ [ROUTER] {e} — keeping previous rules")
+            return False
+        self.router.rebuild(rules)
+        self.last_error = None
+        self.reloads += 1
+        return True
+
+    def start(self) -> "RulesFileWatcher":
+        """Load the file now, then keep polling on a daemon thread."""
+        self.check()
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=f"rules-watcher:{self.path.name}", daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+
+class IntentClassifier(Protocol):
+    """Pluggable classification backend for FoundryRouter.
+
+    See src/classifiers.py for implementations.
+    """
+
+    def classify(self, user_input: str) -> tuple[IntentCategory, float]:
+        ...
+
+
+# ---------------------------------------------------------------------------
+# Intent dependencies — which intents consume the output of others when a
+# single message asks for several things. Used to build multi-intent plans.
+# ---------------------------------------------------------------------------
+_DATA_GATHERING_INTENTS = (
+    IntentCategory.INVENTORY_QUERY,
+    IntentCategory.KNOWLEDGE_SEARCH,
+    IntentCategory.BUG_FIX,
+    IntentCategory.EXTERNAL_SEARCH,
+    IntentCategory.LOGISTICS_TRACK,
+    IntentCategory.SYSTEM_HEALTH,
+)
+
+INTENT_DEPENDENCIES: dict[IntentCategory, tuple[IntentCategory, ...]] = {
+    # A report summarizes whatever the other agents found
+    IntentCategory.INCIDENT_REPORT: _DATA_GATHERING_INTENTS,
+    # The follow-up meeting is scheduled around the report
+    IntentCategory.MEETING_BOOKING: (IntentCategory.INCIDENT_REPORT,),
+}
+
+
+@dataclass
+class IntentMatch:
+    """One intent detected in a multi-intent message."""
+    intent: IntentCategory
+    agent: AgentDefinition | None
+    confidence: float
+    hits: int
+
+
+@dataclass
+class RoutingPlan:
+    """Ranked intents of one message plus a parallel execution plan.
+
+    `matches` is ranked by keyword hits (ties in rule order). `stages`
+    groups the same matches into steps: everything within a stage is
+    independent and can be dispatched concurrently; a stage starts only
+    after the previous one finished.
+    """
+    matches: list[IntentMatch] = field(default_factory=list)
+    stages: list[list[IntentMatch]] = field(default_factory=list)
+
+    @property
+    def primary(self) -> IntentMatch | None:
+        return self.matches[0] if self.matches else None
+
+    @property
+    def is_parallel(self) -> bool:
+        return any(len(stage) > 1 for stage in self.stages)
+
+
+@dataclass
+class Disagreement:
+    """A message on which the secondary classifier disagreed with the primary."""
+    user_input: str
+    primary_intent: IntentCategory
+    primary_confidence: float
+    secondary_intent: IntentCategory
+    secondary_confidence: float
+    secondary_latency_ms: float
+    within_budget: bool
+
+
+@dataclass
+class RoutingBatch:
+    """Routing results for a batch of inputs, as parallel arrays.
+
+    `agents[i]`, `intents[i]` and `confidences[i]` describe `inputs[i]`.
+    """
+    agents: list[AgentDefinition | None] = field(default_factory=list)
+    intents: list[IntentCategory] = field(default_factory=list)
+    confidences: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.intents)
+
+    def __iter__(self) -> Iterator[tuple[AgentDefinition | None, IntentCategory, float]]:
+        return zip(self.agents, self.intents, self.confidences)
+
+
+@dataclass
+class CacheStats:
+    """Counters reported by the routing decision cache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    maxsize: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _RoutingCache:
+    """Size-bounded LRU cache of routing decisions.
+
+    Keys are normalized (lowercased) inputs — the only form of the input
+    the keyword classifier looks at. Values are mutable
+    `[agent, intent, confidence, explanation]` entries; the explanation
+    is filled in lazily by `route_with_explanation`.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, list] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> list | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: list) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+        )
+
+
+@dataclass(frozen=True)
+class _RoutingIndex:
+    """Immutable lookup tables compiled from one rule set.
+
+    Built once per rule set and swapped in as a whole by
+    `FoundryRouter.rebuild`, so a routing call that grabbed a reference
+    to an index keeps a consistent view even if a rebuild happens
+    concurrently. Each index owns its own decision cache, which keeps
+    decisions made under an old rule set from being served afterwards.
+    """
+    rules: tuple[RoutingRule, ...]
+    automaton: KeywordAutomaton
+    pattern_intents: tuple[tuple[int, ...], ...]  # pattern id → intent indexes
+    intents: tuple[IntentCategory, ...]           # intent index → intent, rule order
+    rule_by_intent: MappingProxyType               # IntentCategory → first RoutingRule
+    agent_by_intent: MappingProxyType              # IntentCategory → AgentDefinition | None
+    max_keywords: int                              # confidence normalization constant
+    cache: _RoutingCache | None = None
+
+    @classmethod
+    def build(
+        cls,
+        rules: Iterable[RoutingRule],
+        agents: dict[str, AgentDefinition],
+        cache: _RoutingCache | None = None,
+    ) -> "_RoutingIndex":
+        """Compile every rule keyword into one automaton plus lookup tables.
+
+        Each distinct lowercased keyword becomes one pattern; the pattern
+        remembers which intents it counts towards (once per occurrence in
+        a rule's keyword list, matching the original per-rule scan).
+        """
+        rules = tuple(rules)
+        pattern_ids: dict[str, int] = {}
+        pattern_intents: list[list[int]] = []
+        intent_index: dict[IntentCategory, int] = {}
+        rule_by_intent: dict[IntentCategory, RoutingRule] = {}
+        for rule in rules:
+            # Intents are numbered in rule order; ties resolve to the first rule
+            idx = intent_index.setdefault(rule.intent, len(intent_index))
+            rule_by_intent.setdefault(rule.intent, rule)
+            for kw in rule.keywords:
+                kw_lower = kw.lower()
+                if not kw_lower:
+                    continue
+                pid = pattern_ids.get(kw_lower)
+                if pid is None:
+                    pid = pattern_ids[kw_lower] = len(pattern_intents)
+                    pattern_intents.append([])
+                pattern_intents[pid].append(idx)
+
+        return cls(
+            rules=rules,
+            automaton=KeywordAutomaton(pattern_ids),
+            pattern_intents=tuple(tuple(idxs) for idxs in pattern_intents),
+            intents=tuple(intent_index),
+            rule_by_intent=MappingProxyType(rule_by_intent),
+            agent_by_intent=MappingProxyType({
+                intent: agents.get(rule.agent_name)
+                for intent, rule in rule_by_intent.items()
+            }),
+            max_keywords=max((len(r.keywords) for r in rules), default=0),
+            cache=cache,
+        )
+
+    def hit_vector(self, user_lower: str) -> list[int]:
+        """Keyword hit counts per intent index for a lowercased input."""
+        vector = [0] * len(self.intents)
+        pattern_intents = self.pattern_intents
+        for pid in self.automaton.find_all(user_lower):
+            for idx in pattern_intents[pid]:
+                vector[idx] += 1
+        return vector
+
+    def confidence(self, hits: int) -> float:
+        return min(hits / self.max_keywords * 2, 1.0)
+
+
 class FoundryRouter:
     """Foundry Agent — routes user input to specialized agents.
 
     Implements keyword-based intent recognition and agent dispatching.
     In production, this would use an LLM for intent classification.
+
+    Keywords of all rules are compiled once into a single Aho-Corasick
+    automaton, together with intent → rule / agent tables and the
+    confidence normalization constant. `rebuild()` (or assigning to
+    `rules`) compiles a fresh index and swaps it in with one attribute
+    assignment, so concurrent routing never sees a half-updated state.
+
+    Pass `cache_size > 0` to enable an LRU cache of routing decisions
+    (and their explanations) keyed on the lowercased input. The cache is
+    emptied whenever `rules` changes.
+
+    Pass a `classifier` (e.g. `BM25Classifier`) to replace keyword
+    counting in `classify_intent` / `route`; the rules still decide
+    which agent serves the chosen intent. `score_intents` and
+    `route_multi` always use the keyword index.
+
+    Pass a `secondary` classifier to trial it from `route_async`: it runs
+    concurrently with the primary path under a `secondary_timeout`
+    latency budget (seconds), and every disagreement is recorded in
+    `disagreements`. In `shadow` mode (the default) the primary result is
+    always returned; otherwise the secondary result wins when it arrives
+    within budget.
     """
 
-    def __init__(self):
-        self.rules = ROUTING_RULES
+    def __init__(
+        self,
+        rules: list[RoutingRule] | None = None,
+        cache_size: int = 0,
+        classifier: IntentClassifier | None = None,
+        secondary: IntentClassifier | None = None,
+        secondary_timeout: float = 0.05,
+        shadow: bool = True,
+        max_disagreements: int = 1000,
+    ):
         self.agents = {a.name: a for a in AGENT_REGISTRY}
+        self.classifier = classifier
+        self.secondary = secondary
+        self.secondary_timeout = secondary_timeout
+        self.shadow = shadow
+        self.disagreements: deque[Disagreement] = deque(maxlen=max_disagreements)
+        self.secondary_timeouts = 0
+        self._cache_size = cache_size
+        self._index: _RoutingIndex | None = None
+        self.rebuild(ROUTING_RULES if rules is None else rules)
+
+    @property
+    def rules(self) -> tuple[RoutingRule, ...]:
+        """The compiled rule set, read-only.
+
+        Assign a new list (or call `rebuild()`) to change it; the tuple
+        makes in-place edits such as `router.rules.append(...)` fail
+        instead of being silently ignored.
+        """
+        return self._index.rules
 
-    def classify_intent(self, user_input: str) -> tuple[IntentCategory, float]:
-        """Classify user intent based on keyword matching.
+    @rules.setter
+    def rules(self, rules: list[RoutingRule]) -> None:
+        self.rebuild(rules)
+
+    def rebuild(self, rules: Iterable[RoutingRule] | None = None) -> None:
+        """Recompile the routing index and swap it in atomically.
+
+        Args:
+            rules: New rule set, or None to recompile the current rules
+                   (e.g. after `agents` changed).
+        """
+        if rules is None:
+            rules = self._index.rules
+        cache = None
+        if self._cache_size > 0:
+            cache = _RoutingCache(self._cache_size)
+            previous = self._index.cache if self._index else None
+            if previous is not None:
+                cache.hits, cache.misses, cache.evictions = (
+                    previous.hits, previous.misses, previous.evictions,
+                )
+        self._index = _RoutingIndex.build(rules, self.agents, cache)
+
+    @classmethod
+    def from_rules_file(cls, path: str | Path, **kwargs) -> "FoundryRouter":
+        """Create a router whose rules come from a JSON / YAML file."""
+        return cls(rules=load_rules_file(path), **kwargs)
+
+    def watch_rules(self, path: str | Path, interval: float = 2.0) -> RulesFileWatcher:
+        """Load rules from `path` and hot-reload them whenever it changes.
 
         Returns:
-            Tuple of (intent category, confidence score 0-1)
+            The started watcher; call `stop()` on it to stop polling.
         """
-        user_lower = user_input.lower()
-        scores: dict[IntentCategory, int] = {}
+        return RulesFileWatcher(self, path, interval).start()
 
-        for rule in self.rules:
-            match_count = sum(
-                1 for kw in rule.keywords if kw.lower() in user_lower
-            )
-            if match_count > 0:
-                scores[rule.intent] = match_count
+    def clear_cache(self) -> None:
+        """Drop all cached routing decisions (counters are kept)."""
+        if self._index.cache is not None:
+            self._index.cache.clear()
 
-        if not scores:
-            return IntentCategory.UNKNOWN, 0.0
+    def cache_stats(self) -> CacheStats:
+        """Return hit / miss / eviction counters of the decision cache.
+
+        A router created without a cache reports all-zero stats.
+        """
+        if self._index.cache is None:
+            return CacheStats()
+        return self._index.cache.stats()
+
+    def score_intents(self, user_input: str) -> dict[IntentCategory, int]:
+        """Count keyword hits per intent in a single pass over the input.
+
+        Returns:
+            Mapping of intent → number of matched keywords, containing only
+            intents with at least one hit, in rule order.
+        """
+        index = self._index
+        vector = index.hit_vector(user_input.lower())
+        return {index.intents[i]: n for i, n in enumerate(vector) if n}
 
-        best_intent = max(scores, key=lambda k: scores[k])
-        max_keywords = max(len(r.keywords) for r in self.rules)
-        confidence = min(scores[best_intent] / max_keywords * 2, 1.0)
+    def classify_intent(self, user_input: str) -> tuple[IntentCategory, float]:
+        """Classify user intent based on keyword matching.
 
-        return best_intent, confidence
+        Returns:
+            Tuple of (intent category, confidence score 0-1)
+        """
+        if self.classifier is not None:
+            return self.classifier.classify(user_input)
+        return self._classify(self._index, user_input)
+
+    @staticmethod
+    def _classify(index: _RoutingIndex, user_input: str) -> tuple[IntentCategory, float]:
+        vector = index.hit_vector(user_input.lower())
+        best = max(vector, default=0)
+        if best == 0:
+            return IntentCategory.UNKNOWN, 0.0
+        # list.index picks the first maximum, i.e. the earliest rule wins ties
+        return index.intents[vector.index(best)], index.confidence(best)
 
     def route(self, user_input: str) -> tuple[AgentDefinition | None, IntentCategory, float]:
         """Route user input to the appropriate agent.
@@ -159,22 +652,188 @@ class FoundryRouter:
         Returns:
             Tuple of (agent definition, intent, confidence)
         """
-        intent, confidence = self.classify_intent(user_input)
+        agent, intent, confidence, _ = self._cached_route(user_input)
+        return agent, intent, confidence
+
+    async def route_async(
+        self, user_input: str, timeout: float | None = None,
+    ) -> tuple[AgentDefinition | None, IntentCategory, float]:
+        """Route from inside an event loop, optionally trialling `secondary`.
+
+        The secondary classifier is started on a worker thread, then the
+        primary (keyword / `classifier`) route is computed. The secondary
+        result is awaited for at most `timeout` seconds (default
+        `secondary_timeout`); if it misses the budget the primary result
+        is returned and the secondary keeps running in the background so
+        its disagreement is still recorded.
+
+        Returns:
+            Tuple of (agent definition, intent, confidence), as `route`.
+        """
+        if self.secondary is None:
+            return self.route(user_input)
+
+        index = self._index
+        budget = self.secondary_timeout if timeout is None else timeout
+        started = time.perf_counter()
+        task = asyncio.ensure_future(asyncio.to_thread(self.secondary.classify, user_input))
+        primary = self.route(user_input)
+
+        def record(done: asyncio.Future, within_budget: bool) -> None:
+            if done.cancelled() or done.exception() is not None:
+                return
+            intent, confidence = done.result()
+            if intent != primary[1]:
+                self.disagreements.append(Disagreement(
+                    user_input=user_input,
+                    primary_intent=primary[1],
+                    primary_confidence=primary[2],
+                    secondary_intent=intent,
+                    secondary_confidence=confidence,
+                    secondary_latency_ms=(time.perf_counter() - started) * 1e3,
+                    within_budget=within_budget,
+                ))
+
+        try:
+            await asyncio.wait_for(asyncio.shield(task), budget)
+        except asyncio.TimeoutError:
+            self.secondary_timeouts += 1
+            task.add_done_callback(lambda done: record(done, within_budget=False))
+            return primary
+        except Exception:
+            # A failing trial classifier must never break routing
+            return primary
+
+        record(task, within_budget=True)
+        if self.shadow:
+            return primary
+
+        intent, confidence = task.result()
+        if intent == IntentCategory.UNKNOWN:
+            return None, intent, confidence
+        return index.agent_by_intent.get(intent), intent, confidence
+
+    def dump_disagreements(self, path: str | Path) -> int:
+        """Append recorded disagreements to a JSONL file and clear them.
+
+        Returns:
+            Number of records written.
+        """
+        records = list(self.disagreements)
+        self.disagreements.clear()
+        with open(path, "a", encoding="utf-8") as f:
+            for d in records:
+                f.write(json.dumps({
+                    "input": d.user_input,
+                    "primary": d.primary_intent.value,
+                    "primary_confidence": round(d.primary_confidence, 4),
+                    "secondary": d.secondary_intent.value,
+                    "secondary_confidence": round(d.secondary_confidence, 4),
+                    "secondary_latency_ms": round(d.secondary_latency_ms, 3),
+                    "within_budget": d.within_budget,
+                }, ensure_ascii=False) + "\n")
+        return len(records)
+
+    def _cached_route(self, user_input: str) -> list:
+        """Return the `[agent, intent, confidence, explanation]` entry for an input."""
+        index = self._index
+        if index.cache is None:
+            return [*self._route_uncached(index, user_input), None]
+
+        key = self._input_key(user_input)
+        entry = index.cache.get(key)
+        if entry is None:
+            entry = [*self._route_uncached(index, user_input), None]
+            index.cache.put(key, entry)
+        return entry
+
+    def _input_key(self, user_input: str) -> str:
+        """Key under which equivalent inputs share one routing result.
+
+        Keyword routing ignores case; a classifier backend may not, so it
+        only shares results between identical strings.
+        """
+        return user_input.lower() if self.classifier is None else user_input
+
+    def _route_uncached(
+        self, index: _RoutingIndex, user_input: str,
+    ) -> tuple[AgentDefinition | None, IntentCategory, float]:
+        if self.classifier is not None:
+            intent, confidence = self.classifier.classify(user_input)
+        else:
+            intent, confidence = self._classify(index, user_input)
 
         if intent == IntentCategory.UNKNOWN:
             return None, intent, confidence
 
-        # Find the matching rule's agent
-        for rule in self.rules:
-            if rule.intent == intent:
-                agent = self.agents.get(rule.agent_name)
-                return agent, intent, confidence
+        return index.agent_by_intent.get(intent), intent, confidence
+
+    def route_multi(self, user_input: str, threshold: float = 0.0) -> RoutingPlan:
+        """Route a message that may ask for several things at once.
+
+        Unlike `route`, every intent whose confidence reaches `threshold`
+        is kept. The returned plan orders them into stages using
+        `INTENT_DEPENDENCIES`; intents handled by the same agent are never
+        placed in the same stage.
 
-        return None, intent, confidence
+        Args:
+            user_input: The user's message.
+            threshold: Minimum confidence (0-1) for an intent to be kept.
+
+        Returns:
+            RoutingPlan — empty if no intent matched.
+        """
+        index = self._index
+        vector = index.hit_vector(user_input.lower())
+        matches = [
+            IntentMatch(
+                intent=intent,
+                agent=index.agent_by_intent.get(intent),
+                confidence=index.confidence(hits),
+                hits=hits,
+            )
+            for intent, hits in zip(index.intents, vector)
+            if hits and index.confidence(hits) >= threshold
+        ]
+        # Stable sort keeps rule order among equal hit counts
+        matches.sort(key=lambda m: m.hits, reverse=True)
+        return RoutingPlan(matches=matches, stages=self._plan_stages(matches))
+
+    @staticmethod
+    def _plan_stages(matches: list[IntentMatch]) -> list[list[IntentMatch]]:
+        """Layer matches so dependencies run first and agents are not reused."""
+        selected = {m.intent: m for m in matches}
+
+        depth: dict[IntentCategory, int] = {}
+
+        def depth_of(intent: IntentCategory) -> int:
+            if intent not in depth:
+                deps = [d for d in INTENT_DEPENDENCIES.get(intent, ()) if d in selected]
+                depth[intent] = max((depth_of(d) + 1 for d in deps), default=0)
+            return depth[intent]
+
+        rank = {m.intent: i for i, m in enumerate(matches)}
+        ordered = sorted(matches, key=lambda m: (depth_of(m.intent), rank[m.intent]))
+
+        placed: dict[IntentCategory, int] = {}
+        stages: list[list[IntentMatch]] = []
+        for match in ordered:
+            deps = [d for d in INTENT_DEPENDENCIES.get(match.intent, ()) if d in placed]
+            stage = max((placed[d] + 1 for d in deps), default=0)
+            while stage < len(stages) and any(
+                m.agent is not None and m.agent is match.agent for m in stages[stage]
+            ):
+                stage += 1
+            if stage == len(stages):
+                stages.append([])
+            stages[stage].append(match)
+            placed[match.intent] = stage
+        return stages
 
     def route_with_explanation(self, user_input: str) -> str:
         """Route and return a human-readable explanation."""
-        agent, intent, confidence = self.route(user_input)
+        entry = self._cached_route(user_input)
+        agent, intent, confidence, explanation = entry
 
         if agent is None:
             return (
@@ -183,14 +842,94 @@ class FoundryRouter:
                 f"  Suggestion: Please try a more specific description"
             )
 
-        return (
-            f"🔀 Routing Result\n"
-            f"  Intent: {intent.value}\n"
-            f"  Confidence: {confidence:.0%}\n"
-            f"  Target Agent: {agent.category_icon} {agent.display_name}\n"
-            f"  Permission: {agent.permission_icon} {agent.permission.value}\n"
-            f"  MCP: {agent.mcp_connector or '(direct access)'}"
-        )
+        if explanation is None:
+            explanation = entry[3] = (
+                f"🔀 Routing Result\n"
+                f"  Intent: {intent.value}\n"
+                f"  Confidence: {confidence:.0%}\n"
+                f"  Target Agent: {agent.category_icon} {agent.display_name}\n"
+                f"  Permission: {agent.permission_icon} {agent.permission.value}\n"
+                f"  MCP: {agent.mcp_connector or '(direct access)'}"
+            )
+        return explanation
+
+    def route_batch(self, inputs: Iterable[str]) -> RoutingBatch:
+        """Route many inputs at once, e.g. when replaying chat transcripts.
+
+        Each input is scanned once by the keyword automaton; its hits are
+        accumulated into a dense per-intent score vector using the
+        pattern-by-intent incidence rows built at compile time. The whole
+        batch is scored against one index snapshot (or by the classifier
+        backend, if one is set), and identical inputs are scored only once
+        (compared after lowercasing unless a classifier is set, which
+        always sees the original text).
+
+        Returns:
+            RoutingBatch with parallel agent / intent / confidence arrays,
+            identical to calling `route()` on each input.
+        """
+        index = self._index
+        batch = RoutingBatch()
+        seen: dict[str, tuple[AgentDefinition | None, IntentCategory, float]] = {}
+        for user_input in inputs:
+            key = self._input_key(user_input)
+            result = seen.get(key)
+            if result is None:
+                result = seen[key] = self._route_uncached(index, user_input)
+
+            batch.agents.append(result[0])
+            batch.intents.append(result[1])
+            batch.confidences.append(result[2])
+        return batch
+
+    def route_transcript(
+        self,
+        source: str | Path,
+        destination: str | Path,
+        text_field: str = "text",
+        batch_size: int = 1000,
+    ) -> int:
+        """Stream a JSONL transcript through the router.
+
+        Reads `source` one line at a time, routes records in batches of
+        `batch_size` and appends each record — extended with `agent`,
+        `intent` and `confidence` keys — to `destination` as JSONL. Only
+        one batch is held in memory at a time.
+
+        Args:
+            source: JSONL file, one JSON object per line.
+            destination: Output JSONL file (overwritten).
+            text_field: Key holding the user utterance in each record.
+            batch_size: Number of records routed per batch.
+
+        Returns:
+            Number of records written.
+        """
+        written = 0
+        with open(source, encoding="utf-8") as src, \
+                open(destination, "w", encoding="utf-8") as dst:
+            pending: list[dict] = []
+            for line in src:
+                if not line.strip():
+                    continue
+                pending.append(json.loads(line))
+                if len(pending) >= batch_size:
+                    written += self._write_routed(pending, text_field, dst)
+                    pending = []
+            if pending:
+                written += self._write_routed(pending, text_field, dst)
+        return written
+
+    def _write_routed(self, records: list[dict], text_field: str, dst) -> int:
+        """Route one batch of transcript records and append them to `dst`."""
+        batch = self.route_batch(str(r.get(text_field) or "") for r in records)
+        for record, (agent, intent, confidence) in zip(records, batch):
+            record["agent"] = agent.name if agent else None
+            record["intent"] = intent.value
+            record["confidence"] = round(confidence, 4)
+            dst.write(json.dumps(record, ensure_ascii=False) + "\n")
+        dst.flush()
+        return len(records)
 
 
 # Module-level singleton
@@ -205,3 +944,22 @@ def route_intent(user_input: str) -> tuple[AgentDefinition | None, IntentCategor
 def explain_routing(user_input: str) -> str:
     """Convenience function to get routing explanation."""
     return _router.route_with_explanation(user_input)
+
+
+def enable_routing_cache(maxsize: int = 1024) -> None:
+    """Opt the module-level router into an LRU decision cache.
+
+    Pass `maxsize=0` to turn caching off again.
+    """
+    _router._cache_size = maxsize
+    _router.rebuild()
+
+
+def routing_cache_stats() -> CacheStats:
+    """Cache counters of the module-level router."""
+    return _router.cache_stats()
+
+
+def watch_routing_rules(path: str | Path, interval: float = 2.0) -> RulesFileWatcher:
+    """Hot-reload the module-level router's rules from a JSON / YAML file."""
+    return _router.watch_rules(path, interval)
@@ -0,0 +1,110 @@
+"""Persistent cache of parsed SKILL.md files.
+
+Parsing a skill (a line scan over the whole document plus
+`yaml.safe_load`) costs far more than checking whether the file changed.
+The cache stores each parsed Skill in a single pickle file, keyed by the
+SKILL.md path and validated by its mtime, size and content hash:
+
+1. (mtime, size) unchanged → reuse without reading the file.
+2. Otherwise read the file; same SHA-256 as before → reuse (e.g. after
+   a `git checkout` touched the mtime) and refresh the stored stat.
+3. Otherwise parse and store the new result.
+
+Bump CACHE_VERSION whenever the parser output changes.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CACHE_VERSION = 2
+CACHE_FILENAME = "skills.pickle"
+LAZY_CACHE_FILENAME = "skills-lazy.pickle"  # skills without response bodies
+
+
+@dataclass
+class _CacheEntry:
+    mtime_ns: int
+    size: int
+    sha256: str
+    skill: Any
+
+
+class SkillCache:
+    """Compiled skill cache stored as `<cache_dir>/<filename>`.
+
+    A missing, unreadable or version-mismatched cache file is treated as
+    empty. Entries for SKILL.md files not seen during a load are dropped
+    on `save()`. `load()` may be called from several threads at once;
+    parsing runs outside the lock.
+    """
+
+    def __init__(self, cache_dir: str | Path, filename: str = CACHE_FILENAME):
+        self.path = Path(cache_dir) / filename
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, _CacheEntry] = self._read()
+        self._seen: set[str] = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict[str, _CacheEntry]:
+        try:
+            with open(self.path, "rb") as f:
+                version, entries = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+                ImportError, ValueError, TypeError):
+            return {}
+        return entries if version == CACHE_VERSION else {}
+
+    def load(self, skill_file: Path, parse: Callable[[str], Any]) -> Any:
+        """Return the parsed skill for `skill_file`, parsing only if changed.
+
+        Args:
+            skill_file: Path to a SKILL.md file.
+            parse: Called with the file content on a cache miss.
+        """
+        key = str(Path(skill_file).resolve())
+        st = os.stat(skill_file)
+        with self._lock:
+            self._seen.add(key)
+            entry = self._entries.get(key)
+            if entry is not None and (entry.mtime_ns, entry.size) == (st.st_mtime_ns, st.st_size):
+                self.hits += 1
+                return entry.skill
+
+        content = Path(skill_file).read_text(encoding="utf-8")
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        hit = entry is not None and entry.sha256 == digest
+        if not hit:
+            entry = _CacheEntry(0, 0, digest, parse(content))
+
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            entry.mtime_ns, entry.size = st.st_mtime_ns, st.st_size
+            self._entries[key] = entry
+            self._dirty = True
+        return entry.skill
+
+    def save(self) -> None:
+        """Persist the cache atomically if anything changed."""
+        stale = set(self._entries) - self._seen
+        for key in stale:
+            del self._entries[key]
+        if not (self._dirty or stale):
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp, "wb") as f:
+            pickle.dump((CACHE_VERSION, self._entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.path)
+        self._dirty = False
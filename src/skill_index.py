@@ -0,0 +1,114 @@
+"""Inverted index from skill trigger tokens to skills.
+
+Skill trigger phrases ("Check inventory", "Shipment tracking", ...) are
+tokenized with `text_utils.tokenize` when the index is built, and each
+token points at the triggers that contain it. Matching a query is then
+one tokenize plus a few posting-list lookups, so the console can spot
+obvious single-skill requests locally — before any model round-trip —
+and pre-warm that skill's handler.
+
+A trigger's coverage is the share of its tokens found in the query; a
+skill scores its best trigger coverage.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from src.skills import Skill
+from src.text_utils import tokenize
+
+# Function words that say nothing about which skill is meant
+STOPWORDS = frozenset({"a", "an", "the", "of", "for", "to", "and", "in", "on", "my", "our"})
+
+
+def _trigger_tokens(text: str) -> list[str]:
+    # CJK bigrams are left out: "查詢庫存" should still be covered by
+    # "查詢一下庫存", whose bigrams do not include "詢庫"
+    tokens = [
+        tok for tok in tokenize(text)
+        if tok not in STOPWORDS and (tok.isascii() or len(tok) == 1)
+    ]
+    return list(dict.fromkeys(tokens))  # dedupe, keep order
+
+
+@dataclass(frozen=True)
+class SkillMatch:
+    """One skill matched by `SkillIndex.match_skills`."""
+    skill: Skill
+    score: float                      # best trigger coverage, 0-1
+    triggers: tuple[str, ...]         # triggers at that coverage
+
+
+class SkillIndex:
+    """Token → trigger posting lists over a set of loaded skills."""
+
+    def __init__(self, skills: Iterable[Skill]):
+        self.skills: tuple[Skill, ...] = tuple(skills)
+        self._trigger_skill: list[int] = []
+        self._trigger_text: list[str] = []
+        self._trigger_len: list[int] = []
+        self._exact: dict[str, int] = {}
+        postings: dict[str, list[int]] = {}
+
+        for skill_idx, skill in enumerate(self.skills):
+            for trigger in skill.triggers:
+                tokens = _trigger_tokens(trigger)
+                if not tokens:
+                    continue
+                trigger_id = len(self._trigger_text)
+                self._trigger_skill.append(skill_idx)
+                self._trigger_text.append(trigger)
+                self._trigger_len.append(len(tokens))
+                self._exact.setdefault(" ".join(tokenize(trigger)), skill_idx)
+                for tok in tokens:
+                    postings.setdefault(tok, []).append(trigger_id)
+
+        self._postings = {tok: tuple(ids) for tok, ids in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self._trigger_text)
+
+    def match_skills(self, query: str, min_coverage: float = 1.0) -> list[SkillMatch]:
+        """Skills whose triggers are covered by `query`, best first.
+
+        Args:
+            query: User input.
+            min_coverage: Minimum share of a trigger's tokens that must
+                          appear in the query (1.0 = the whole trigger).
+
+        Returns:
+            SkillMatch list sorted by score, ties in skill order.
+        """
+        hits: dict[int, int] = {}
+        postings = self._postings
+        for tok in set(tokenize(query)):
+            for trigger_id in postings.get(tok, ()):
+                hits[trigger_id] = hits.get(trigger_id, 0) + 1
+
+        best: dict[int, tuple[float, list[str]]] = {}
+        for trigger_id, count in sorted(hits.items()):
+            coverage = count / self._trigger_len[trigger_id]
+            if coverage < min_coverage:
+                continue
+            skill_idx = self._trigger_skill[trigger_id]
+            score, triggers = best.get(skill_idx, (0.0, []))
+            if coverage > score:
+                best[skill_idx] = (coverage, [self._trigger_text[trigger_id]])
+            elif coverage == score:
+                triggers.append(self._trigger_text[trigger_id])
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], item[0]))
+        return [
+            SkillMatch(self.skills[idx], score, tuple(triggers))
+            for idx, (score, triggers) in ranked
+        ]
+
+    def unique_match(self, query: str) -> Skill | None:
+        """The only skill with a fully covered trigger, if exactly one."""
+        matches = self.match_skills(query)
+        return matches[0].skill if len(matches) == 1 else None
+
+    def exact_match(self, query: str) -> Skill | None:
+        """The skill whose trigger equals `query` (ignoring case / punctuation)."""
+        skill_idx = self._exact.get(" ".join(tokenize(query)))
+        return self.skills[skill_idx] if skill_idx is not None else None
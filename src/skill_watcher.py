@@ -0,0 +1,204 @@
+"""Live reload of .github/skills/ without restarting the console.
+
+`SkillDirectoryWatcher` polls every skill folder's SKILL.md by
+(mtime, size). Only files that were added, edited or removed are
+re-parsed, and only their Tool objects are rebuilt; every other skill
+and tool is reused as-is. Each change publishes a new immutable
+(skills, tools) snapshot and bumps `version`, so callers can cheaply
+tell when to hand the new tool list to a fresh Copilot session.
+"""
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.exceptions import SkillLoadError
+from src.skills import DEFAULT_SKILLS_DIR, Skill, load_skill, load_skills_report
+
+
+@dataclass(frozen=True)
+class SkillChanges:
+    """Folder names affected by one `SkillDirectoryWatcher.check()`."""
+    added: tuple[str, ...] = ()
+    modified: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    errors: tuple[SkillLoadError, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    folders: tuple[str, ...] = ()
+    skills: tuple[Skill, ...] = ()
+    tools: dict[str, Any] = field(default_factory=dict)  # folder → Tool (None if skipped)
+
+
+def _default_tool_factory(skill: Skill):
+    from src.tools import build_tool  # needs the Copilot SDK
+    return build_tool(skill)
+
+
+class SkillDirectoryWatcher:
+    """Polls a skills directory and rebuilds only the affected tools.
+
+    Args:
+        skills_dir: Directory of skill folders (defaults to .github/skills/).
+        interval: Seconds between polls on the background thread.
+        lazy: Load response bodies lazily (see `load_skills(lazy=True)`).
+        cache_dir: Compiled skill cache used for the initial full load.
+        workers: Threads used for the initial full load.
+        tool_factory: Skill → Tool (or None to leave the skill out);
+                      defaults to `src.tools.build_tool`.
+
+    A SKILL.md that fails to parse is reported and ignored — the last
+    good version of that skill stays active.
+    """
+
+    def __init__(
+        self,
+        skills_dir: str | Path | None = None,
+        interval: float = 2.0,
+        lazy: bool = False,
+        cache_dir: str | Path | None = None,
+        workers: int = 1,
+        tool_factory: Callable[[Skill], Any] | None = None,
+    ):
+        self.skills_dir = Path(skills_dir) if skills_dir is not None else DEFAULT_SKILLS_DIR
+        self.interval = interval
+        self.lazy = lazy
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.tool_factory = tool_factory or _default_tool_factory
+        self.version = 0
+        self.last_errors: tuple[SkillLoadError, ...] = ()
+        self._signatures: dict[str, tuple[int, int]] | None = None
+        self._snapshot = _Snapshot()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def skills(self) -> list[Skill]:
+        """Current skills, sorted by folder name."""
+        return list(self._snapshot.skills)
+
+    @property
+    def tools(self) -> list:
+        """Current tools, in skill order (skipped skills left out)."""
+        return self._tools(self._snapshot)
+
+    @staticmethod
+    def _tools(snapshot: _Snapshot) -> list:
+        return [snapshot.tools[f] for f in snapshot.folders if snapshot.tools[f] is not None]
+
+    def snapshot(self) -> tuple[int, list[Skill], list]:
+        """`(version, skills, tools)` from one consistent reload.
+
+        Reading the three attributes separately can pair a newer version
+        with older skills if a reload lands in between.
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            return self.version, list(snapshot.skills), self._tools(snapshot)
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        """(mtime_ns, size) of every <folder>/SKILL.md in the directory."""
+        signatures = {}
+        try:
+            entries = list(self.skills_dir.iterdir())
+        except OSError:
+            return signatures
+        for entry in entries:
+            try:
+                st = (entry / "SKILL.md").stat()
+            except OSError:
+                continue
+            signatures[entry.name] = (st.st_mtime_ns, st.st_size)
+        return signatures
+
+    def _full_load(self, signatures: dict[str, tuple[int, int]]) -> SkillChanges:
+        report = load_skills_report(self.skills_dir, self.cache_dir, self.workers, lazy=self.lazy)
+        tools = {folder: self.tool_factory(skill) for folder, skill in zip(report.folders, report.skills)}
+        self._snapshot = _Snapshot(tuple(report.folders), tuple(report.skills), tools)
+        self._signatures = signatures
+        return SkillChanges(added=tuple(report.folders), errors=tuple(report.errors))
+
+    def check(self) -> SkillChanges:
+        """Re-parse changed SKILL.md files and rebuild their tools.
+
+        The first call loads the whole directory.
+
+        Returns:
+            The folders that changed (falsy if nothing did).
+        """
+        with self._lock:
+            signatures = self._scan()
+            if self._signatures is None:
+                changes = self._full_load(signatures)
+            else:
+                changes = self._apply(signatures)
+            self.last_errors = changes.errors
+            if changes:
+                self.version += 1
+            for error in changes.errors:
+                print(f"  ⚠️ [SKILLS] {error} — keeping previous version")
+            return changes
+
+    def _apply(self, signatures: dict[str, tuple[int, int]]) -> SkillChanges:
+        old = self._signatures
+        current = self._snapshot
+        skills = dict(zip(current.folders, current.skills))
+        tools = dict(current.tools)
+
+        changed = sorted(f for f, sig in signatures.items() if old.get(f) != sig)
+        added, modified, errors = [], [], []
+        for folder in changed:
+            # Record the new signature first: a broken file is reported
+            # once, then retried only after its next edit
+            old[folder] = signatures[folder]
+            try:
+                skill = load_skill(self.skills_dir / folder, lazy=self.lazy)
+            except SkillLoadError as e:
+                errors.append(e)
+                continue
+            (modified if folder in skills else added).append(folder)
+            skills[folder] = skill
+            tools[folder] = self.tool_factory(skill)
+
+        removed = []
+        for folder in sorted(f for f in old if f not in signatures):
+            del old[folder]
+            if folder in skills:
+                removed.append(folder)
+                del skills[folder]
+                del tools[folder]
+
+        changes = SkillChanges(tuple(added), tuple(modified), tuple(removed), tuple(errors))
+        if changes:
+            folders = tuple(sorted(skills))
+            self._snapshot = _Snapshot(folders, tuple(skills[f] for f in folders), tools)
+        return changes
+
+    def start(self) -> "SkillDirectoryWatcher":
+        """Load the directory now, then keep polling on a daemon thread."""
+        if self._signatures is None:
+            self.check()
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="skill-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
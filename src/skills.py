@@ -1,19 +1,364 @@
 """Loader for .github/skills/ SKILL.md files."""
 
+import mmap
 import re
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 
 import yaml
 
+from src.exceptions import SkillLoadError
+from src.skill_cache import CACHE_FILENAME, LAZY_CACHE_FILENAME, SkillCache
+
+DEFAULT_SKILLS_DIR = Path(__file__).parent.parent / ".github" / "skills"
+
+
+@dataclass(frozen=True)
+class ResponseRef:
+    """Where a lazily loaded response body lives on disk.
+
+    `offset` is the byte offset just past the Default Response heading,
+    recorded while scanning the file at load time.
+    """
+    path: Path
+    offset: int
+
 
 @dataclass
 class Skill:
     name: str
     description: str
     triggers: list[str] = field(default_factory=list)
-    response_content: str = ""
+    response_content: str | None = ""  # None until a lazy body is loaded
     demo_id: int | None = None  # extracted from folder name (e.g. demo1 → 1)
+    response_ref: ResponseRef | None = field(default=None, compare=False, repr=False)
+
+    @property
+    def response_loaded(self) -> bool:
+        return self.response_content is not None
+
+    def load_response(self) -> str:
+        """Return the response body, reading it from disk on first use."""
+        if self.response_content is None:
+            self.response_content = _read_response(self.response_ref) if self.response_ref else ""
+        return self.response_content
+
+
+# ---------------------------------------------------------------------------
+# Single-pass SKILL.md parser
+# ---------------------------------------------------------------------------
+
+_FENCE_OPEN_RE = re.compile(r"```+\w*\s*$")
+_FENCE_CLOSE_RE = re.compile(r"```+\s*$")
+_TRIGGERS_HEADER_RE = re.compile(r"## (?:觸發條件|Triggers)\s*$")
+_RESPONSE_HEADER_RE = re.compile(r"## (?:預設回應|Default Response)\s*$")
+_RESPONSE_END_PREFIXES = ("## 使用的工具", "## Tools Used", "## 資料來源", "## Data Sources")
+
+
+@dataclass
+class ParsedSkill:
+    """Everything extracted from one SKILL.md document.
+
+    `response_span` is the (start, end) offset range of the raw response
+    body in the units the parser was fed (characters for in-memory
+    content); `response` is that range, stripped. `frontmatter_error` is
+    set when a frontmatter block exists but is not a valid YAML mapping
+    (`frontmatter` is then empty).
+    """
+    frontmatter: dict = field(default_factory=dict)
+    triggers: list[str] = field(default_factory=list)
+    response: str = ""
+    response_span: tuple[int, int] | None = None
+    frontmatter_error: str = ""
+
+
+class _SkillMarkdownParser:
+    """Line-oriented state machine over a SKILL.md document.
+
+    Lines are fed one at a time together with their size, so frontmatter,
+    trigger list and the response body range come out of a single pass:
+
+    - Frontmatter: a `---` block at the top (after an optional ```skill
+      fence), parsed with `yaml.safe_load`.
+    - Triggers: `- ` items of the first non-empty `## Triggers` /
+      `## 觸發條件` section, up to the next `## ` heading.
+    - Response: after `## Default Response` / `## 預設回應`, the text
+      between the first `---` rule and `## Tools Used` / `## Data
+      Sources` (or their Chinese equivalents, or the end of the document
+      minus a closing fence). Without a `---` rule, everything after the
+      heading is used.
+    """
+
+    def __init__(self):
+        self.offset = 0
+        self._first_line = True
+        self._fm_state = "seek"     # seek → in → done
+        self._fm_lines: list[str] = []
+        self._triggers_state = "seek"  # seek → in → done
+        self.triggers: list[str] = []
+        self._resp_state = "none"   # none → seek_rule → body → done
+        self._header_end = 0
+        self._first_end: int | None = None
+        self._body_start = 0
+        self._body_end: int | None = None
+        self._closing_fence: int | None = None
+
+    @classmethod
+    def for_response(cls) -> "_SkillMarkdownParser":
+        """A parser positioned just after a Default Response heading."""
+        parser = cls()
+        parser._first_line = False
+        parser._fm_state = "done"
+        parser._triggers_state = "done"
+        parser._resp_state = "seek_rule"
+        return parser
+
+    @property
+    def head_complete(self) -> bool:
+        """True once frontmatter and triggers are known and the response
+        heading was reached, i.e. the rest is only the response body."""
+        return self._resp_state != "none" and self._triggers_state == "done"
+
+    @property
+    def response_offset(self) -> int | None:
+        """Offset just past the Default Response heading, if seen."""
+        return None if self._resp_state == "none" else self._header_end
+
+    def feed(self, text: str, size: int, terminated: bool = True) -> None:
+        """Consume one line.
+
+        Args:
+            text: The line without its trailing newline.
+            size: Length of the line including the newline, in the unit
+                  offsets should be reported in (characters or bytes).
+            terminated: False for a final line with no trailing newline.
+        """
+        start = self.offset
+        self.offset += size
+        if text[-1:] == "\r":
+            text = text[:-1]
+
+        # Track a closing fence that is only followed by blank lines
+        if text[:3] == "```" and _FENCE_CLOSE_RE.match(text):
+            self._closing_fence = start
+        elif self._closing_fence is not None and text.strip():
+            self._closing_fence = None
+
+        resp_state = self._resp_state
+        if resp_state == "body" and self._triggers_state == "done":
+            # Hot path for long response bodies: only a heading can end it
+            if text[:3] == "## " and text.startswith(_RESPONSE_END_PREFIXES):
+                self._resp_state = "done"
+                self._body_end = start
+            return
+
+        if self._first_line:
+            self._first_line = False
+            if text[:3] == "```" and _FENCE_OPEN_RE.match(text):
+                return
+
+        if self._fm_state != "done":
+            if self._fm_state == "seek":
+                if text == "---":
+                    self._fm_state = "in"
+                    return
+                if text.strip():
+                    self._fm_state = "done"
+            elif text.startswith("## "):
+                # Unterminated frontmatter: drop it, parse the heading normally
+                self._fm_state = "done"
+                self._fm_lines = []
+            else:
+                if text.startswith("---"):
+                    self._fm_state = "done"
+                else:
+                    self._fm_lines.append(text)
+                return
+
+        triggers_state = self._triggers_state
+        if triggers_state == "in":
+            if text.startswith("## "):
+                # An empty section does not count; keep looking for another
+                self._triggers_state = "done" if self.triggers else "seek"
+            else:
+                item = text.strip()
+                if item.startswith("- ") and item[2:].strip():
+                    self.triggers.append(item[2:].strip())
+        if self._triggers_state == "seek" and "## " in text and _TRIGGERS_HEADER_RE.search(text):
+            self._triggers_state = "in"
+            return
+
+        if resp_state == "none":
+            if "## " in text and _RESPONSE_HEADER_RE.search(text):
+                self._resp_state = "seek_rule"
+                self._header_end = self.offset
+        elif resp_state == "seek_rule":
+            if text == "---" and terminated:
+                self._resp_state = "body"
+                self._body_start = self.offset
+            elif self._first_end is None and text.startswith(_RESPONSE_END_PREFIXES):
+                self._first_end = start
+        elif resp_state == "body":
+            if text[:3] == "## " and text.startswith(_RESPONSE_END_PREFIXES):
+                self._resp_state = "done"
+                self._body_end = start
+
+    @property
+    def frontmatter_text(self) -> str | None:
+        """Raw YAML between the `---` fences, or None if not closed."""
+        return "\n".join(self._fm_lines) if self._fm_state == "done" else None
+
+    def response_span(self) -> tuple[int, int] | None:
+        """Offsets of the raw response body once the whole input was fed."""
+        doc_end = self._closing_fence if self._closing_fence is not None else self.offset
+        if self._resp_state in ("body", "done"):
+            end = self._body_end if self._body_end is not None else doc_end
+            return self._body_start, max(self._body_start, end)
+        if self._resp_state == "seek_rule":
+            end = self._first_end if self._first_end is not None else doc_end
+            return self._header_end, max(self._header_end, end)
+        return None
+
+
+def _load_frontmatter(text: str | None) -> tuple[dict, str]:
+    """Return (frontmatter, error message or "")."""
+    if not text:
+        return {}, ""
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        return {}, f"invalid YAML frontmatter: {e}"
+    if data is None:
+        return {}, ""
+    if not isinstance(data, dict):
+        return {}, f"frontmatter must be a mapping, got {type(data).__name__}"
+    return data, ""
+
+
+def _feed_text(parser: _SkillMarkdownParser, content: str) -> None:
+    """Feed a whole in-memory document, with character offsets."""
+    lines = content.split("\n")
+    last = lines.pop()
+    feed = parser.feed
+    for line in lines:
+        feed(line, len(line) + 1)
+    if last:
+        feed(last, len(last), terminated=False)
+
+
+def parse_skill_markdown(content: str) -> ParsedSkill:
+    """Parse a SKILL.md document in one pass over its lines."""
+    parser = _SkillMarkdownParser()
+    _feed_text(parser, content)
+
+    span = parser.response_span()
+    frontmatter, error = _load_frontmatter(parser.frontmatter_text)
+    return ParsedSkill(
+        frontmatter=frontmatter,
+        triggers=parser.triggers,
+        response=content[span[0]:span[1]].strip() if span else "",
+        response_span=span,
+        frontmatter_error=error,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Lazy response bodies
+# ---------------------------------------------------------------------------
+
+def _text_byte_lines(content: str) -> Iterator[tuple[str, int, bool]]:
+    """Yield (line, UTF-8 size including newline, terminated) for `content`."""
+    lines = content.split("\n")
+    last = lines.pop()
+    for line in lines:
+        yield line, len(line.encode("utf-8")) + 1, True
+    if last:
+        yield last, len(last.encode("utf-8")), False
+
+
+def _file_byte_lines(f) -> Iterator[tuple[str, int, bool]]:
+    """Like `_text_byte_lines`, reading a binary file only as far as needed."""
+    for raw in f:
+        terminated = raw.endswith(b"\n")
+        yield (raw[:-1] if terminated else raw).decode("utf-8"), len(raw), terminated
+
+
+def _scan_head(lines: Iterable[tuple[str, int, bool]]) -> _SkillMarkdownParser:
+    """Feed lines until only the response body is left to read."""
+    parser = _SkillMarkdownParser()
+    for line, size, terminated in lines:
+        parser.feed(line, size, terminated)
+        if parser.head_complete:
+            break
+    return parser
+
+
+def _response_from_tail(tail: str) -> str:
+    """Extract the response from the text following its heading."""
+    parser = _SkillMarkdownParser.for_response()
+    _feed_text(parser, tail)
+    span = parser.response_span()
+    return tail[span[0]:span[1]].strip() if span else ""
+
+
+def _read_response(ref: ResponseRef) -> str:
+    """Read a lazily loaded response body via mmap.
+
+    Only the bytes after the recorded heading offset are decoded. If the
+    file was edited so that the heading is no longer at that offset, the
+    whole file is parsed again instead.
+    """
+    try:
+        with open(ref.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if ref.offset <= len(mm):
+                line_start = mm.rfind(b"\n", 0, max(ref.offset - 1, 0)) + 1
+                heading = mm[line_start:ref.offset].decode("utf-8", errors="replace")
+                if _RESPONSE_HEADER_RE.search(heading.rstrip("\r\n")):
+                    return _response_from_tail(mm[ref.offset:].decode("utf-8"))
+            content = mm[:].decode("utf-8")
+    except (OSError, ValueError, UnicodeDecodeError) as e:
+        print(f"  ⚠️ Could not read response body from {ref.path}: {e}")
+        return ""
+    return parse_skill_markdown(content).response
+
+
+def _demo_id(skill_folder: Path) -> int | None:
+    # Extract demo_id from folder name (e.g. "demo1-fabric-inventory" → 1)
+    match_demo = re.match(r"demo(\d+)", skill_folder.name)
+    return int(match_demo.group(1)) if match_demo else None
+
+
+def _skill_from_head(skill_folder: Path, parser: _SkillMarkdownParser) -> Skill:
+    frontmatter, error = _load_frontmatter(parser.frontmatter_text)
+    skill_file = skill_folder / "SKILL.md"
+    if error:
+        raise SkillLoadError(str(skill_file), error)
+
+    offset = parser.response_offset
+    return Skill(
+        name=frontmatter.get("name", skill_folder.name),
+        description=frontmatter.get("description", ""),
+        triggers=parser.triggers,
+        response_content=None if offset is not None else "",
+        demo_id=_demo_id(skill_folder),
+        response_ref=ResponseRef(skill_file, offset) if offset is not None else None,
+    )
+
+
+def _parse_skill_head(skill_folder: Path, content: str) -> Skill:
+    """Like `_parse_skill`, but leave the response body on disk."""
+    return _skill_from_head(skill_folder, _scan_head(_text_byte_lines(content)))
+
+
+def _scan_skill_file(skill_folder: Path) -> Skill:
+    """Read SKILL.md only up to its Default Response heading."""
+    with open(skill_folder / "SKILL.md", "rb") as f:
+        parser = _scan_head(_file_byte_lines(f))
+    return _skill_from_head(skill_folder, parser)
 
 
 def _parse_frontmatter(content: str) -> dict:
@@ -21,31 +366,12 @@ def _parse_frontmatter(content: str) -> dict:
 
     Handles both ```skill fenced and standard --- fenced frontmatter.
     """
-    # Pattern: ```skill\n---\n...\n---\n
-    match = re.search(r"---\n(.+?)\n---", content, re.DOTALL)
-    if match:
-        try:
-            return yaml.safe_load(match.group(1)) or {}
-        except yaml.YAMLError:
-            pass
-    return {}
+    return parse_skill_markdown(content).frontmatter
 
 
 def _extract_triggers(content: str) -> list[str]:
     """Extract trigger keywords from the Triggers section."""
-    pattern = r"## (?:觸發條件|Triggers)\s*\n(.*?)(?=\n## |\Z)"
-    match = re.search(pattern, content, re.DOTALL)
-    if not match:
-        return []
-
-    triggers = []
-    for line in match.group(1).split("\n"):
-        line = line.strip()
-        if line.startswith("- "):
-            keyword = line[2:].strip()
-            if keyword:
-                triggers.append(keyword)
-    return triggers
+    return parse_skill_markdown(content).triggers
 
 
 def _extract_response(content: str) -> str:
@@ -54,74 +380,198 @@ def _extract_response(content: str) -> str:
     Gets everything between the first --- after Default Response and the
     ## Tools Used / ## Data Sources sections (or end of file).
     """
-    # Find Default Response / 預設回應 section
-    pattern = r"## (?:預設回應|Default Response)\s*\n.*?\n---\n(.*?)(?=\n## (?:使用的工具|Tools Used)|\n## (?:資料來源|Data Sources)|\Z)"
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        return match.group(1).strip()
+    return parse_skill_markdown(content).response
+
 
-    # Fallback: everything after the section header
-    pattern = r"## (?:預設回應|Default Response)\s*\n(.*?)(?=\n## (?:使用的工具|Tools Used)|\n## (?:資料來源|Data Sources)|\Z)"
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        return match.group(1).strip()
+def _parse_skill(skill_folder: Path, content: str) -> Skill:
+    """Parse one SKILL.md document into a Skill.
 
-    return ""
+    Raises:
+        SkillLoadError: If the frontmatter block is not valid YAML.
+    """
+    parsed = parse_skill_markdown(content)
+    if parsed.frontmatter_error:
+        raise SkillLoadError(str(skill_folder / "SKILL.md"), parsed.frontmatter_error)
+    fm = parsed.frontmatter
 
+    return Skill(
+        name=fm.get("name", skill_folder.name),
+        description=fm.get("description", ""),
+        triggers=parsed.triggers,
+        response_content=parsed.response,
+        demo_id=_demo_id(skill_folder),
+    )
+
+
+@dataclass
+class SkillLoadReport:
+    """Outcome of loading a skills directory.
+
+    Attributes:
+        skills: Successfully loaded skills, sorted by folder name.
+        folders: Folder name of each entry in `skills`.
+        timings: Seconds spent reading + parsing, per skill folder name.
+        errors: One SkillLoadError per SKILL.md that could not be loaded.
+        elapsed: Wall-clock seconds for the whole load.
+    """
+    skills: list[Skill] = field(default_factory=list)
+    folders: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+    errors: list[SkillLoadError] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+def _parse_in_pool(pool: ProcessPoolExecutor, parse, skill_folder: Path, content: str) -> Skill:
+    return pool.submit(parse, skill_folder, content).result()
+
+
+def _load_one(
+    skill_folder: Path,
+    cache: SkillCache | None,
+    pool: ProcessPoolExecutor | None,
+    lazy: bool = False,
+) -> tuple[Skill | None, SkillLoadError | None, float]:
+    """Read and parse one skill folder → (skill, error, seconds).
+
+    Returns (None, None, 0.0) for entries that are not skill folders.
+    """
+    started = time.perf_counter()
+    skill_file = skill_folder / "SKILL.md"
+    if not skill_file.is_file():
+        return None, None, 0.0
+
+    parse = _parse_skill_head if lazy else _parse_skill
+    if pool is not None:
+        parse = partial(_parse_in_pool, pool, parse)
+    try:
+        if cache is not None:
+            skill = cache.load(skill_file, partial(parse, skill_folder))
+        elif lazy and pool is None:
+            skill = _scan_skill_file(skill_folder)
+        else:
+            skill = parse(skill_folder, skill_file.read_text(encoding="utf-8"))
+    except SkillLoadError as e:
+        return None, e, time.perf_counter() - started
+    except (OSError, UnicodeDecodeError) as e:
+        return None, SkillLoadError(str(skill_file), str(e)), time.perf_counter() - started
+    return skill, None, time.perf_counter() - started
+
+
+def load_skill(skill_folder: str | Path, lazy: bool = False) -> Skill:
+    """Load the SKILL.md of a single skill folder.
+
+    Raises:
+        SkillLoadError: If the file is missing, unreadable or invalid.
+    """
+    skill_folder = Path(skill_folder)
+    skill, error, _ = _load_one(skill_folder, None, None, lazy)
+    if error is not None:
+        raise error
+    if skill is None:
+        raise SkillLoadError(str(skill_folder / "SKILL.md"), "file not found")
+    return skill
 
-def load_skills(skills_dir: str | Path | None = None) -> list[Skill]:
-    """Load all SKILL.md files from .github/skills/ directory.
+
+def load_skills_report(
+    skills_dir: str | Path | None = None,
+    cache_dir: str | Path | None = None,
+    workers: int = 1,
+    use_processes: bool = False,
+    lazy: bool = False,
+) -> SkillLoadReport:
+    """Load all SKILL.md files, optionally concurrently, with timings.
 
     Args:
         skills_dir: Path to the skills directory. If None, auto-detects
                     relative to this file's project root.
+        cache_dir: Optional directory for the compiled skill cache
+                   (see src/skill_cache.py).
+        workers: Number of threads reading skill folders. 1 loads them
+                 one after another; more overlaps the per-file I/O
+                 (useful on network-mounted skill directories).
+        use_processes: Also hand parsing to a process pool of the same
+                       size, for very large SKILL.md files.
+        lazy: Parse only frontmatter and triggers; each response body is
+              read from disk on its first `Skill.load_response()` call.
 
     Returns:
-        List of Skill objects sorted by folder name (demo1, demo2, ...).
+        SkillLoadReport whose skills keep the folder-sorted order no
+        matter which worker finished first.
     """
-    if skills_dir is None:
-        project_root = Path(__file__).parent.parent
-        skills_dir = project_root / ".github" / "skills"
-    else:
-        skills_dir = Path(skills_dir)
+    skills_dir = Path(skills_dir) if skills_dir is not None else DEFAULT_SKILLS_DIR
 
-    skills: list[Skill] = []
+    report = SkillLoadReport()
+    started = time.perf_counter()
 
     if not skills_dir.exists():
         print(f"Warning: skills directory not found at {skills_dir}")
-        return skills
+        return report
 
-    for skill_folder in sorted(skills_dir.iterdir()):
-        if not skill_folder.is_dir():
-            continue
-        skill_file = skill_folder / "SKILL.md"
-        if not skill_file.exists():
+    cache = None
+    if cache_dir is not None:
+        cache = SkillCache(cache_dir, LAZY_CACHE_FILENAME if lazy else CACHE_FILENAME)
+    folders = sorted(entry for entry in skills_dir.iterdir() if entry.is_dir())
+    workers = max(1, min(workers, len(folders) or 1))
+
+    pool = ProcessPoolExecutor(max_workers=workers) if use_processes else None
+    try:
+        if workers == 1:
+            results = [_load_one(folder, cache, pool, lazy) for folder in folders]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="skill-load") as threads:
+                # map() yields in submission order, i.e. sorted by folder name
+                results = list(threads.map(lambda folder: _load_one(folder, cache, pool, lazy), folders))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    for folder, (skill, error, seconds) in zip(folders, results):
+        if skill is None and error is None:
             continue
+        report.timings[folder.name] = seconds
+        if error is not None:
+            report.errors.append(error)
+        else:
+            report.skills.append(skill)
+            report.folders.append(folder.name)
 
-        content = skill_file.read_text(encoding="utf-8")
-
-        # Strip the opening/closing ```skill fences for cleaner parsing
-        clean = re.sub(r"^```+\w*\s*\n", "", content)
-        clean = re.sub(r"\n```+\s*$", "", clean)
-
-        fm = _parse_frontmatter(content)
-        triggers = _extract_triggers(clean)
-        response = _extract_response(clean)
-
-        # Extract demo_id from folder name (e.g. "demo1-fabric-inventory" → 1)
-        demo_id = None
-        match_demo = re.match(r"demo(\d+)", skill_folder.name)
-        if match_demo:
-            demo_id = int(match_demo.group(1))
-
-        skill = Skill(
-            name=fm.get("name", skill_folder.name),
-            description=fm.get("description", ""),
-            triggers=triggers,
-            response_content=response,
-            demo_id=demo_id,
-        )
-        skills.append(skill)
-        print(f"  Loaded skill: {skill.name} ({len(skill.triggers)} triggers)")
+    if cache is not None:
+        cache.save()
 
-    return skills
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def load_skills(
+    skills_dir: str | Path | None = None,
+    cache_dir: str | Path | None = None,
+    workers: int = 1,
+    use_processes: bool = False,
+    lazy: bool = False,
+) -> list[Skill]:
+    """Load all SKILL.md files from .github/skills/ directory.
+
+    Skills that fail to load are reported and skipped; use
+    `load_skills_report()` to get the errors and per-skill timings.
+
+    Args:
+        skills_dir: Path to the skills directory. If None, auto-detects
+                    relative to this file's project root.
+        cache_dir: Optional directory for the compiled skill cache. When
+                   given, skills whose SKILL.md is unchanged since the
+                   last load are taken from the cache instead of being
+                   re-parsed (see src/skill_cache.py).
+        workers: Threads used to read skill folders concurrently.
+        use_processes: Parse in a process pool as well.
+        lazy: Defer reading response bodies until first use
+              (`Skill.load_response()`).
+
+    Returns:
+        List of Skill objects sorted by folder name (demo1, demo2, ...).
+    """
+    report = load_skills_report(skills_dir, cache_dir, workers, use_processes, lazy)
+    for skill in report.skills:
+        print(f"  Loaded skill: {skill.name} ({len(skill.triggers)} triggers)")
+    for error in report.errors:
+        print(f"  ⚠️ {error}")
+    return report.skills
@@ -0,0 +1,39 @@
+"""Text normalization and tokenization shared by classifiers and matchers.
+
+User input mixes Chinese / Japanese and English, often without spaces
+between them ("查一下inventory"). Latin text is split into words; runs of
+CJK characters have no word boundaries, so they are split into character
+unigrams and bigrams instead.
+"""
+
+import re
+
+# Latin words / numbers, or runs of CJK ideographs + kana
+_TOKEN_RE = re.compile(
+    r"[a-z0-9]+"
+    r"|[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+"
+)
+
+
+def _stem(word: str) -> str:
+    """Very light English plural stripping ("meetings" → "meeting")."""
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """Split mixed CJK / Latin text into lowercase tokens.
+
+    Latin words become one (lightly stemmed) token each. CJK runs become
+    character unigrams plus overlapping bigrams, e.g. "庫存量" →
+    ["庫", "存", "量", "庫存", "存量"].
+    """
+    tokens: list[str] = []
+    for run in _TOKEN_RE.findall(text.lower()):
+        if run[0].isascii():
+            tokens.append(_stem(run))
+            continue
+        tokens.extend(run)
+        tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
@@ -3,18 +3,16 @@
 from copilot import Tool
 
 from src.skills import Skill
-from src.agents import AGENT_REGISTRY
-from src.inventory_data import generate_inventory_report
+from src.agents import get_agent_by_demo_id
+from src.inventory_data import generate_inventory_answer, prewarm_inventory
 
 
 def _find_agent_for_skill(skill: Skill):
     """Find the agent and MCP connector associated with a skill's demo_id."""
-    if skill.demo_id is None:
+    agent = get_agent_by_demo_id(skill.demo_id)
+    if agent is None:
         return None, None
-    for agent in AGENT_REGISTRY:
-        if skill.demo_id in agent.demo_ids:
-            return agent.display_name, agent.mcp_connector
-    return None, None
+    return agent.display_name, agent.mcp_connector
 
 
 # Skills that should be skipped because they are handled by a live MCP server.
@@ -56,9 +54,10 @@ def _make_handler(skill: Skill):
             print(f"📂 [DATA]  Live CSV from data/inventory/")
         print(f"{'─' * 50}")
 
+        query = invocation.get("query", "") if isinstance(invocation, dict) else ""
+
         if use_live_mcp:
             session_key = LIVE_MCP_SKILLS[skill.name]
-            query = invocation.get("query", "") if isinstance(invocation, dict) else ""
             return {
                 "textResultForLlm": (
                     f"User's query: {query}\n\n"
@@ -70,10 +69,10 @@ def _make_handler(skill: Skill):
                 "sessionLog": f"Skill '{skill.name}' → live MCP '{session_key}'",
             }
 
-        # Live CSV data for inventory skill
+        # Live CSV data for inventory skill, scoped to what the query asks about
         if use_live_csv:
             try:
-                report = generate_inventory_report()
+                report = generate_inventory_answer(query)
                 return {
                     "textResultForLlm": report,
                     "resultType": "success",
@@ -84,7 +83,7 @@ def _make_handler(skill: Skill):
                 # Fall through to static response below
 
         return {
-            "textResultForLlm": skill.response_content,
+            "textResultForLlm": skill.load_response(),
             "resultType": "success",
             "sessionLog": f"Executed skill: {skill.name}",
         }
@@ -92,6 +91,51 @@ def _make_handler(skill: Skill):
     return handler
 
 
+def prewarm_skill(skill: Skill) -> None:
+    """Load whatever the skill's handler will need, ahead of the call.
+
+    Meant to run in the background once a request has been matched to
+    `skill` locally (see src/skill_index.py), while the model is still
+    deciding which tool to call.
+    """
+    if skill.name in LIVE_MCP_SKILLS:
+        return
+    skill.load_response()
+    if skill.name == "fabric-inventory-query":
+        prewarm_inventory()  # the handler reuses the cached store and index
+
+
+def build_tool(skill: Skill) -> Tool | None:
+    """Build the Copilot SDK Tool for one skill.
+
+    Returns None for skills wired to a live MCP connector (see
+    LIVE_MCP_SKILLS) — the model calls the real MCP server tools directly.
+    """
+    if skill.name in LIVE_MCP_SKILLS:
+        return None
+
+    trigger_text = ", ".join(skill.triggers) if skill.triggers else ""
+    description = skill.description
+    if trigger_text:
+        description += f"\nTrigger keywords: {trigger_text}"
+
+    return Tool(
+        name=skill.name,
+        description=description,
+        parameters={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The user's query text",
+                },
+            },
+            "required": ["query"],
+        },
+        handler=_make_handler(skill),
+    )
+
+
 def build_tools(skills: list[Skill]) -> list[Tool]:
     """Build a list of Copilot SDK Tool objects from loaded skills.
 
@@ -108,32 +152,10 @@ def build_tools(skills: list[Skill]) -> list[Tool]:
     tools: list[Tool] = []
 
     for skill in skills:
-        # Skip skills that are wired to a live MCP — let the model
-        # route those queries to the real MCP tools directly.
-        if skill.name in LIVE_MCP_SKILLS:
+        tool = build_tool(skill)
+        if tool is None:
             print(f"  ⏭️  Skipped skill '{skill.name}' → routed to live MCP '{LIVE_MCP_SKILLS[skill.name]}'")
             continue
-
-        trigger_text = ", ".join(skill.triggers) if skill.triggers else ""
-        description = skill.description
-        if trigger_text:
-            description += f"\nTrigger keywords: {trigger_text}"
-
-        tool = Tool(
-            name=skill.name,
-            description=description,
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "The user's query text",
-                    },
-                },
-                "required": ["query"],
-            },
-            handler=_make_handler(skill),
-        )
         tools.append(tool)
 
     return tools
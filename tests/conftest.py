@@ -1,5 +1,6 @@
 """Shared fixtures and test configuration for Zava test suite."""
 
+import shutil
 import sys
 from pathlib import Path
 
@@ -17,6 +18,16 @@ def skills_dir():
     return PROJECT_ROOT / ".github" / "skills"
 
 
+@pytest.fixture
+def skills_copy(skills_dir, tmp_path):
+    """Writable copy of the skills directory."""
+    if not skills_dir.exists():
+        pytest.skip("Skills directory not found")
+    dest = tmp_path / "skills"
+    shutil.copytree(skills_dir, dest)
+    return dest
+
+
 @pytest.fixture
 def data_dir():
     """Path to the data/ directory."""
@@ -24,10 +35,27 @@ def data_dir():
 
 
 @pytest.fixture
-def all_skills(skills_dir):
+def inventory_dir(data_dir, tmp_path):
+    """Writable copy of data/inventory/."""
+    src = data_dir / "inventory"
+    if not src.exists():
+        pytest.skip("Inventory data not found")
+    dest = tmp_path / "inventory"
+    shutil.copytree(src, dest)
+    return dest
+
+
+@pytest.fixture(scope="session")
+def skill_cache_dir(tmp_path_factory):
+    """Compiled skill cache shared by the whole test session."""
+    return tmp_path_factory.mktemp("skill-cache")
+
+
+@pytest.fixture
+def all_skills(skills_dir, skill_cache_dir):
     """Load all skills from the skills directory."""
     from src.skills import load_skills
-    return load_skills(skills_dir)
+    return load_skills(skills_dir, cache_dir=skill_cache_dir)
 
 
 @pytest.fixture
@@ -1,12 +1,18 @@
 """Tests for src/agents.py — Agent registry & permission model."""
 
+import dataclasses
+
+import pytest
+
 from src.agents import (
     AGENT_REGISTRY,
     AgentCategory,
     AgentDefinition,
+    AgentRegistry,
     PermissionLevel,
     check_permission,
     get_agent,
+    get_agent_by_demo_id,
     get_agents_by_category,
     get_agents_by_permission,
 )
@@ -174,3 +180,71 @@ class TestAgentProperties:
 
         agent = get_agent("coding-agent")
         assert agent.category_icon == "🛠️"
+
+
+class TestAgentDefinitionImmutability:
+    def test_frozen(self):
+        agent = get_agent("inventory-agent")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            agent.permission = PermissionLevel.LOW
+
+    def test_slotted(self):
+        agent = get_agent("inventory-agent")
+        assert not hasattr(agent, "__dict__")
+
+    def test_lists_stored_as_tuples(self):
+        agent = AgentDefinition(
+            name="x", display_name="X", category=AgentCategory.OPS,
+            permission=PermissionLevel.LOW, description="x",
+            accessible_resources=["a"], demo_ids=[9],
+        )
+        assert agent.accessible_resources == ("a",)
+        assert agent.demo_ids == (9,)
+        assert hash(agent)
+
+    def test_permission_rank(self):
+        assert get_agent("search-agent").permission_rank == 0
+        assert get_agent("knowledge-agent").permission_rank == 1
+        assert get_agent("inventory-agent").permission_rank == 2
+
+
+class TestAgentRegistryIndexes:
+    def _agent(self, name, demo_ids=(), category=AgentCategory.OPS):
+        return AgentDefinition(
+            name=name, display_name=name.title(), category=category,
+            permission=PermissionLevel.MEDIUM, description=name, demo_ids=demo_ids,
+        )
+
+    def test_behaves_like_a_list(self):
+        assert AGENT_REGISTRY[0].name == "inventory-agent"
+        assert [a.name for a in AGENT_REGISTRY][-1] == "copilot-agent"
+        assert get_agent("sre-agent") in AGENT_REGISTRY
+
+    def test_by_demo_id(self):
+        assert get_agent_by_demo_id(1).name == "inventory-agent"
+        assert get_agent_by_demo_id(8).name == "copilot-agent"
+        assert get_agent_by_demo_id(999) is None
+        assert get_agent_by_demo_id(None) is None
+
+    def test_register_updates_indexes(self):
+        registry = AgentRegistry([self._agent("a", demo_ids=[1])])
+        registry.register(self._agent("b", demo_ids=[2], category=AgentCategory.DATA))
+        assert len(registry) == 2
+        assert registry.get("b").name == "b"
+        assert registry.by_demo_id(2).name == "b"
+        assert [a.name for a in registry.by_category(AgentCategory.DATA)] == ["b"]
+        assert len(registry.by_permission(PermissionLevel.MEDIUM)) == 2
+
+    def test_register_duplicate_name_rejected(self):
+        registry = AgentRegistry([self._agent("a")])
+        with pytest.raises(ValueError):
+            registry.register(self._agent("a"))
+
+    def test_lookup_results_are_copies(self):
+        agents = get_agents_by_category(AgentCategory.DATA)
+        agents.clear()
+        assert len(get_agents_by_category(AgentCategory.DATA)) == 2
+
+    def test_first_agent_wins_shared_demo_id(self):
+        registry = AgentRegistry([self._agent("a", demo_ids=[1]), self._agent("b", demo_ids=[1])])
+        assert registry.by_demo_id(1).name == "a"
@@ -0,0 +1,106 @@
+"""Smoke tests for benchmarks/ — the harness runs and emits the expected schema."""
+
+import json
+import random
+
+from benchmarks.inventory_forecast_benchmark import build_history, time_forecast
+from benchmarks.inventory_snapshot_benchmark import load_once
+from benchmarks.inventory_stream_benchmark import measure, write_synthetic_inventory
+from benchmarks.router_benchmark import (
+    _percentile,
+    build_rules,
+    build_utterances,
+    main,
+    run_benchmark,
+)
+from benchmarks.skill_parser_benchmark import build_document, legacy_parse, single_pass_parse
+from src.inventory_data import (
+    detect_anomalies,
+    load_inventory,
+    load_inventory_store,
+    stream_inventory_summary,
+)
+from src.inventory_snapshot import write_inventory_snapshot
+from src.router import ROUTING_RULES
+
+
+class TestRouterBenchmark:
+    def test_build_rules_pads_real_rules(self):
+        rules = build_rules(20, random.Random(0))
+        assert len(rules) == 20
+        assert rules[:8] == ROUTING_RULES
+
+    def test_build_rules_smaller_than_real_set(self):
+        assert len(build_rules(3, random.Random(0))) == 3
+
+    def test_utterance_length(self):
+        rules = build_rules(8, random.Random(0))
+        utterances = build_utterances(rules, 7, 5, random.Random(0))
+        assert len(utterances) == 5
+        assert all(len(u.split(" ")) == 7 for u in utterances)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert _percentile(values, 50) == 50
+        assert _percentile(values, 99) == 99
+        assert _percentile([], 50) == 0.0
+
+    def test_report_schema(self):
+        report = run_benchmark(scales=(8, 30), sizes=(3,), utterances_per_size=5, iterations=1)
+        assert {"timestamp", "python", "seed"} <= set(report["meta"])
+        results = report["results"]
+        assert len(results) == 2 * 1 * 3
+        assert {r["function"] for r in results} == {"route_intent", "explain_routing", "classify_intent"}
+        for r in results:
+            assert r["calls"] == 5
+            assert r["p50_us"] <= r["p95_us"] <= r["p99_us"]
+            assert r["calls_per_sec"] > 0
+
+    def test_cli_writes_json(self, tmp_path, capsys):
+        out = tmp_path / "bench.json"
+        main(["--scales", "8", "--sizes", "3", "--utterances", "3", "--iterations", "1",
+              "--output", str(out)])
+        report = json.loads(out.read_text(encoding="utf-8"))
+        assert len(report["results"]) == 3
+
+
+class TestSkillParserBenchmark:
+    def test_document_reaches_target_size(self):
+        doc = build_document(64 * 1024)
+        assert 60 * 1024 <= len(doc.encode("utf-8")) <= 64 * 1024
+
+    def test_parsers_agree_on_synthetic_document(self):
+        doc = build_document(32 * 1024)
+        assert single_pass_parse(doc) == legacy_parse(doc)
+
+
+class TestInventoryStreamBenchmark:
+    def test_synthetic_files_match_eager_path(self, tmp_path):
+        directory = write_synthetic_inventory(tmp_path, 3_000)
+        records = load_inventory(directory)
+        summary = stream_inventory_summary(directory, chunk_rows=64)
+        assert summary.row_count == len(records) == 3_000
+        assert summary.anomalies == detect_anomalies(records)
+
+    def test_measure_runs_in_subprocess(self, tmp_path):
+        directory = write_synthetic_inventory(tmp_path, 300)
+        result = measure("stream", directory)
+        assert result["rows"] == 300
+        assert result["peak_rss_mb"] > 0
+
+
+class TestInventorySnapshotBenchmark:
+    def test_load_once_both_formats(self, tmp_path):
+        csv_dir = write_synthetic_inventory(tmp_path / "csv", 300)
+        snapshot = write_inventory_snapshot(csv_dir, tmp_path / "inventory.snapshot")
+        assert load_once("csv", csv_dir) > 0
+        assert load_once("snapshot", snapshot) > 0
+
+
+class TestInventoryForecastBenchmark:
+    def test_history_drains_every_series(self, tmp_path):
+        store = load_inventory_store(write_synthetic_inventory(tmp_path, 300))
+        history = build_history(store, 4)
+        assert len(history) == 4 * len(store)
+        assert all(rate > 0 for rate in history.depletion_rates(days=7).values())
+        assert time_forecast(store, history, repeats=1) > 0
@@ -0,0 +1,86 @@
+"""Tests for src/classifiers.py and src/text_utils.py — statistical router backends."""
+
+import pytest
+
+from src.classifiers import DEMO_INTENTS, BM25Classifier
+from src.router import FoundryRouter, IntentCategory
+from src.text_utils import tokenize
+
+
+@pytest.fixture
+def bm25(all_skills):
+    return BM25Classifier.from_rules(skills=all_skills)
+
+
+class TestTokenize:
+    def test_latin_words(self):
+        assert tokenize("Check Inventory") == ["check", "inventory"]
+
+    def test_plural_stripped(self):
+        assert tokenize("meetings") == ["meeting"]
+        assert tokenize("status") == ["status"]
+
+    def test_cjk_unigrams_and_bigrams(self):
+        assert tokenize("庫存量") == ["庫", "存", "量", "庫存", "存量"]
+
+    def test_mixed_without_spaces(self):
+        tokens = tokenize("查一下inventory")
+        assert "inventory" in tokens
+        assert "一下" in tokens
+
+    def test_punctuation_dropped(self):
+        assert tokenize("?!, -") == []
+
+
+class TestBM25Classifier:
+    def test_demo_intents_cover_all_intents(self):
+        assert set(DEMO_INTENTS.values()) == set(IntentCategory) - {IntentCategory.UNKNOWN}
+
+    @pytest.mark.parametrize("text, expected", [
+        ("check inventory status", IntentCategory.INVENTORY_QUERY),
+        ("東京倉庫還剩多少盒", IntentCategory.INVENTORY_QUERY),
+        ("open a pull request to fix the timeout", IntentCategory.BUG_FIX),
+        ("東京今天的天氣如何", IntentCategory.EXTERNAL_SEARCH),
+        ("draft an incident summary", IntentCategory.INCIDENT_REPORT),
+        ("find a free slot on everyone's calendar", IntentCategory.MEETING_BOOKING),
+    ])
+    def test_classification(self, bm25, text, expected):
+        intent, confidence = bm25.classify(text)
+        assert intent == expected
+        assert 0.0 < confidence <= 1.0
+
+    def test_unknown(self, bm25):
+        assert bm25.classify("lorem ipsum dolor") == (IntentCategory.UNKNOWN, 0.0)
+
+    def test_trained_on_skill_triggers(self, bm25):
+        # "slots" only appears in the meeting skill's trigger list
+        scores = bm25.scores("slots")
+        assert IntentCategory.MEETING_BOOKING in scores
+
+    def test_custom_documents(self):
+        clf = BM25Classifier(
+            {
+                IntentCategory.BUG_FIX: ["crash", "stack trace"],
+                IntentCategory.MEETING_BOOKING: ["sync call"],
+            },
+            min_score=0.0,
+        )
+        assert clf.classify("app crash with stack trace")[0] == IntentCategory.BUG_FIX
+
+
+class TestRouterBackend:
+    def test_router_uses_classifier(self, bm25):
+        router = FoundryRouter(classifier=bm25)
+        agent, intent, _ = router.route("find a free slot on everyone's calendar")
+        assert intent == IntentCategory.MEETING_BOOKING
+        assert agent.name == "copilot-agent"
+
+    def test_unknown_routes_to_none(self, bm25):
+        router = FoundryRouter(classifier=bm25)
+        agent, intent, _ = router.route("lorem ipsum dolor")
+        assert agent is None and intent == IntentCategory.UNKNOWN
+
+    def test_batch_uses_classifier(self, bm25):
+        router = FoundryRouter(classifier=bm25)
+        texts = ["東京倉庫還剩多少盒", "draft an incident summary"]
+        assert list(router.route_batch(texts)) == [router.route(t) for t in texts]
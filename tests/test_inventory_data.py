@@ -0,0 +1,522 @@
+"""Tests for src/inventory_data.py — CSV inventory loader and report."""
+
+import os
+
+import pytest
+
+from src.exceptions import InventoryLoadError
+from src.inventory_data import (
+    InventoryQuery,
+    InventoryTracker,
+    InventoryRecord,
+    InventoryStore,
+    StringTable,
+    detect_anomalies,
+    generate_inventory_answer,
+    generate_inventory_report,
+    inventory_report_cache_stats,
+    invalidate_inventory_report_cache,
+    load_inventory,
+    load_inventory_regions,
+    load_inventory_store,
+    parse_inventory_query,
+    query_inventory,
+    stream_inventory_summary,
+)
+
+
+def _corrupt_quantity(csv_path, value="lots"):
+    lines = csv_path.read_text(encoding="utf-8").splitlines()
+    fields = lines[1].split(",")
+    fields[4] = value
+    lines[1] = ",".join(fields)
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _bump_mtime(path, seconds=5):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+class TestLoadInventory:
+    def test_loads_all_regions(self, inventory_dir):
+        records = load_inventory(inventory_dir)
+        assert {r.region for r in records} == {"TW", "JP", "US"}
+
+    def test_sorted_by_region_then_product(self, inventory_dir):
+        records = load_inventory(inventory_dir)
+        keys = [(r.region, r.product_id) for r in records]
+        assert keys == sorted(keys)
+
+    def test_note_column_optional(self, inventory_dir):
+        records = load_inventory(inventory_dir)
+        assert all(r.note == "" for r in records if r.region == "TW")
+        assert any(r.note for r in records if r.region == "US")
+
+    def test_missing_file_skipped(self, inventory_dir):
+        (inventory_dir / "jp_supplier_inventory.csv").unlink()
+        assert "JP" not in {r.region for r in load_inventory(inventory_dir)}
+
+
+def _record(product_id, region, status, quantity=100, warehouse="WH", note=""):
+    return InventoryRecord(
+        product_id=product_id, product_name="Pineapple Cake", region=region,
+        warehouse=warehouse, quantity=quantity, unit="box", status=status,
+        last_updated="2026-01-30", reorder_point=50, supplier="Supplier", note=note,
+    )
+
+
+class TestInventoryStore:
+    def test_string_table_interns(self):
+        table = StringTable()
+        assert table.intern("Tokyo") == table.intern("Tokyo") == 0
+        assert table.intern("Osaka") == 1
+        assert table[1] == "Osaka"
+        assert table.code("Nagoya") is None
+
+    def test_rows_round_trip(self, inventory_dir):
+        store = load_inventory_store(inventory_dir)
+        assert store.records() == load_inventory(inventory_dir)
+        assert store.row(0) == next(iter(store))
+
+    def test_repeated_values_stored_once(self):
+        store = InventoryStore.from_records(
+            _record(f"P{i}", "JP", "normal", warehouse="Tokyo") for i in range(100)
+        )
+        assert len(store) == 100
+        assert len(store.tables["warehouse"]) == 1
+        assert store.quantity.typecode == "q"
+
+    def test_region_totals(self, inventory_dir):
+        records = load_inventory(inventory_dir)
+        totals = load_inventory_store(inventory_dir).region_totals()
+        for region in ("TW", "JP", "US"):
+            assert totals[region] == sum(r.quantity for r in records if r.region == region)
+
+    def test_region_rows_contiguous_after_sort(self, inventory_dir):
+        groups = load_inventory_store(inventory_dir).region_rows()
+        assert all(isinstance(rows, range) for rows in groups.values())
+
+    def test_region_rows_interleaved(self):
+        store = InventoryStore.from_records([
+            _record("P1", "US", "normal", 10),
+            _record("P2", "JP", "normal", 20),
+            _record("P3", "US", "critical", 30),
+        ])
+        assert list(store.region_rows()["US"]) == [0, 2]
+        assert store.region_totals() == {"US": 40, "JP": 20}
+        assert store.worst_status("US") == "critical"
+
+    def test_worst_status(self):
+        store = InventoryStore.from_records([
+            _record("P1", "TW", "normal"),
+            _record("P2", "TW", "low"),
+            _record("P3", "JP", "out_of_stock", 0),
+            _record("P4", "US", "unknown"),
+        ])
+        assert store.worst_status() == "out_of_stock"
+        assert store.worst_status("TW") == "low"
+        assert store.worst_status("US") == "normal"
+        assert store.worst_status("XX") == "normal"
+
+    def test_rows_with_status(self):
+        store = InventoryStore.from_records([
+            _record("P1", "TW", "low"),
+            _record("P2", "TW", "normal"),
+            _record("P3", "TW", "critical"),
+            _record("P4", "TW", "low"),
+        ])
+        assert store.rows_with_status("low", "critical") == [0, 2, 3]
+        assert store.rows_with_status("missing") == []
+
+
+class TestLoadInventoryRegions:
+    def test_all_regions_loaded(self, inventory_dir):
+        report = load_inventory_regions(inventory_dir)
+        assert report.errors == []
+        assert set(report.timings) == {"TW", "JP", "US"}
+        assert report.store.records() == load_inventory(inventory_dir)
+
+    def test_single_worker_same_result(self, inventory_dir):
+        serial = load_inventory_regions(inventory_dir, workers=1)
+        assert serial.store.records() == load_inventory_regions(inventory_dir).store.records()
+
+    def test_bad_row_isolated_to_region(self, inventory_dir):
+        _corrupt_quantity(inventory_dir / "jp_supplier_inventory.csv")
+        report = load_inventory_regions(inventory_dir)
+        assert [e.region for e in report.errors] == ["JP"]
+        assert "line 2" in report.errors[0].reason
+        assert {r.region for r in report.store} == {"TW", "US"}
+
+    def test_missing_column(self, inventory_dir):
+        csv_path = inventory_dir / "tw_supplier_inventory.csv"
+        text = csv_path.read_text(encoding="utf-8")
+        csv_path.write_text(text.replace("reorder_point", "reorder", 1), encoding="utf-8")
+        report = load_inventory_regions(inventory_dir)
+        assert [e.region for e in report.errors] == ["TW"]
+        assert "reorder_point" in report.errors[0].reason
+
+    def test_strict_loader_raises(self, inventory_dir):
+        _corrupt_quantity(inventory_dir / "us_supplier_inventory.csv")
+        with pytest.raises(InventoryLoadError) as exc_info:
+            load_inventory_store(inventory_dir)
+        assert exc_info.value.region == "US"
+
+
+class TestDetectAnomalies:
+    def test_us_shortage_is_critical(self, inventory_dir):
+        anomalies = detect_anomalies(load_inventory(inventory_dir))
+        critical = [a for a in anomalies if a.severity == "critical"]
+        assert {a.region for a in critical} == {"US"}
+
+    def test_low_stock_is_warning(self, inventory_dir):
+        anomalies = detect_anomalies(load_inventory(inventory_dir))
+        assert any(a.severity == "warning" and a.region == "JP" for a in anomalies)
+
+    def test_store_and_records_agree(self, inventory_dir):
+        from_records = detect_anomalies(load_inventory(inventory_dir))
+        assert detect_anomalies(load_inventory_store(inventory_dir)) == from_records
+
+
+class TestStreamInventorySummary:
+    @pytest.mark.parametrize("chunk_rows", [1, 2, 10_000])
+    def test_matches_eager_path(self, inventory_dir, chunk_rows):
+        summary = stream_inventory_summary(inventory_dir, chunk_rows=chunk_rows)
+        store = load_inventory_store(inventory_dir)
+        assert summary.row_count == len(store)
+        assert {r: s.total_qty for r, s in summary.regions.items()} == store.region_totals()
+        for region, region_summary in summary.regions.items():
+            assert region_summary.worst_status == store.worst_status(region)
+        assert summary.anomalies == detect_anomalies(store)
+        assert summary.last_updated == store.value("last_updated", 0)
+
+    def test_no_records_kept(self, inventory_dir):
+        summary = stream_inventory_summary(inventory_dir)
+        assert list(summary.regions) == ["JP", "TW", "US"]
+        assert all(s.records == [] and s.row_count for s in summary.regions.values())
+
+    def test_anomalies_in_product_order(self, tmp_path):
+        header = "product_id,product_name,region,warehouse,quantity,unit,status,last_updated,reorder_point,supplier"
+        (tmp_path / "us_supplier_inventory.csv").write_text(
+            f"{header}\n"
+            "P2,Cake,US,B,10,box,critical,t2,50,S\n"
+            "P1,Cake,US,A,60,box,low,t1,50,S\n",
+            encoding="utf-8",
+        )
+        summary = stream_inventory_summary(tmp_path)
+        assert [a.warehouse for a in summary.anomalies] == ["A", "B"]
+        assert summary.last_updated == "t1"
+        assert summary.regions["US"].status_counts == {"critical": 1, "low": 1}
+
+    def test_no_data(self, tmp_path):
+        summary = stream_inventory_summary(tmp_path)
+        assert summary.regions == {} and summary.anomalies == [] and summary.row_count == 0
+
+
+def _edit(csv_path, old, new):
+    csv_path.write_text(csv_path.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+    _bump_mtime(csv_path)
+
+
+class TestInventoryTracker:
+    def test_first_refresh_adds_everything(self, inventory_dir):
+        tracker = InventoryTracker(inventory_dir)
+        delta = tracker.refresh()
+        assert len(delta.added) == len(load_inventory(inventory_dir))
+        assert delta.region_totals == load_inventory_store(inventory_dir).region_totals()
+        anomalies = detect_anomalies(load_inventory(inventory_dir))
+        assert tracker.anomalies() == anomalies
+        assert len(delta.anomalies_raised) == len(anomalies)
+
+    def test_unchanged_reload_is_empty(self, inventory_dir):
+        tracker = InventoryTracker(inventory_dir)
+        tracker.refresh()
+        _bump_mtime(inventory_dir / "tw_supplier_inventory.csv")
+        assert not tracker.refresh()
+
+    def test_modified_row(self, inventory_dir):
+        tracker = InventoryTracker(inventory_dir)
+        tracker.refresh()
+        _edit(inventory_dir / "jp_supplier_inventory.csv", ",580,", ",500,")
+        delta = tracker.refresh()
+        assert [(old.quantity, new.quantity) for old, new in delta.modified] == [(580, 500)]
+        assert delta.added == delta.removed == []
+        assert delta.region_totals["JP"] == 620
+
+    def test_anomaly_raised_and_cleared(self, inventory_dir):
+        tracker = InventoryTracker(inventory_dir)
+        tracker.refresh()
+        _edit(inventory_dir / "jp_supplier_inventory.csv", ",120,盒,low,", ",20,盒,critical,")
+        delta = tracker.refresh()
+        assert [a.severity for a in delta.anomalies_cleared] == ["warning"]
+        assert [a.severity for a in delta.anomalies_raised] == ["critical"]
+        assert tracker.anomalies() == detect_anomalies(load_inventory(inventory_dir))
+
+    def test_added_and_removed_rows(self, inventory_dir):
+        tracker = InventoryTracker(inventory_dir)
+        tracker.refresh()
+        csv_path = inventory_dir / "tw_supplier_inventory.csv"
+        lines = csv_path.read_text(encoding="utf-8").splitlines()
+        lines[1] = lines[1].replace("P101-TW,", "P102-TW,")
+        csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        delta = tracker.refresh()
+        assert [r.product_id for r in delta.added] == ["P102-TW"]
+        assert [r.product_id for r in delta.removed] == ["P101-TW"]
+        assert tracker.records() == load_inventory(inventory_dir)
+
+    def test_deleted_file_removes_region(self, inventory_dir):
+        tracker = InventoryTracker(inventory_dir)
+        tracker.refresh()
+        (inventory_dir / "us_supplier_inventory.csv").unlink()
+        delta = tracker.refresh()
+        assert {r.region for r in delta.removed} == {"US"}
+        assert "US" not in delta.region_totals
+        assert all(a.region != "US" for a in tracker.anomalies())
+
+    def test_row_moved_between_files(self, inventory_dir):
+        tracker = InventoryTracker(inventory_dir)
+        tracker.refresh()
+        jp, tw = inventory_dir / "jp_supplier_inventory.csv", inventory_dir / "tw_supplier_inventory.csv"
+        jp_lines = jp.read_text(encoding="utf-8").splitlines()
+        osaka = next(line for line in jp_lines if line.startswith("P101-JP-OS,"))
+        jp.write_text("\n".join(line for line in jp_lines if line != osaka) + "\n", encoding="utf-8")
+        tw.write_text(tw.read_text(encoding="utf-8") + osaka + "\n", encoding="utf-8")
+        _bump_mtime(jp)
+        _bump_mtime(tw)
+        assert not tracker.refresh()
+        assert tracker.records() == load_inventory(inventory_dir)
+        assert tracker.region_totals == load_inventory_store(inventory_dir).region_totals()
+        assert tracker.region_totals["JP"] == 700
+
+    def test_key_supplied_by_two_files(self, inventory_dir):
+        tracker = InventoryTracker(inventory_dir)
+        tracker.refresh()
+        jp, tw = inventory_dir / "jp_supplier_inventory.csv", inventory_dir / "tw_supplier_inventory.csv"
+        osaka = next(line for line in jp.read_text(encoding="utf-8").splitlines()
+                     if line.startswith("P101-JP-OS,"))
+        tw.write_text(tw.read_text(encoding="utf-8") + osaka.replace(",120,", ",90,") + "\n",
+                      encoding="utf-8")
+        _bump_mtime(tw)
+        assert not tracker.refresh()  # the JP file, later in file order, still wins
+
+        _edit(jp, osaka + "\n", "")
+        delta = tracker.refresh()
+        assert [(old.quantity, new.quantity) for old, new in delta.modified] == [(120, 90)]
+        assert delta.removed == []
+        assert tracker.region_totals["JP"] == 670
+
+        _edit(tw, osaka.replace(",120,", ",90,") + "\n", "")
+        delta = tracker.refresh()
+        assert [r.product_id for r in delta.removed] == ["P101-JP-OS"]
+        assert tracker.region_totals["JP"] == 580
+
+    def test_bad_file_keeps_previous_rows(self, inventory_dir):
+        tracker = InventoryTracker(inventory_dir)
+        tracker.refresh()
+        _corrupt_quantity(inventory_dir / "jp_supplier_inventory.csv")
+        _bump_mtime(inventory_dir / "jp_supplier_inventory.csv")
+        delta = tracker.refresh()
+        assert [e.region for e in delta.errors] == ["JP"]
+        assert not delta
+        assert tracker.region_totals["JP"] == 700
+        assert tracker.refresh().errors == []  # reported once
+
+
+class TestParseInventoryQuery:
+    @pytest.mark.parametrize("text, expected", [
+        ("how many boxes in Osaka?", InventoryQuery(warehouses=("大阪",))),
+        ("大阪還有多少盒", InventoryQuery(warehouses=("大阪",))),
+        ("Which warehouses are out of stock?", InventoryQuery(statuses=("out_of_stock",))),
+        ("US critical", InventoryQuery(regions=("US",), statuses=("critical",))),
+        ("P101-tw stock", InventoryQuery(product_prefix="P101-TW")),
+        ("P101-JP stock", InventoryQuery(product_prefix="P101-JP")),
+        ("How many P101 boxes in Japan?", InventoryQuery(regions=("JP",), product_prefix="P101")),
+        ("anything below reorder point in Japan?", InventoryQuery(regions=("JP",), below_reorder=True)),
+        ("日本 有異常嗎", InventoryQuery(regions=("JP",), statuses=("out_of_stock", "critical", "low"))),
+        ("compare stock in Japan and the US", InventoryQuery(regions=("JP", "US"))),
+        ("台灣和日本的庫存", InventoryQuery(regions=("TW", "JP"))),
+        ("Tokyo vs Osaka inventory", InventoryQuery(warehouses=("東京", "大阪"))),
+        ("Taipei and 臺北", InventoryQuery(warehouses=("台北",))),
+    ])
+    def test_filters(self, text, expected):
+        assert parse_inventory_query(text) == expected
+
+    @pytest.mark.parametrize("text", ["Check inventory", "查詢庫存", "tell us the stock level"])
+    def test_no_filters(self, text):
+        assert not parse_inventory_query(text)
+
+    @pytest.mark.parametrize("text, expected", [
+        ("What's the reorder point in Tokyo?", InventoryQuery(warehouses=("東京",))),
+        ("restock status for Osaka", InventoryQuery(warehouses=("大阪",))),
+        ("Which warehouses need to restock?", InventoryQuery(below_reorder=True)),
+        ("哪些倉庫低於補貨點", InventoryQuery(below_reorder=True)),
+    ])
+    def test_below_reorder_needs_explicit_phrasing(self, text, expected):
+        assert parse_inventory_query(text) == expected
+
+
+class TestQueryInventory:
+    def test_warehouse_substring(self, inventory_dir):
+        records = query_inventory(InventoryQuery(warehouses=("大阪",)), inventory_dir)
+        assert [r.product_id for r in records] == ["P101-JP-OS"]
+
+    def test_product_prefix(self, inventory_dir):
+        records = query_inventory(InventoryQuery(product_prefix="p101-us"), inventory_dir)
+        assert [r.product_id for r in records] == ["P101-US", "P101-US-NY"]
+
+    def test_filters_intersect(self, inventory_dir):
+        query = InventoryQuery(regions=("US",), statuses=("critical", "low"))
+        assert [r.warehouse for r in query_inventory(query, inventory_dir)] == ["LA Arcadia Warehouse"]
+
+    def test_below_reorder(self, inventory_dir):
+        records = query_inventory(InventoryQuery(below_reorder=True), inventory_dir)
+        assert records and all(r.quantity < r.reorder_point for r in records)
+
+    def test_empty_query_matches_all(self, inventory_dir):
+        assert query_inventory(InventoryQuery(), inventory_dir) == load_inventory(inventory_dir)
+
+    def test_unknown_region(self, inventory_dir):
+        assert query_inventory(InventoryQuery(regions=("KR",)), inventory_dir) == []
+
+    def test_two_regions(self, inventory_dir):
+        records = query_inventory(InventoryQuery(regions=("JP", "US")), inventory_dir)
+        assert sorted({r.region for r in records}) == ["JP", "US"]
+        assert len(records) == 4
+
+    def test_two_warehouses(self, inventory_dir):
+        records = query_inventory(InventoryQuery(warehouses=("東京", "大阪")), inventory_dir)
+        assert [r.product_id for r in records] == ["P101-JP", "P101-JP-OS"]
+
+    def test_region_and_warehouse(self, inventory_dir):
+        osaka = query_inventory(InventoryQuery(regions=("JP",), warehouses=("大阪",)), inventory_dir)
+        assert [r.product_id for r in osaka] == ["P101-JP-OS"]
+        mixed = query_inventory(InventoryQuery(regions=("JP",), warehouses=("台北",)), inventory_dir)
+        assert [r.product_id for r in mixed] == ["P101-JP", "P101-JP-OS", "P101-TW"]
+
+
+class TestGenerateInventoryAnswer:
+    def test_scoped_slice(self, inventory_dir):
+        answer = generate_inventory_answer("how many boxes in Osaka?", data_dir=inventory_dir)
+        assert "P101-JP-OS" in answer and "120" in answer
+        assert "東京" not in answer
+        full = generate_inventory_report(data_dir=inventory_dir)
+        assert len(answer) * 5 < len(full)
+
+    def test_comparison_lists_each_region(self, inventory_dir):
+        answer = generate_inventory_answer("compare stock in Japan and the US", data_dir=inventory_dir)
+        assert "東京中央倉庫" in answer and "New York Warehouse" in answer
+        assert "🇯🇵 Japan: 700 boxes · 🇺🇸 USA: 3 boxes" in answer
+
+    def test_product_and_region(self, inventory_dir):
+        answer = generate_inventory_answer("How many P101 boxes in Japan?", data_dir=inventory_dir)
+        assert "**2 row(s), 700 boxes**" in answer
+
+    def test_reorder_point_question_answered(self, inventory_dir):
+        answer = generate_inventory_answer("What's the reorder point in Tokyo?", data_dir=inventory_dir)
+        assert "P101-JP" in answer and "No inventory rows match" not in answer
+
+    def test_unscoped_falls_back_to_full_report(self, inventory_dir):
+        answer = generate_inventory_answer("check inventory", data_dir=inventory_dir)
+        assert answer == generate_inventory_report(data_dir=inventory_dir)
+
+    def test_no_match(self, inventory_dir):
+        answer = generate_inventory_answer("P999 stock", data_dir=inventory_dir)
+        assert "No inventory rows match" in answer
+
+    def test_reuses_cached_store(self, inventory_dir):
+        generate_inventory_report(data_dir=inventory_dir)
+        before = inventory_report_cache_stats()
+        generate_inventory_answer("Osaka", data_dir=inventory_dir)
+        assert inventory_report_cache_stats().misses == before.misses
+
+
+class TestInventoryReport:
+    def test_report_sections(self, inventory_dir):
+        report = generate_inventory_report(data_dir=inventory_dir)
+        assert "Global Summary" in report
+        assert "Anomaly Alert" in report
+
+    def test_explicit_records_bypass_cache(self, inventory_dir):
+        before = inventory_report_cache_stats()
+        report = generate_inventory_report(load_inventory(inventory_dir))
+        assert report == generate_inventory_report(data_dir=inventory_dir)
+        after = inventory_report_cache_stats()
+        assert after.hits + after.misses == before.hits + before.misses + 1
+
+    def test_no_data(self, tmp_path):
+        assert "No inventory data" in generate_inventory_report(data_dir=tmp_path)
+
+    def test_partial_report_on_bad_region(self, inventory_dir):
+        _corrupt_quantity(inventory_dir / "jp_supplier_inventory.csv")
+        report = generate_inventory_report(data_dir=inventory_dir)
+        assert "Partial data" in report
+        assert "🇯🇵 Japan: line 2" in report
+        assert "#### 🇹🇼 Taiwan" in report and "#### 🇺🇸 USA" in report
+        assert "#### 🇯🇵 Japan" not in report
+
+    def test_all_regions_bad_raises(self, inventory_dir):
+        for csv_path in inventory_dir.glob("*.csv"):
+            _corrupt_quantity(csv_path)
+        with pytest.raises(InventoryLoadError):
+            generate_inventory_report(data_dir=inventory_dir)
+
+
+class TestReportCache:
+    def test_unchanged_files_hit(self, inventory_dir):
+        first = generate_inventory_report(data_dir=inventory_dir)
+        before = inventory_report_cache_stats()
+        assert generate_inventory_report(data_dir=inventory_dir) is first
+        after = inventory_report_cache_stats()
+        assert after.hits == before.hits + 1
+        assert after.misses == before.misses
+
+    def test_edited_file_reloaded(self, inventory_dir):
+        generate_inventory_report(data_dir=inventory_dir)
+        csv_path = inventory_dir / "jp_supplier_inventory.csv"
+        csv_path.write_text(
+            csv_path.read_text(encoding="utf-8").replace(",580,", ",581,"), encoding="utf-8",
+        )
+        assert "581" in generate_inventory_report(data_dir=inventory_dir)
+
+    def test_touched_file_reloaded(self, inventory_dir):
+        generate_inventory_report(data_dir=inventory_dir)
+        before = inventory_report_cache_stats()
+        _bump_mtime(inventory_dir / "tw_supplier_inventory.csv")
+        generate_inventory_report(data_dir=inventory_dir)
+        assert inventory_report_cache_stats().misses == before.misses + 1
+
+    def test_replaced_file_reloaded(self, inventory_dir):
+        # Same size and mtime, new inode (atomic rename of a fresh export)
+        csv_path = inventory_dir / "us_supplier_inventory.csv"
+        generate_inventory_report(data_dir=inventory_dir)
+        st = csv_path.stat()
+        tmp = inventory_dir / "us.tmp"
+        tmp.write_text(
+            csv_path.read_text(encoding="utf-8").replace(",3,", ",4,"), encoding="utf-8",
+        )
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp, csv_path)
+        assert "**4**" in generate_inventory_report(data_dir=inventory_dir)
+
+    def test_deleted_file_reloaded(self, inventory_dir):
+        generate_inventory_report(data_dir=inventory_dir)
+        (inventory_dir / "us_supplier_inventory.csv").unlink()
+        assert "🇺🇸" not in generate_inventory_report(data_dir=inventory_dir)
+
+    def test_invalidation_hook(self, inventory_dir):
+        generate_inventory_report(data_dir=inventory_dir)
+        before = inventory_report_cache_stats()
+        invalidate_inventory_report_cache(inventory_dir)
+        generate_inventory_report(data_dir=inventory_dir)
+        after = inventory_report_cache_stats()
+        assert after.invalidations == before.invalidations + 1
+        assert after.misses == before.misses + 1
+
+    def test_invalidate_all(self, inventory_dir):
+        generate_inventory_report(data_dir=inventory_dir)
+        invalidate_inventory_report_cache()
+        assert inventory_report_cache_stats().size == 0
+
+    def test_hit_rate(self, inventory_dir):
+        stats = inventory_report_cache_stats()
+        assert 0.0 <= stats.hit_rate <= 1.0
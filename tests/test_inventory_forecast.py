@@ -0,0 +1,141 @@
+"""Tests for src/inventory_forecast.py — days-until-stockout and reorder suggestions."""
+
+from dataclasses import replace
+from datetime import date
+
+import pytest
+
+from src.inventory_data import generate_inventory_report, load_inventory
+from src.inventory_forecast import (
+    PendingShipment,
+    forecast_inventory,
+    parse_pending_shipment,
+)
+from src.inventory_history import InventoryHistory
+from src.inventory_snapshot import load_inventory_snapshot, write_inventory_snapshot
+
+AS_OF = date(2026, 1, 31)
+
+
+@pytest.fixture
+def records(inventory_dir):
+    return load_inventory(inventory_dir)
+
+
+def _history(records, drain, days=8):
+    """Daily snapshots ending at `records`, each warehouse in `drain` using that many boxes a day."""
+    history = InventoryHistory()
+    for day in range(days):
+        back = days - 1 - day
+        history.append([
+            replace(r, quantity=r.quantity + back * drain.get(r.warehouse, 0),
+                    last_updated=f"2026-01-{31 - back:02d}T08:00:00Z")
+            for r in records
+        ])
+    return history
+
+
+def _by_warehouse(forecast):
+    return {f.warehouse: f for f in forecast.forecasts()}
+
+
+class TestParsePendingShipment:
+    def test_chinese_note(self):
+        assert parse_pending_shipment("下午空運補貨 300 盒預計 2/1 到達", AS_OF) == (
+            PendingShipment(300, date(2026, 2, 1))
+        )
+
+    def test_english_note(self):
+        assert parse_pending_shipment("1,200 boxes air freight arriving 2/14", AS_OF) == (
+            PendingShipment(1200, date(2026, 2, 14))
+        )
+
+    def test_undated(self):
+        assert parse_pending_shipment("restock 80 boxes next week", AS_OF) == PendingShipment(80, None)
+
+    def test_year_rollover(self):
+        shipment = parse_pending_shipment("海運 500 箱 1/5 抵達", date(2025, 12, 30))
+        assert shipment.arrival == date(2026, 1, 5)
+
+    @pytest.mark.parametrize("note", ["", "已斷貨 5 天", "restock ETA 2/1", "sold 300 boxes yesterday"])
+    def test_not_a_shipment(self, note):
+        assert parse_pending_shipment(note, AS_OF) is None
+
+
+class TestForecastWithoutHistory:
+    def test_only_rows_below_reorder_point_ordered(self, records):
+        forecasts = _by_warehouse(forecast_inventory(records))
+        assert {w: f.suggested_order for w, f in forecasts.items() if f.suggested_order} == {
+            "New York Warehouse": 50,
+        }
+        assert forecasts["New York Warehouse"].days_until_stockout == 0.0
+        assert forecasts["東京中央倉庫"].days_until_stockout is None
+        assert forecasts["東京中央倉庫"].consumption_per_day is None
+
+    def test_pending_shipment_counts_toward_position(self, records):
+        la = _by_warehouse(forecast_inventory(records))["LA Arcadia Warehouse"]
+        assert la.pending == PendingShipment(300, date(2026, 2, 1))
+        assert la.suggested_order == 0
+
+    def test_as_of_defaults_to_last_sync(self, records):
+        assert forecast_inventory(records).as_of == AS_OF
+
+    def test_unparseable_last_updated_ignored(self, records):
+        records[0] = replace(records[0], last_updated="yesterday")
+        assert forecast_inventory(records).as_of == AS_OF
+
+    def test_snapshot_store(self, inventory_dir, tmp_path):
+        store = load_inventory_snapshot(write_inventory_snapshot(inventory_dir, tmp_path / "inv.snapshot"))
+        assert forecast_inventory(store).forecasts() == forecast_inventory(load_inventory(inventory_dir)).forecasts()
+
+
+class TestForecastWithHistory:
+    def test_rate_days_and_order(self, records):
+        forecast = forecast_inventory(records, _history(records, {"東京中央倉庫": 60}))
+        tokyo = _by_warehouse(forecast)["東京中央倉庫"]
+        assert tokyo.consumption_per_day == pytest.approx(60.0)
+        assert tokyo.days_until_stockout == pytest.approx(580 / 60)
+        # position 580 - 7 days × 60 ≤ reorder point 200 → order up to 200 + 21 days × 60
+        assert tokyo.suggested_order == 200 + 21 * 60 - 580
+
+    def test_not_yet_at_reorder_point(self, records):
+        taipei = _by_warehouse(forecast_inventory(records, _history(records, {"台北中央倉庫": 60})))["台北中央倉庫"]
+        assert taipei.days_until_stockout == pytest.approx(35.0)
+        assert taipei.suggested_order == 0
+
+    def test_shipment_landing_before_stockout(self, records):
+        la = _by_warehouse(forecast_inventory(records, _history(records, {"LA Arcadia Warehouse": 1})))
+        assert la["LA Arcadia Warehouse"].days_until_stockout == pytest.approx(303.0)
+
+    def test_stockout_before_shipment_lands(self, records):
+        la = _by_warehouse(forecast_inventory(records, _history(records, {"LA Arcadia Warehouse": 10})))
+        assert la["LA Arcadia Warehouse"].days_until_stockout == pytest.approx(0.3)
+
+    def test_growing_stock_is_not_negative_demand(self, records):
+        forecast = forecast_inventory(records, _history(records, {"高雄南區倉庫": -50}))
+        assert _by_warehouse(forecast)["高雄南區倉庫"].consumption_per_day == 0.0
+
+    def test_reorder_rows_soonest_first(self, records):
+        forecast = forecast_inventory(records, _history(records, {"東京中央倉庫": 60}))
+        assert [forecast.row(i).warehouse for i in forecast.reorder_rows()] == [
+            "New York Warehouse", "東京中央倉庫",
+        ]
+
+
+class TestReportNextSteps:
+    def test_steps_from_forecast(self, inventory_dir):
+        report = generate_inventory_report(data_dir=inventory_dir)
+        steps = report.split("Suggested Next Steps")[1]
+        assert "1. **Reorder 50 boxes** for New York Warehouse (🇺🇸 USA) — out of stock" in steps
+        assert "2. Confirm the **300-box shipment** to LA Arcadia Warehouse (🇺🇸 USA) due 2/1" in steps
+
+    def test_nothing_to_do(self, records):
+        healthy = [r for r in records if r.region != "US"]
+        assert "1. Continue monitoring stock levels" in generate_inventory_report(healthy)
+
+    def test_history_adds_trend_and_reorder(self, inventory_dir, records):
+        report = generate_inventory_report(
+            data_dir=inventory_dir, history=_history(records, {"東京中央倉庫": 200}),
+        )
+        assert "東京中央倉庫: draining ~200 boxes/day" in report
+        assert "**Reorder 3,820 boxes** for 東京中央倉庫 (🇯🇵 Japan) — out of stock in ~2.9 days" in report
@@ -0,0 +1,187 @@
+"""Tests for src/inventory_history.py — append-only inventory history."""
+
+from dataclasses import replace
+
+import pytest
+
+from src.inventory_data import detect_anomalies, load_inventory
+from src.inventory_history import (
+    LOG_FILENAME,
+    SERIES_FILENAME,
+    InventoryHistory,
+    parse_timestamp,
+)
+
+
+@pytest.fixture
+def records(inventory_dir):
+    return load_inventory(inventory_dir)
+
+
+def _snapshots(records, days, drain=None):
+    """One snapshot per day; `drain` maps warehouse → boxes used per day (default 5)."""
+    drain = drain or {}
+    for day in range(days):
+        yield [
+            replace(
+                r,
+                quantity=max(0, r.quantity - day * drain.get(r.warehouse, 5)),
+                last_updated=f"2026-01-{10 + day:02d}T08:00:00Z",
+            )
+            for r in records
+        ]
+
+
+def _filled(records, days=10, drain=None, directory=None):
+    history = InventoryHistory(directory)
+    for snapshot in _snapshots(records, days, drain):
+        history.append(snapshot)
+    return history
+
+
+class TestParseTimestamp:
+    def test_utc_suffix(self):
+        assert parse_timestamp("2026-01-31T08:00:00Z") == parse_timestamp("2026-01-31T08:00:00+00:00")
+
+    def test_naive_is_utc(self):
+        assert parse_timestamp("1970-01-02T00:00:00") == 86_400
+
+
+class TestAppend:
+    def test_one_point_per_row(self, records):
+        history = _filled(records, days=3)
+        assert len(history) == 3 * len(records)
+        assert len(history.series_keys()) == len(records)
+
+    def test_same_snapshot_twice_is_skipped(self, records):
+        history = InventoryHistory()
+        assert history.append(records) == len(records)
+        assert history.append(records) == 0
+
+    def test_late_point_kept_in_order(self, records):
+        history = InventoryHistory()
+        snapshots = list(_snapshots(records, 3))
+        for snapshot in (snapshots[2], snapshots[0], snapshots[1]):
+            history.append(snapshot)
+        stats = history.window("P101-TW", "台北中央倉庫", days=30)
+        assert stats.first_qty == 2100 and stats.last_qty == 2090
+        assert stats.depletion_per_day == pytest.approx(5.0)
+
+
+class TestWindow:
+    def test_depletion_and_stockout(self, records):
+        history = _filled(records, drain={"東京中央倉庫": 60})
+        stats = history.window("P101-JP", "東京中央倉庫", days=7)
+        assert stats.points == 8
+        assert stats.depletion_per_day == pytest.approx(60.0)
+        assert stats.last_qty == 580 - 9 * 60
+        assert stats.days_until_stockout == pytest.approx(40 / 60)
+
+    def test_min_max(self, records):
+        history = _filled(records, days=10)
+        stats = history.window("P101-TW", "台北中央倉庫", days=3)
+        assert (stats.min_qty, stats.max_qty) == (2100 - 45, 2100 - 30)
+
+    def test_explicit_end(self, records):
+        history = _filled(records, days=10)
+        end = parse_timestamp("2026-01-12T08:00:00Z")
+        stats = history.window("P101-TW", "台北中央倉庫", days=1, end=end)
+        assert stats.points == 2
+        assert stats.last_qty == 2090
+
+    def test_not_draining(self, records):
+        history = _filled(records, days=5, drain={"台北中央倉庫": 0})
+        stats = history.window("P101-TW", "台北中央倉庫", days=7)
+        assert stats.depletion_per_day == pytest.approx(0.0)
+        assert stats.days_until_stockout is None
+
+    def test_unknown_series_or_empty_window(self, records):
+        history = _filled(records, days=2)
+        assert history.window("P999", "Nowhere", days=7) is None
+        assert history.window("P101-TW", "台北中央倉庫", days=1, end=0) is None
+
+    def test_windows_covers_all_series(self, records):
+        assert len(_filled(records, days=2).windows(days=7)) == len(records)
+
+    def test_depletion_rates_match_windows(self, records):
+        history = _filled(records, drain={"東京中央倉庫": 60})
+        rates = history.depletion_rates(days=7)
+        assert rates == {(s.product_id, s.warehouse): s.depletion_per_day for s in history.windows(days=7)}
+        assert rates[("P101-JP", "東京中央倉庫")] == pytest.approx(60.0)
+
+
+class TestPersistence:
+    def test_reopen(self, records, tmp_path):
+        _filled(records, directory=tmp_path / "history")
+        reopened = InventoryHistory(tmp_path / "history")
+        assert len(reopened) == 10 * len(records)
+        assert reopened.window("P101-JP", "東京中央倉庫", days=7).depletion_per_day == pytest.approx(5.0)
+
+    def test_fixed_width_log(self, records, tmp_path):
+        _filled(records, days=4, directory=tmp_path)
+        assert (tmp_path / LOG_FILENAME).stat().st_size == 4 * len(records) * 20
+
+    def test_truncated_tail_ignored(self, records, tmp_path):
+        _filled(records, days=2, directory=tmp_path)
+        with open(tmp_path / LOG_FILENAME, "ab") as f:
+            f.write(b"\x01\x02\x03")
+        assert len(InventoryHistory(tmp_path)) == 2 * len(records)
+
+    def test_append_after_torn_tail(self, records, tmp_path):
+        snapshots = list(_snapshots(records, 3))
+        history = InventoryHistory(tmp_path)
+        history.append(snapshots[0])
+        with open(tmp_path / LOG_FILENAME, "ab") as f:
+            f.write(b"\x01\x02\x03")
+        with open(tmp_path / SERIES_FILENAME, "ab") as f:
+            f.write(b'{"id": 99, "product_')
+        InventoryHistory(tmp_path).append(snapshots[1])
+
+        reloaded = InventoryHistory(tmp_path)
+        assert len(reloaded) == 2 * len(records)
+        stats = reloaded.window("P101-TW", "台北中央倉庫", days=30)
+        assert (stats.first_qty, stats.last_qty) == (2100, 2095)
+        assert stats.end == parse_timestamp("2026-01-11T08:00:00Z")
+
+    def test_series_without_log_not_rewritten(self, records, tmp_path):
+        snapshots = list(_snapshots(records, 2))
+        InventoryHistory(tmp_path).append(snapshots[0])
+        (tmp_path / LOG_FILENAME).unlink()
+        InventoryHistory(tmp_path).append(snapshots[1])
+
+        assert len((tmp_path / SERIES_FILENAME).read_text(encoding="utf-8").splitlines()) == len(records)
+        reloaded = InventoryHistory(tmp_path)
+        assert len(reloaded) == len(records)
+        assert reloaded.window("P101-TW", "台北中央倉庫", days=30).last_qty == 2095
+
+    def test_series_keyed_by_stored_id(self, records, tmp_path):
+        _filled(records, days=3, directory=tmp_path)
+        series_path = tmp_path / SERIES_FILENAME
+        series_path.write_text(
+            "".join(reversed(series_path.read_text(encoding="utf-8").splitlines(keepends=True))),
+            encoding="utf-8",
+        )
+        reloaded = InventoryHistory(tmp_path)
+        stats = reloaded.window("P101-TW", "台北中央倉庫", days=30)
+        assert (stats.points, stats.first_qty, stats.last_qty) == (3, 2100, 2090)
+        # New series continue after the highest stored id
+        reloaded.append([replace(records[0], product_id="P999", last_updated="2026-01-20T08:00:00Z")])
+        assert InventoryHistory(tmp_path).window("P999", records[0].warehouse, days=30).last_qty == records[0].quantity
+
+
+class TestTrendAnomalies:
+    def test_draining_warehouse_flagged(self, records):
+        history = _filled(records, drain={"台北中央倉庫": 200})
+        current = [replace(r, quantity=500) if r.warehouse == "台北中央倉庫" else r for r in records]
+        trends = [a for a in detect_anomalies(current, history=history) if "draining" in a.message]
+        assert [(a.severity, a.warehouse) for a in trends] == [("warning", "台北中央倉庫")]
+        assert "~200 boxes/day" in trends[0].message
+
+    def test_slow_drain_not_flagged(self, records):
+        history = _filled(records)
+        assert detect_anomalies(records, history=history) == detect_anomalies(records)
+
+    def test_critical_rows_not_duplicated(self, records):
+        history = _filled(records, drain={"LA Arcadia Warehouse": 50})
+        anomalies = detect_anomalies(records, history=history)
+        assert sum(a.warehouse == "LA Arcadia Warehouse" for a in anomalies) == 1
@@ -0,0 +1,93 @@
+"""Tests for src/inventory_snapshot.py — binary columnar inventory snapshots."""
+
+import os
+
+import pytest
+
+from src.inventory_data import (
+    InventoryQuery,
+    detect_anomalies,
+    generate_inventory_report,
+    invalidate_inventory_report_cache,
+    load_inventory,
+    load_inventory_regions,
+)
+from src.inventory_snapshot import (
+    SNAPSHOT_FILENAME,
+    SnapshotFormatError,
+    load_inventory_snapshot,
+    open_fresh_snapshot,
+    write_inventory_snapshot,
+)
+
+
+def _bump_mtime(path, seconds=5):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+class TestSnapshotRoundTrip:
+    def test_default_path(self, inventory_dir):
+        assert write_inventory_snapshot(inventory_dir) == inventory_dir / SNAPSHOT_FILENAME
+
+    def test_records_match_csv(self, inventory_dir, tmp_path):
+        path = write_inventory_snapshot(inventory_dir, tmp_path / "inv.snapshot")
+        store = load_inventory_snapshot(path)
+        csv_records = load_inventory(inventory_dir)
+        assert store.records() == csv_records
+        assert detect_anomalies(store) == detect_anomalies(csv_records)
+
+    def test_columns_are_memory_mapped(self, inventory_dir, tmp_path):
+        store = load_inventory_snapshot(write_inventory_snapshot(inventory_dir, tmp_path / "inv.snapshot"))
+        assert isinstance(store.quantity, memoryview)
+        assert store.quantity.readonly
+        assert all(isinstance(column, memoryview) for column in store.codes.values())
+
+    def test_column_operations(self, inventory_dir, tmp_path):
+        csv_store = load_inventory_regions(inventory_dir, use_snapshot=False).store
+        store = load_inventory_snapshot(write_inventory_snapshot(inventory_dir, tmp_path / "inv.snapshot"))
+        assert store.region_totals() == csv_store.region_totals()
+        for region in ("TW", "JP", "US"):
+            assert store.worst_status(region) == csv_store.worst_status(region)
+        query = InventoryQuery(warehouses=("大阪",))
+        assert store.query(query) == csv_store.query(query)
+
+    def test_not_a_snapshot(self, tmp_path):
+        path = tmp_path / "garbage.snapshot"
+        path.write_bytes(b"product_id,quantity\n" * 4)
+        with pytest.raises(SnapshotFormatError):
+            load_inventory_snapshot(path)
+
+
+class TestSnapshotLoading:
+    def test_fresh_snapshot_used(self, inventory_dir):
+        write_inventory_snapshot(inventory_dir)
+        report = load_inventory_regions(inventory_dir)
+        assert set(report.timings) == {"snapshot"}
+        assert report.store.records() == load_inventory_regions(inventory_dir, use_snapshot=False).store.records()
+
+    def test_report_identical(self, inventory_dir):
+        expected = generate_inventory_report(data_dir=inventory_dir)
+        write_inventory_snapshot(inventory_dir)
+        invalidate_inventory_report_cache(inventory_dir)
+        assert generate_inventory_report(data_dir=inventory_dir) == expected
+
+    def test_stale_after_csv_edit(self, inventory_dir):
+        write_inventory_snapshot(inventory_dir)
+        csv_path = inventory_dir / "jp_supplier_inventory.csv"
+        csv_path.write_text(
+            csv_path.read_text(encoding="utf-8").replace(",580,", ",581,"), encoding="utf-8",
+        )
+        _bump_mtime(csv_path)
+        assert open_fresh_snapshot(inventory_dir) is None
+        assert any(r.quantity == 581 for r in load_inventory(inventory_dir))
+
+    def test_stale_after_csv_removed(self, inventory_dir):
+        write_inventory_snapshot(inventory_dir)
+        (inventory_dir / "us_supplier_inventory.csv").unlink()
+        assert open_fresh_snapshot(inventory_dir) is None
+
+    def test_corrupt_snapshot_ignored(self, inventory_dir):
+        (inventory_dir / SNAPSHOT_FILENAME).write_bytes(b"ZINVSNAP")
+        assert open_fresh_snapshot(inventory_dir) is None
+        assert len(load_inventory(inventory_dir)) == 7
@@ -1,15 +1,28 @@
 """Tests for src/router.py — Foundry Agent intent router."""
 
+import asyncio
+import json
+import os
+import time
+
 import pytest
 
 from src.router import (
     ROUTING_RULES,
     FoundryRouter,
     IntentCategory,
+    INTENT_DEPENDENCIES,
+    RoutingBatch,
+    RoutingPlan,
     RoutingRule,
+    RulesFileWatcher,
+    dump_rules_file,
+    load_rules_file,
     route_intent,
 )
 from src.agents import AGENT_REGISTRY
+from src.exceptions import RoutingRulesError
+from src.keyword_automaton import KeywordAutomaton
 
 
 @pytest.fixture
@@ -96,6 +109,68 @@ class TestClassifyIntent:
         assert conf_multi >= conf_single
 
 
+class TestKeywordAutomaton:
+    """Aho-Corasick matcher used by the router."""
+
+    def test_finds_overlapping_and_nested_patterns(self):
+        automaton = KeywordAutomaton(["log", "logistics", "gist", "stick"])
+        assert automaton.find_all("logistics") == {0, 1, 2}
+
+    def test_mixed_cjk_and_latin(self):
+        automaton = KeywordAutomaton(["庫存", "stock", "鳳梨酥"])
+        assert automaton.find_all("鳳梨酥stock庫存") == {0, 1, 2}
+
+    def test_no_match(self):
+        automaton = KeywordAutomaton(["bug", "fix"])
+        assert automaton.find_all("weather") == set()
+
+    def test_empty_pattern_ignored(self):
+        automaton = KeywordAutomaton(["", "a"])
+        assert automaton.find_all("abc") == {1}
+
+
+class TestScoreIntents:
+    """Per-intent keyword hit counts from the compiled automaton."""
+
+    def test_counts_per_intent(self, router):
+        scores = router.score_intents("inventory stock 物流")
+        assert scores[IntentCategory.INVENTORY_QUERY] == 2
+        assert scores[IntentCategory.LOGISTICS_TRACK] == 1
+
+    def test_substring_semantics_preserved(self, router):
+        # "log" (system health) is a substring of "logistics"
+        scores = router.score_intents("logistics")
+        assert scores[IntentCategory.LOGISTICS_TRACK] == 1
+        assert scores[IntentCategory.SYSTEM_HEALTH] == 1
+
+    def test_ties_resolve_in_rule_order(self, router):
+        intent, _ = router.classify_intent("logistics")
+        assert intent == IntentCategory.LOGISTICS_TRACK
+
+    def test_custom_rules(self):
+        rules = [
+            RoutingRule(IntentCategory.BUG_FIX, "coding-agent", ["crash", "Trace"], "bugs"),
+            RoutingRule(IntentCategory.MEETING_BOOKING, "copilot-agent", ["sync"], "meet"),
+        ]
+        router = FoundryRouter(rules=rules)
+        assert router.classify_intent("stack TRACE after crash")[0] == IntentCategory.BUG_FIX
+        assert router.classify_intent("check inventory")[0] == IntentCategory.UNKNOWN
+
+    def test_rules_are_read_only(self, router):
+        with pytest.raises(AttributeError):
+            router.rules.append(
+                RoutingRule(IntentCategory.MEETING_BOOKING, "copilot-agent", ["inventory"], "x"),
+            )
+        assert router.rules == tuple(ROUTING_RULES)
+
+    def test_reassigning_rules_recompiles(self):
+        router = FoundryRouter()
+        router.rules = [
+            RoutingRule(IntentCategory.MEETING_BOOKING, "copilot-agent", ["inventory"], "x"),
+        ]
+        assert router.classify_intent("inventory")[0] == IntentCategory.MEETING_BOOKING
+
+
 class TestRoute:
     """Full routing: input → agent."""
 
@@ -154,6 +229,400 @@ class TestRoute:
         assert "Unable to classify" in text or "\u26a0" in text or "unable" in text.lower()
 
 
+class TestRoutingIndex:
+    """Precomputed lookup tables and atomic rebuild."""
+
+    def test_index_tables(self, router):
+        index = router._index
+        assert index.max_keywords == max(len(r.keywords) for r in ROUTING_RULES)
+        assert index.rule_by_intent[IntentCategory.BUG_FIX].agent_name == "coding-agent"
+        assert index.agent_by_intent[IntentCategory.BUG_FIX].name == "coding-agent"
+
+    def test_index_is_immutable(self, router):
+        with pytest.raises(Exception):
+            router._index.max_keywords = 1
+        with pytest.raises(TypeError):
+            router._index.agent_by_intent[IntentCategory.BUG_FIX] = None
+
+    def test_rebuild_swaps_whole_index(self, router):
+        old_index = router._index
+        router.rebuild([
+            RoutingRule(IntentCategory.MEETING_BOOKING, "copilot-agent", ["inventory"], "x"),
+        ])
+        assert router._index is not old_index
+        # A caller still holding the old snapshot keeps a consistent view
+        assert FoundryRouter._classify(old_index, "inventory")[0] == IntentCategory.INVENTORY_QUERY
+        assert router.classify_intent("inventory")[0] == IntentCategory.MEETING_BOOKING
+
+    def test_rebuild_without_rules_keeps_rule_set(self, router):
+        router.rebuild()
+        assert router.rules == tuple(ROUTING_RULES)
+
+    def test_rebuild_keeps_cache_counters(self):
+        router = FoundryRouter(cache_size=4)
+        router.route("inventory")
+        router.route("inventory")
+        router.rebuild()
+        stats = router.cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 0)
+
+
+class TestRouteMulti:
+    """Multi-intent routing and parallel execution plans."""
+
+    def test_report_then_meeting(self, router):
+        plan = router.route_multi("compile a report and schedule a meeting")
+        intents = {m.intent for m in plan.matches}
+        assert intents == {IntentCategory.INCIDENT_REPORT, IntentCategory.MEETING_BOOKING}
+        stage_intents = [[m.intent for m in stage] for stage in plan.stages]
+        assert stage_intents == [
+            [IntentCategory.INCIDENT_REPORT],
+            [IntentCategory.MEETING_BOOKING],
+        ]
+        assert not plan.is_parallel
+
+    def test_independent_agents_share_a_stage(self, router):
+        plan = router.route_multi("logistics tracking and weather news")
+        assert plan.is_parallel
+        first = {m.intent for m in plan.stages[0]}
+        assert {IntentCategory.LOGISTICS_TRACK, IntentCategory.EXTERNAL_SEARCH} <= first
+
+    def test_matches_ranked_by_hits(self, router):
+        plan = router.route_multi("inventory stock supplier weather")
+        assert plan.primary.intent == IntentCategory.INVENTORY_QUERY
+        hits = [m.hits for m in plan.matches]
+        assert hits == sorted(hits, reverse=True)
+
+    def test_primary_agrees_with_route(self, router):
+        text = "check inventory and weather then write incident report"
+        agent, intent, confidence = router.route(text)
+        primary = router.route_multi(text).primary
+        assert (primary.agent, primary.intent, primary.confidence) == (agent, intent, confidence)
+
+    def test_dependencies_run_first(self, router):
+        plan = router.route_multi("check inventory and weather, write incident report, schedule meeting")
+        stage_of = {m.intent: i for i, stage in enumerate(plan.stages) for m in stage}
+        for intent, deps in INTENT_DEPENDENCIES.items():
+            for dep in deps:
+                if intent in stage_of and dep in stage_of:
+                    assert stage_of[dep] < stage_of[intent]
+
+    def test_same_agent_never_in_one_stage(self, router):
+        plan = router.route_multi("incident report and meeting calendar schedule")
+        for stage in plan.stages:
+            names = [m.agent.name for m in stage]
+            assert len(names) == len(set(names))
+
+    def test_threshold_filters(self, router):
+        plan = router.route_multi("inventory stock supplier weather", threshold=0.2)
+        assert [m.intent for m in plan.matches] == [IntentCategory.INVENTORY_QUERY]
+
+    def test_unknown_gives_empty_plan(self, router):
+        plan = router.route_multi("lorem ipsum")
+        assert isinstance(plan, RoutingPlan)
+        assert plan.matches == [] and plan.stages == [] and plan.primary is None
+
+
+class TestRouteBatch:
+    """Batch routing and transcript replay."""
+
+    INPUTS = [
+        "check inventory stock",
+        "fix the bug in code",
+        "lorem ipsum",
+        "物流 logistics tracking",
+        "CHECK INVENTORY STOCK",
+        "",
+    ]
+
+    def test_matches_single_route(self, router):
+        batch = router.route_batch(self.INPUTS)
+        assert isinstance(batch, RoutingBatch)
+        assert len(batch) == len(self.INPUTS)
+        for text, result in zip(self.INPUTS, batch):
+            assert result == router.route(text)
+
+    def test_parallel_arrays(self, router):
+        batch = router.route_batch(self.INPUTS)
+        assert len(batch.agents) == len(batch.intents) == len(batch.confidences)
+        assert batch.intents[2] == IntentCategory.UNKNOWN
+        assert batch.agents[2] is None
+        assert batch.confidences[2] == 0.0
+
+    def test_classifier_sees_original_text(self):
+        router = FoundryRouter(classifier=_CaseSensitiveClassifier())
+        batch = router.route_batch(["US stock", "us stock", "US stock"])
+        assert batch.intents == [
+            IntentCategory.INVENTORY_QUERY, IntentCategory.UNKNOWN, IntentCategory.INVENTORY_QUERY,
+        ]
+        assert list(batch) == [router.route(t) for t in ["US stock", "us stock", "US stock"]]
+
+    def test_accepts_generator(self, router):
+        batch = router.route_batch(t for t in ["weather", "meeting"])
+        assert batch.intents == [IntentCategory.EXTERNAL_SEARCH, IntentCategory.MEETING_BOOKING]
+
+    def test_route_transcript(self, router, tmp_path):
+        source = tmp_path / "chat.jsonl"
+        source.write_text(
+            "\n".join(json.dumps({"id": i, "text": t}, ensure_ascii=False)
+                      for i, t in enumerate(self.INPUTS)) + "\n\n",
+            encoding="utf-8",
+        )
+        dest = tmp_path / "routed.jsonl"
+        written = router.route_transcript(source, dest, batch_size=4)
+        assert written == len(self.INPUTS)
+
+        rows = [json.loads(line) for line in dest.read_text(encoding="utf-8").splitlines()]
+        assert [r["id"] for r in rows] == list(range(len(self.INPUTS)))
+        assert rows[0]["agent"] == "inventory-agent"
+        assert rows[0]["intent"] == "inventory_query"
+        assert rows[2]["agent"] is None
+        assert rows[2]["intent"] == "unknown"
+
+
+class TestRoutingCache:
+    """Opt-in LRU cache of routing decisions."""
+
+    def test_disabled_by_default(self, router):
+        router.route("check inventory stock")
+        router.route("check inventory stock")
+        stats = router.cache_stats()
+        assert stats.hits == 0 and stats.size == 0
+
+    def test_hits_on_normalized_input(self):
+        router = FoundryRouter(cache_size=8)
+        first = router.route("check inventory stock")
+        second = router.route("CHECK Inventory Stock")
+        assert first == second
+        stats = router.cache_stats()
+        assert stats.misses == 1
+        assert stats.hits == 1
+        assert stats.hit_rate == 0.5
+
+    def test_explanation_cached(self):
+        router = FoundryRouter(cache_size=8)
+        text = router.route_with_explanation("check inventory stock")
+        assert router.route_with_explanation("check inventory stock") is text
+        assert router.cache_stats().hits == 1
+
+    def test_unknown_explanation_echoes_raw_input(self):
+        router = FoundryRouter(cache_size=8)
+        router.route_with_explanation("Lorem Ipsum")
+        text = router.route_with_explanation("lorem ipsum")
+        assert "Input: lorem ipsum" in text
+
+    def test_evicts_least_recently_used(self):
+        router = FoundryRouter(cache_size=2)
+        router.route("inventory")
+        router.route("weather")
+        router.route("inventory")      # refresh
+        router.route("meeting")        # evicts "weather"
+        stats = router.cache_stats()
+        assert stats.evictions == 1
+        assert stats.size == 2
+        router.route("weather")
+        assert router.cache_stats().misses == 4
+
+    def test_cleared_when_rules_change(self):
+        router = FoundryRouter(cache_size=8)
+        assert router.route("inventory")[1] == IntentCategory.INVENTORY_QUERY
+        router.rules = [
+            RoutingRule(IntentCategory.MEETING_BOOKING, "copilot-agent", ["inventory"], "x"),
+        ]
+        assert router.cache_stats().size == 0
+        assert router.route("inventory")[1] == IntentCategory.MEETING_BOOKING
+
+
+class TestRulesFile:
+    """Loading routing rules from JSON / YAML files and hot reload."""
+
+    @pytest.mark.parametrize("suffix", [".json", ".yaml"])
+    def test_round_trip(self, tmp_path, suffix):
+        path = tmp_path / f"rules{suffix}"
+        dump_rules_file(ROUTING_RULES, path)
+        assert load_rules_file(path) == ROUTING_RULES
+
+    def test_top_level_list(self, tmp_path):
+        path = tmp_path / "rules.yaml"
+        path.write_text(
+            "- intent: bug_fix\n  agent_name: coding-agent\n  keywords: [crash]\n",
+            encoding="utf-8",
+        )
+        rules = load_rules_file(path)
+        assert rules[0].intent == IntentCategory.BUG_FIX
+        assert rules[0].description == ""
+
+    @pytest.mark.parametrize("content, reason", [
+        ("rules: []", "non-empty"),
+        ("rules: [{agent_name: coding-agent, keywords: [x]}]", "missing"),
+        ("rules: [{intent: nope, agent_name: coding-agent, keywords: [x]}]", "nope"),
+        ("rules: [{intent: bug_fix, agent_name: ghost-agent, keywords: [x]}]", "unknown agent"),
+        ("rules: [{intent: bug_fix, agent_name: coding-agent, keywords: crash}]", "list of strings"),
+        ("rules: [: bad", "rules.yaml"),
+    ])
+    def test_invalid_files(self, tmp_path, content, reason):
+        path = tmp_path / "rules.yaml"
+        path.write_text(content, encoding="utf-8")
+        with pytest.raises(RoutingRulesError, match=reason):
+            load_rules_file(path)
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(RoutingRulesError):
+            load_rules_file(tmp_path / "missing.json")
+
+    def test_from_rules_file(self, tmp_path):
+        path = tmp_path / "rules.json"
+        dump_rules_file(ROUTING_RULES[:1], path)
+        router = FoundryRouter.from_rules_file(path)
+        assert router.classify_intent("weather")[0] == IntentCategory.UNKNOWN
+        assert router.classify_intent("inventory")[0] == IntentCategory.INVENTORY_QUERY
+
+    def _rewrite(self, path, rules):
+        dump_rules_file(rules, path)
+        # Make sure the mtime moves even on coarse-grained filesystems
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def test_watcher_check_reloads_on_change(self, tmp_path):
+        path = tmp_path / "rules.json"
+        dump_rules_file(ROUTING_RULES, path)
+        router = FoundryRouter()
+        watcher = RulesFileWatcher(router, path)
+        assert watcher.check() is True
+        assert watcher.check() is False
+
+        self._rewrite(path, [
+            RoutingRule(IntentCategory.MEETING_BOOKING, "copilot-agent", ["inventory"], "x"),
+        ])
+        assert watcher.check() is True
+        assert watcher.reloads == 2
+        assert router.classify_intent("inventory")[0] == IntentCategory.MEETING_BOOKING
+
+    def test_watcher_keeps_rules_on_invalid_file(self, tmp_path):
+        path = tmp_path / "rules.json"
+        dump_rules_file(ROUTING_RULES, path)
+        router = FoundryRouter()
+        watcher = RulesFileWatcher(router, path)
+        watcher.check()
+
+        path.write_text("{not json", encoding="utf-8")
+        os.utime(path, ns=(0, 1))
+        assert watcher.check() is False
+        assert isinstance(watcher.last_error, RoutingRulesError)
+        assert router.classify_intent("inventory")[0] == IntentCategory.INVENTORY_QUERY
+
+    def test_background_watcher(self, tmp_path):
+        path = tmp_path / "rules.json"
+        dump_rules_file(ROUTING_RULES, path)
+        router = FoundryRouter()
+        watcher = router.watch_rules(path, interval=0.01)
+        try:
+            self._rewrite(path, [
+                RoutingRule(IntentCategory.MEETING_BOOKING, "copilot-agent", ["inventory"], "x"),
+            ])
+            deadline = time.monotonic() + 5
+            while watcher.reloads < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            watcher.stop()
+        assert router.classify_intent("inventory")[0] == IntentCategory.MEETING_BOOKING
+
+
+class _CaseSensitiveClassifier:
+    """Backend that only recognises the upper-case region code "US"."""
+
+    def classify(self, user_input):
+        if "US" in user_input:
+            return IntentCategory.INVENTORY_QUERY, 0.9
+        return IntentCategory.UNKNOWN, 0.0
+
+
+class _StubClassifier:
+    """Secondary classifier returning a fixed intent after an optional delay."""
+
+    def __init__(self, intent, delay=0.0):
+        self.intent = intent
+        self.delay = delay
+
+    def classify(self, user_input):
+        time.sleep(self.delay)
+        return self.intent, 0.9
+
+
+class _FailingClassifier:
+    def classify(self, user_input):
+        raise RuntimeError("model unavailable")
+
+
+class TestRouteAsync:
+    """Async routing with a shadow-mode secondary classifier."""
+
+    @pytest.mark.asyncio
+    async def test_without_secondary_matches_route(self, router):
+        assert await router.route_async("check inventory stock") == router.route("check inventory stock")
+
+    @pytest.mark.asyncio
+    async def test_shadow_returns_primary_and_logs_disagreement(self):
+        router = FoundryRouter(secondary=_StubClassifier(IntentCategory.MEETING_BOOKING))
+        agent, intent, _ = await router.route_async("check inventory stock", timeout=1.0)
+        assert intent == IntentCategory.INVENTORY_QUERY
+        assert agent.name == "inventory-agent"
+        assert len(router.disagreements) == 1
+        d = router.disagreements[0]
+        assert d.secondary_intent == IntentCategory.MEETING_BOOKING
+        assert d.within_budget
+
+    @pytest.mark.asyncio
+    async def test_agreement_not_logged(self):
+        router = FoundryRouter(secondary=_StubClassifier(IntentCategory.INVENTORY_QUERY))
+        await router.route_async("check inventory stock", timeout=1.0)
+        assert len(router.disagreements) == 0
+
+    @pytest.mark.asyncio
+    async def test_non_shadow_uses_secondary_within_budget(self):
+        router = FoundryRouter(
+            secondary=_StubClassifier(IntentCategory.MEETING_BOOKING), shadow=False,
+        )
+        agent, intent, confidence = await router.route_async("check inventory stock", timeout=1.0)
+        assert intent == IntentCategory.MEETING_BOOKING
+        assert agent.name == "copilot-agent"
+        assert confidence == 0.9
+
+    @pytest.mark.asyncio
+    async def test_slow_secondary_falls_back_to_primary(self):
+        router = FoundryRouter(
+            secondary=_StubClassifier(IntentCategory.MEETING_BOOKING, delay=0.2), shadow=False,
+        )
+        started = time.perf_counter()
+        _, intent, _ = await router.route_async("check inventory stock", timeout=0.01)
+        assert time.perf_counter() - started < 0.15
+        assert intent == IntentCategory.INVENTORY_QUERY
+        assert router.secondary_timeouts == 1
+
+        # The late result is still recorded once it arrives
+        await asyncio.sleep(0.4)
+        assert len(router.disagreements) == 1
+        assert router.disagreements[0].within_budget is False
+
+    @pytest.mark.asyncio
+    async def test_failing_secondary_is_ignored(self):
+        router = FoundryRouter(secondary=_FailingClassifier(), shadow=False)
+        _, intent, _ = await router.route_async("check inventory stock", timeout=1.0)
+        assert intent == IntentCategory.INVENTORY_QUERY
+        assert len(router.disagreements) == 0
+
+    @pytest.mark.asyncio
+    async def test_dump_disagreements(self, tmp_path):
+        router = FoundryRouter(secondary=_StubClassifier(IntentCategory.BUG_FIX))
+        await router.route_async("weather today", timeout=1.0)
+        path = tmp_path / "disagreements.jsonl"
+        assert router.dump_disagreements(path) == 1
+        record = json.loads(path.read_text(encoding="utf-8"))
+        assert record["primary"] == "external_search"
+        assert record["secondary"] == "bug_fix"
+        assert len(router.disagreements) == 0
+
+
 class TestChineseKeywords:
     """Verify Chinese keywords are correctly classified."""
 
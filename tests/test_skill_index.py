@@ -0,0 +1,68 @@
+"""Tests for src/skill_index.py — local trigger pre-matching."""
+
+import pytest
+
+from src.skill_index import SkillIndex
+from src.skills import Skill
+
+
+@pytest.fixture
+def index(all_skills):
+    return SkillIndex(all_skills)
+
+
+class TestSkillIndex:
+    def test_indexes_every_trigger(self, index, all_skills):
+        assert len(index) == sum(len(s.triggers) for s in all_skills)
+
+    @pytest.mark.parametrize("query, expected", [
+        ("check inventory status for Tokyo", "fabric-inventory-query"),
+        ("Schedule a meeting with Almond", "workiq-meeting-booking"),
+        ("please fix a bug in the sync job", "github-bugfix-agent"),
+        ("what's the weather forecast in New York", "bing-weather-search"),
+        ("FAQ?", "sharepoint-km-query"),
+    ])
+    def test_unique_match(self, index, query, expected):
+        assert index.unique_match(query).name == expected
+
+    def test_no_match(self, index):
+        assert index.match_skills("hello there") == []
+        assert index.unique_match("hello there") is None
+
+    def test_full_coverage_required_by_default(self, index):
+        # "inventory" alone covers only half of "Check inventory"
+        assert all(m.score == 1.0 for m in index.match_skills("inventory"))
+
+    def test_partial_coverage_ranked(self, index):
+        matches = index.match_skills("inventory", min_coverage=0.3)
+        assert matches[0].skill.name == "fabric-inventory-query"
+        assert 0.3 <= matches[0].score < 1.0
+        assert [m.score for m in matches] == sorted((m.score for m in matches), reverse=True)
+
+    def test_ambiguous_query_has_no_unique_match(self, index):
+        query = "check inventory and schedule a meeting"
+        assert {m.skill.name for m in index.match_skills(query)} == {
+            "fabric-inventory-query", "workiq-meeting-booking",
+        }
+        assert index.unique_match(query) is None
+
+    def test_matched_triggers_reported(self, index):
+        match = index.match_skills("check service status")[0]
+        assert match.skill.name == "azure-system-health"
+        assert match.triggers == ("Check service status",)
+
+    def test_exact_match_ignores_case_and_punctuation(self, index, all_skills):
+        for skill in all_skills:
+            assert index.exact_match(skill.triggers[0].upper() + "!") is skill
+        assert index.exact_match("check inventory in Tokyo") is None
+
+    def test_cjk_triggers(self):
+        index = SkillIndex([Skill(name="inv", description="", triggers=["查詢庫存"])])
+        assert index.unique_match("幫我查詢一下東京庫存").name == "inv"
+        assert index.unique_match("庫存") is None
+        assert index.match_skills("查詢天氣") == []
+
+    def test_stopword_only_trigger_ignored(self):
+        index = SkillIndex([Skill(name="x", description="", triggers=["the", "Track"])])
+        assert len(index) == 1
+        assert index.unique_match("the") is None
@@ -0,0 +1,136 @@
+"""Tests for src/skill_watcher.py — incremental skill / tool reloads."""
+
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+from src.skill_watcher import SkillDirectoryWatcher
+
+
+def _fake_tool(skill):
+    # Stand-in for src.tools.build_tool; None mimics a live-MCP skill
+    if skill.name == "workiq-meeting-booking":
+        return None
+    return {"name": skill.name, "triggers": tuple(skill.triggers)}
+
+
+def _touch(path, seconds=5):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def watcher(skills_copy):
+    w = SkillDirectoryWatcher(skills_copy, tool_factory=_fake_tool)
+    w.check()
+    return w
+
+
+class TestSkillDirectoryWatcher:
+    def test_initial_load(self, watcher):
+        assert len(watcher.skills) == 8
+        assert len(watcher.tools) == 7
+        assert watcher.version == 1
+
+    def test_no_change(self, watcher):
+        assert not watcher.check()
+        assert watcher.version == 1
+
+    def test_edit_rebuilds_only_that_tool(self, watcher, skills_copy):
+        before = watcher.tools
+        skill_file = skills_copy / "demo2-sharepoint-km" / "SKILL.md"
+        skill_file.write_text(
+            skill_file.read_text(encoding="utf-8").replace("- FAQ", "- FAQ\n- Runbook"),
+            encoding="utf-8",
+        )
+        changes = watcher.check()
+        assert changes.modified == ("demo2-sharepoint-km",)
+        assert watcher.version == 2
+        after = watcher.tools
+        assert "Runbook" in after[1]["triggers"]
+        assert [a is b for a, b in zip(before, after)] == [True, False] + [True] * 5
+
+    def test_added_skill(self, watcher, skills_copy):
+        folder = skills_copy / "demo9-new-skill"
+        folder.mkdir()
+        (folder / "SKILL.md").write_text(
+            "---\nname: new-skill\ndescription: New\n---\n## Triggers\n- brand new\n",
+            encoding="utf-8",
+        )
+        assert watcher.check().added == ("demo9-new-skill",)
+        assert watcher.skills[-1].name == "new-skill"
+        assert watcher.tools[-1]["name"] == "new-skill"
+
+    def test_removed_skill(self, watcher, skills_copy):
+        shutil.rmtree(skills_copy / "demo3-github-bugfix")
+        assert watcher.check().removed == ("demo3-github-bugfix",)
+        assert "github-bugfix-agent" not in [s.name for s in watcher.skills]
+        assert len(watcher.tools) == 6
+
+    def test_broken_edit_keeps_previous_version(self, watcher, skills_copy, capsys):
+        skill_file = skills_copy / "demo4-bing-weather" / "SKILL.md"
+        skill_file.write_text("---\nname: [broken\n---\n", encoding="utf-8")
+        changes = watcher.check()
+        assert not changes and len(changes.errors) == 1
+        assert watcher.version == 1
+        assert watcher.skills[3].name == "bing-weather-search"
+        assert "keeping previous version" in capsys.readouterr().out
+        # Reported once, not on every poll
+        assert watcher.check().errors == ()
+
+    def test_touch_without_edit_reparses(self, watcher, skills_copy):
+        _touch(skills_copy / "demo1-fabric-inventory" / "SKILL.md")
+        assert watcher.check().modified == ("demo1-fabric-inventory",)
+
+    def test_snapshot_matches_attributes(self, watcher):
+        version, skills, tools = watcher.snapshot()
+        assert version == watcher.version
+        assert [s.name for s in skills] == [s.name for s in watcher.skills]
+        assert tools == watcher.tools
+
+    def test_snapshot_waits_for_reload_in_progress(self, skills_copy):
+        building, release = threading.Event(), threading.Event()
+        w = SkillDirectoryWatcher(skills_copy, tool_factory=_fake_tool)
+        w.check()
+
+        def slow_tool(skill):
+            building.set()
+            release.wait(5)
+            return _fake_tool(skill)
+
+        w.tool_factory = slow_tool
+        _touch(skills_copy / "demo5-logistics" / "SKILL.md")
+        reload = threading.Thread(target=w.check)
+        reload.start()
+        assert building.wait(5)
+        result = []
+        reader = threading.Thread(target=lambda: result.append(w.snapshot()))
+        reader.start()
+        reader.join(0.1)
+        assert reader.is_alive()  # blocked until the reload is published
+        release.set()
+        reload.join()
+        reader.join()
+        version, skills, tools = result[0]
+        assert version == 2 and len(skills) == 8 and len(tools) == 7
+
+    def test_lazy_watcher(self, skills_copy):
+        w = SkillDirectoryWatcher(skills_copy, lazy=True, tool_factory=_fake_tool)
+        w.check()
+        assert not any(s.response_loaded for s in w.skills)
+
+    def test_background_thread(self, skills_copy):
+        w = SkillDirectoryWatcher(skills_copy, interval=0.01, tool_factory=_fake_tool).start()
+        try:
+            shutil.rmtree(skills_copy / "demo5-logistics")
+            for _ in range(500):
+                if w.version == 2:
+                    break
+                time.sleep(0.01)
+            assert w.version == 2
+            assert len(w.skills) == 7
+        finally:
+            w.stop()
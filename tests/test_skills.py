@@ -1,14 +1,23 @@
 """Tests for src/skills.py — SKILL.md loader and parser."""
 
+import os
+import pickle
+import shutil
+
 import pytest
 from pathlib import Path
 
+from src.exceptions import SkillLoadError
+from src.skill_cache import CACHE_FILENAME, SkillCache
 from src.skills import (
     Skill,
     _parse_frontmatter,
     _extract_triggers,
     _extract_response,
+    _parse_skill,
     load_skills,
+    load_skills_report,
+    parse_skill_markdown,
 )
 
 
@@ -85,6 +94,62 @@ class TestExtractResponse:
         assert response == ""
 
 
+class TestParseSkillMarkdown:
+    DOC = (
+        "```skill\n---\nname: demo\ndescription: A demo\n---\n\n# Demo\n\n"
+        "## Triggers\n\n- first\n- second\n\n"
+        "## Default Response\n\nIntro\n\n---\n\nBody line\n\n"
+        "## Tools Used\n\n- tool\n```\n"
+    )
+
+    def test_single_pass_extracts_everything(self):
+        parsed = parse_skill_markdown(self.DOC)
+        assert parsed.frontmatter == {"name": "demo", "description": "A demo"}
+        assert parsed.triggers == ["first", "second"]
+        assert parsed.response == "Body line"
+
+    def test_response_span_points_into_content(self):
+        parsed = parse_skill_markdown(self.DOC)
+        start, end = parsed.response_span
+        assert self.DOC[start:end].strip() == parsed.response
+
+    def test_closing_fence_excluded(self):
+        content = "```skill\n## Default Response\n\n---\n\nTail body\n```\n\n"
+        assert parse_skill_markdown(content).response == "Tail body"
+
+    def test_response_without_rule_uses_whole_section(self):
+        content = "## Default Response\n\nNo rule here\n\n## Data Sources\n\n- db"
+        assert parse_skill_markdown(content).response == "No rule here"
+
+    def test_unterminated_frontmatter_ignored(self):
+        content = "---\nname: broken\n## Triggers\n- still found\n"
+        parsed = parse_skill_markdown(content)
+        assert parsed.frontmatter == {}
+        assert parsed.triggers == ["still found"]
+
+    def test_invalid_yaml_frontmatter(self):
+        assert parse_skill_markdown("---\nname: [unclosed\n---\nBody").frontmatter == {}
+
+    def test_crlf_line_endings(self):
+        parsed = parse_skill_markdown(self.DOC.replace("\n", "\r\n"))
+        assert parsed.triggers == ["first", "second"]
+        assert parsed.response == "Body line"
+
+    def test_large_document(self):
+        body = "| row | 庫存 | 1,200 |\n" * 50_000
+        content = self.DOC.replace("Body line\n", body)
+        parsed = parse_skill_markdown(content)
+        assert parsed.response == body.strip()
+        assert parsed.triggers == ["first", "second"]
+
+    def test_matches_regex_pipeline_on_real_skills(self, skills_dir):
+        from benchmarks.skill_parser_benchmark import legacy_parse, single_pass_parse
+
+        for skill_file in sorted(skills_dir.glob("*/SKILL.md")):
+            content = skill_file.read_text(encoding="utf-8")
+            assert single_pass_parse(content) == legacy_parse(content), skill_file.parent.name
+
+
 class TestLoadSkills:
     def test_load_all_8_skills(self, skills_dir):
         if not skills_dir.exists():
@@ -165,3 +230,159 @@ class TestLoadSkills:
             "workiq-meeting-booking",
         }
         assert names == expected_names, f"Unexpected skill names: {names - expected_names}"
+
+
+class TestSkillCache:
+    def _load_with_stats(self, skills_dir, cache_dir):
+        cache = SkillCache(cache_dir)
+        for folder in sorted(skills_dir.iterdir()):
+            cache.load(folder / "SKILL.md", lambda content, f=folder: _parse_skill(f, content))
+        cache.save()
+        return cache
+
+    def test_cached_load_matches_uncached(self, skills_copy, tmp_path):
+        uncached = load_skills(skills_copy)
+        first = load_skills(skills_copy, cache_dir=tmp_path / "cache")
+        second = load_skills(skills_copy, cache_dir=tmp_path / "cache")
+        assert first == uncached
+        assert second == uncached
+        assert (tmp_path / "cache" / CACHE_FILENAME).exists()
+
+    def test_unchanged_files_are_hits(self, skills_copy, tmp_path):
+        cold = self._load_with_stats(skills_copy, tmp_path / "cache")
+        assert (cold.hits, cold.misses) == (0, 8)
+        warm = self._load_with_stats(skills_copy, tmp_path / "cache")
+        assert (warm.hits, warm.misses) == (8, 0)
+
+    def test_only_changed_file_reparsed(self, skills_copy, tmp_path):
+        load_skills(skills_copy, cache_dir=tmp_path / "cache")
+        skill_file = skills_copy / "demo2-sharepoint-km" / "SKILL.md"
+        skill_file.write_text(
+            skill_file.read_text(encoding="utf-8").replace("- FAQ", "- FAQ\n- Runbook"),
+            encoding="utf-8",
+        )
+        cache = self._load_with_stats(skills_copy, tmp_path / "cache")
+        assert (cache.hits, cache.misses) == (7, 1)
+        skills = load_skills(skills_copy, cache_dir=tmp_path / "cache")
+        assert "Runbook" in skills[1].triggers
+
+    def test_touched_but_identical_file_is_hit(self, skills_copy, tmp_path):
+        self._load_with_stats(skills_copy, tmp_path / "cache")
+        skill_file = skills_copy / "demo1-fabric-inventory" / "SKILL.md"
+        st = skill_file.stat()
+        os.utime(skill_file, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        cache = self._load_with_stats(skills_copy, tmp_path / "cache")
+        assert (cache.hits, cache.misses) == (8, 0)
+
+    def test_corrupt_cache_ignored(self, skills_copy, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / CACHE_FILENAME).write_bytes(b"not a pickle")
+        skills = load_skills(skills_copy, cache_dir=cache_dir)
+        assert len(skills) == 8
+
+    def test_removed_skill_dropped(self, skills_copy, tmp_path):
+        load_skills(skills_copy, cache_dir=tmp_path / "cache")
+        shutil.rmtree(skills_copy / "demo8-meeting-booking")
+        skills = load_skills(skills_copy, cache_dir=tmp_path / "cache")
+        assert len(skills) == 7
+        cache = SkillCache(tmp_path / "cache")
+        assert len(cache._entries) == 7
+
+
+class TestParallelLoading:
+    def test_threaded_load_keeps_folder_order(self, skills_copy):
+        sequential = load_skills(skills_copy)
+        threaded = load_skills(skills_copy, workers=8)
+        assert threaded == sequential
+
+    def test_process_pool_parsing(self, skills_copy, tmp_path):
+        report = load_skills_report(skills_copy, cache_dir=tmp_path / "cache", workers=2, use_processes=True)
+        assert report.skills == load_skills(skills_copy)
+        assert report.errors == []
+
+    def test_per_skill_timings(self, skills_copy):
+        report = load_skills_report(skills_copy, workers=4)
+        assert set(report.timings) == {p.name for p in skills_copy.iterdir()}
+        assert all(t >= 0 for t in report.timings.values())
+        assert report.elapsed > 0
+
+    def test_invalid_frontmatter_collected(self, skills_copy):
+        bad = skills_copy / "demo3-github-bugfix" / "SKILL.md"
+        bad.write_text("---\nname: [unclosed\n---\n\n## Triggers\n- x\n", encoding="utf-8")
+        report = load_skills_report(skills_copy, workers=4)
+        assert len(report.skills) == 7
+        assert len(report.errors) == 1
+        error = report.errors[0]
+        assert isinstance(error, SkillLoadError)
+        assert error.skill_path.endswith("SKILL.md")
+        assert "invalid YAML" in error.reason
+        assert [s.demo_id for s in report.skills] == [1, 2, 4, 5, 6, 7, 8]
+
+    def test_undecodable_file_collected(self, skills_copy):
+        (skills_copy / "demo5-logistics" / "SKILL.md").write_bytes(b"\xff\xfe\x00broken")
+        report = load_skills_report(skills_copy)
+        assert [e.skill_path.split(os.sep)[-2] for e in report.errors] == ["demo5-logistics"]
+
+    def test_load_skills_skips_failures(self, skills_copy, capsys):
+        (skills_copy / "demo1-fabric-inventory" / "SKILL.md").write_text("---\n- a list\n---\n", encoding="utf-8")
+        skills = load_skills(skills_copy, workers=4)
+        assert len(skills) == 7
+        assert "frontmatter must be a mapping" in capsys.readouterr().out
+
+    def test_folders_without_skill_file_ignored(self, skills_copy):
+        (skills_copy / "notes").mkdir()
+        report = load_skills_report(skills_copy, workers=4)
+        assert "notes" not in report.timings
+        assert len(report.skills) == 8
+
+    def test_skill_load_error_pickles(self):
+        error = pickle.loads(pickle.dumps(SkillLoadError("a/SKILL.md", "bad")))
+        assert (error.skill_path, error.reason) == ("a/SKILL.md", "bad")
+
+
+class TestLazyResponses:
+    def test_bodies_not_loaded_up_front(self, skills_copy):
+        skills = load_skills(skills_copy, lazy=True)
+        assert len(skills) == 8
+        assert not any(s.response_loaded for s in skills)
+        assert all(s.triggers for s in skills)
+
+    def test_loaded_bodies_match_eager(self, skills_copy):
+        eager = load_skills(skills_copy)
+        lazy = load_skills(skills_copy, lazy=True)
+        for skill in lazy:
+            skill.load_response()
+        assert lazy == eager
+
+    def test_offset_is_in_bytes(self, skills_copy):
+        # demo1 has CJK text before the heading, so char and byte offsets differ
+        skill = load_skills(skills_copy, lazy=True)[0]
+        raw = (skills_copy / "demo1-fabric-inventory" / "SKILL.md").read_bytes()
+        assert raw[:skill.response_ref.offset].rstrip().endswith(b"## Default Response")
+
+    def test_cached_and_process_pool_lazy_loads(self, skills_copy, tmp_path):
+        eager = load_skills(skills_copy)
+        for _ in range(2):
+            lazy = load_skills(skills_copy, cache_dir=tmp_path / "cache", lazy=True,
+                               workers=2, use_processes=True)
+            assert [s.load_response() for s in lazy] == [s.response_content for s in eager]
+
+    def test_edit_after_scan_falls_back_to_full_parse(self, skills_copy):
+        skill = load_skills(skills_copy, lazy=True)[0]
+        skill_file = skills_copy / "demo1-fabric-inventory" / "SKILL.md"
+        content = skill_file.read_text(encoding="utf-8")
+        skill_file.write_text("<!-- new header line -->\n" + content, encoding="utf-8")
+        assert skill.load_response() == parse_skill_markdown(content).response
+
+    def test_deleted_file_gives_empty_response(self, skills_copy):
+        skill = load_skills(skills_copy, lazy=True)[0]
+        (skills_copy / "demo1-fabric-inventory" / "SKILL.md").unlink()
+        assert skill.load_response() == ""
+
+    def test_skill_without_response_section(self, tmp_path):
+        folder = tmp_path / "skills" / "demo9-empty"
+        folder.mkdir(parents=True)
+        (folder / "SKILL.md").write_text("---\nname: empty\n---\n## Triggers\n- hi\n", encoding="utf-8")
+        skill = load_skills(tmp_path / "skills", lazy=True)[0]
+        assert skill.response_loaded and skill.load_response() == ""
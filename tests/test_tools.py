@@ -8,7 +8,9 @@ from src.tools import (
     LIVE_MCP_SKILLS,
     _find_agent_for_skill,
     _make_handler,
+    build_tool,
     build_tools,
+    prewarm_skill,
 )
 
 
@@ -70,6 +72,12 @@ class TestBuildTools:
                 f"Live MCP skill '{live_name}' should be skipped"
             )
 
+    def test_build_tool_single_skill(self, all_skills, all_tools):
+        tool = build_tool(all_skills[0])
+        assert (tool.name, tool.description) == (all_tools[0].name, all_tools[0].description)
+        live = next(s for s in all_skills if s.name in LIVE_MCP_SKILLS)
+        assert build_tool(live) is None
+
     def test_tool_has_name(self, all_tools):
         for tool in all_tools:
             assert tool.name and len(tool.name) > 0
@@ -106,6 +114,38 @@ class TestMakeHandler:
         assert result["resultType"] == "success"
         assert result["textResultForLlm"] == "Sample response"
 
+    def test_prewarm_loads_lazy_response(self, skills_dir):
+        skills = load_skills(skills_dir, lazy=True)
+        prewarm_skill(skills[0])
+        assert skills[0].response_loaded
+        live = next(s for s in skills if s.name in LIVE_MCP_SKILLS)
+        prewarm_skill(live)
+        assert not live.response_loaded
+
+    def test_prewarm_inventory_skips_full_report(self, skills_dir, monkeypatch):
+        import src.inventory_data as inventory_data
+
+        def fail(*args, **kwargs):
+            raise AssertionError("full report rendered during prewarm")
+
+        monkeypatch.setattr(inventory_data, "_render_report", fail)
+        inventory_data.invalidate_inventory_report_cache()
+        skill = next(s for s in load_skills(skills_dir, lazy=True) if s.name == "fabric-inventory-query")
+        prewarm_skill(skill)
+        before = inventory_data.inventory_report_cache_stats()
+        assert "大阪" in inventory_data.generate_inventory_answer("Osaka")
+        after = inventory_data.inventory_report_cache_stats()
+        assert after.misses == before.misses and after.hits == before.hits + 1
+
+    @pytest.mark.asyncio
+    async def test_lazy_response_loaded_on_first_call(self, skills_dir):
+        skill = next(s for s in load_skills(skills_dir, lazy=True) if s.demo_id == 2)
+        assert not skill.response_loaded
+        handler = _make_handler(skill)
+        result = await handler({"query": "sync issue"})
+        assert skill.response_loaded
+        assert result["textResultForLlm"] == skill.response_content != ""
+
     @pytest.mark.asyncio
     async def test_live_mcp_handler_returns_redirect(self):
         skill = Skill(
@@ -120,3 +160,18 @@ class TestMakeHandler:
         assert "MUST use" in result["textResultForLlm"]
         assert "workiq" in result["textResultForLlm"]
         assert "live" in result.get("sessionLog", "").lower() or "MCP" in result.get("sessionLog", "")
+
+    @pytest.mark.asyncio
+    async def test_inventory_handler_scoped_to_query(self):
+        skill = Skill(
+            name="fabric-inventory-query",
+            description="Inventory",
+            response_content="Static fallback",
+            demo_id=1,
+        )
+        handler = _make_handler(skill)
+        scoped = (await handler({"query": "how many boxes in Osaka?"}))["textResultForLlm"]
+        full = (await handler({"query": "check inventory"}))["textResultForLlm"]
+        assert "大阪" in scoped and "東京" not in scoped
+        assert "Global Summary" in full
+        assert len(scoped) < len(full)